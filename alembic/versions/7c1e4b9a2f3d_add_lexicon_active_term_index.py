@@ -0,0 +1,34 @@
+"""add_lexicon_active_term_index
+
+Revision ID: 7c1e4b9a2f3d
+Revises: ad899023acc6
+Create Date: 2026-10-17 09:12:40.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9a2f3d'
+down_revision: Union[str, None] = 'ad899023acc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial covering index for active-term listing and export ordered by term
+    op.create_index(
+        'ix_lexicon_active_term',
+        'lexicon_terms',
+        ['lexicon_id', 'term'],
+        postgresql_where=sa.text('is_active'),
+        postgresql_include=['id', 'normalized_term', 'replacement', 'updated_at']
+    )
+
+
+def downgrade() -> None:
+    # Remove partial covering index
+    op.drop_index('ix_lexicon_active_term', table_name='lexicon_terms')
@@ -0,0 +1,39 @@
+"""add_lexicon_summary_view
+
+Revision ID: b3f8d2c61e07
+Revises: 7c1e4b9a2f3d
+Create Date: 2026-10-17 11:03:27.845117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d2c61e07'
+down_revision: Union[str, None] = '7c1e4b9a2f3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Precomputed per-lexicon term counts, refreshed by the application on write
+    op.execute("""
+        CREATE MATERIALIZED VIEW lexicon_summary AS
+        SELECT lexicon_id,
+               COUNT(*) AS term_count,
+               MAX(updated_at) AS last_updated
+        FROM lexicon_terms
+        WHERE is_active
+        GROUP BY lexicon_id
+    """)
+
+    # Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('uq_lexicon_summary_lexicon_id', 'lexicon_summary', ['lexicon_id'], unique=True)
+
+
+def downgrade() -> None:
+    # Remove lexicon summary view (drops its index too)
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS lexicon_summary")
@@ -0,0 +1,50 @@
+"""add_numeral_strategy_to_lexicon_summary
+
+Revision ID: c2a7e9d4f815
+Revises: f6d3b8a41c92
+Create Date: 2026-10-17 18:42:10.316582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a7e9d4f815'
+down_revision: Union[str, None] = 'f6d3b8a41c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_summary_view(with_numeral_strategy: bool) -> None:
+    numeral_strategy = (
+        ",\n               MIN(metadata->>'numeral_strategy') AS numeral_strategy"
+        if with_numeral_strategy else ""
+    )
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW lexicon_summary AS
+        SELECT lexicon_id,
+               COUNT(*) AS term_count,
+               MAX(updated_at) AS last_updated{numeral_strategy}
+        FROM lexicon_terms
+        WHERE is_active
+        GROUP BY lexicon_id
+    """)
+
+    # Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('uq_lexicon_summary_lexicon_id', 'lexicon_summary', ['lexicon_id'], unique=True)
+
+
+def upgrade() -> None:
+    # Precompute each lexicon's numeral strategy override alongside its
+    # term count, so it's read per lexicon instead of from a term row
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS lexicon_summary")
+    _create_summary_view(with_numeral_strategy=True)
+
+
+def downgrade() -> None:
+    # Restore the summary view without the numeral strategy column
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS lexicon_summary")
+    _create_summary_view(with_numeral_strategy=False)
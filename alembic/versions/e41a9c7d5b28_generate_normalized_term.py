@@ -0,0 +1,68 @@
+"""generate_normalized_term
+
+Revision ID: e41a9c7d5b28
+Revises: b3f8d2c61e07
+Create Date: 2026-10-17 13:41:09.552630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41a9c7d5b28'
+down_revision: Union[str, None] = 'b3f8d2c61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_normalized_term_indexes() -> None:
+    op.create_index('ix_lexicon_terms_normalized_term', 'lexicon_terms', ['normalized_term'])
+    op.create_unique_constraint(
+        'uq_lexicon_terms_lexicon_normalized',
+        'lexicon_terms',
+        ['lexicon_id', 'normalized_term']
+    )
+    op.create_index(
+        'ix_lexicon_active_term',
+        'lexicon_terms',
+        ['lexicon_id', 'term'],
+        postgresql_where=sa.text('is_active'),
+        postgresql_include=['id', 'normalized_term', 'replacement', 'updated_at']
+    )
+
+
+def upgrade() -> None:
+    # Replace the application-maintained normalized_term with a stored
+    # generated column. Dropping the column also drops its indexes.
+    op.drop_column('lexicon_terms', 'normalized_term')
+    op.add_column(
+        'lexicon_terms',
+        sa.Column(
+            'normalized_term',
+            sa.String(length=255),
+            sa.Computed('lower(trim(term))', persisted=True),
+            nullable=False,
+            comment='Normalized/lowercased version for case-insensitive matching'
+        )
+    )
+    _create_normalized_term_indexes()
+
+
+def downgrade() -> None:
+    # Restore normalized_term as a plain column populated from term
+    op.drop_column('lexicon_terms', 'normalized_term')
+    op.add_column(
+        'lexicon_terms',
+        sa.Column(
+            'normalized_term',
+            sa.String(length=255),
+            nullable=True,
+            comment='Normalized/lowercased version for case-insensitive matching'
+        )
+    )
+    op.execute("UPDATE lexicon_terms SET normalized_term = lower(trim(term))")
+    op.alter_column('lexicon_terms', 'normalized_term', nullable=False)
+    _create_normalized_term_indexes()
@@ -0,0 +1,42 @@
+"""partial_unique_normalized_term
+
+Revision ID: f6d3b8a41c92
+Revises: e41a9c7d5b28
+Create Date: 2026-10-17 16:05:27.813944
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d3b8a41c92'
+down_revision: Union[str, None] = 'e41a9c7d5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Enforce uniqueness among active terms only, so a soft-deleted term
+    # can be added again
+    op.create_index(
+        'uq_lexicon_terms_active_normalized',
+        'lexicon_terms',
+        ['lexicon_id', 'normalized_term'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+        sqlite_where=sa.text('is_active')
+    )
+    op.drop_constraint('uq_lexicon_terms_lexicon_normalized', 'lexicon_terms', type_='unique')
+
+
+def downgrade() -> None:
+    # Fails if an inactive term duplicates another term in its lexicon
+    op.create_unique_constraint(
+        'uq_lexicon_terms_lexicon_normalized',
+        'lexicon_terms',
+        ['lexicon_id', 'normalized_term']
+    )
+    op.drop_index('uq_lexicon_terms_active_normalized', table_name='lexicon_terms')
@@ -17,7 +17,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.database import get_db
-from app.services.api_key_service import create_api_key, APIKeyError, APIKeyValidationError
+from app.services.api_key_service import (
+    create_api_key,
+    invalidate_cached_api_key,
+    APIKeyError,
+    APIKeyValidationError,
+)
 from app.models.api_key import ApiKey
 from app.dependencies.auth import verify_admin_key
 
@@ -471,7 +476,7 @@ async def update_api_key(
         )
 
         # Get the API key
-        api_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        api_key = db.get(ApiKey, key_id)
 
         if not api_key:
             logger.warning(f"Admin action: API key {key_id} not found for update")
@@ -505,7 +510,9 @@ async def update_api_key(
 
         # Commit changes
         db.commit()
-        db.refresh(api_key)
+
+        # Cached validations hold the previous values
+        invalidate_cached_api_key(key_id)
 
         logger.info(
             f"Admin action: API key {key_id} updated successfully",
@@ -582,7 +589,7 @@ async def delete_api_key(
         )
 
         # Get the API key
-        api_key = db.query(ApiKey).filter(ApiKey.id == key_id).first()
+        api_key = db.get(ApiKey, key_id)
 
         if not api_key:
             logger.warning(f"Admin action: API key {key_id} not found for deletion")
@@ -598,6 +605,8 @@ async def delete_api_key(
         # Commit changes
         db.commit()
 
+        invalidate_cached_api_key(key_id)
+
         logger.info(
             f"Admin action: API key {key_id} deactivated successfully",
             extra={"key_id": key_id, "project_name": api_key.project_name}
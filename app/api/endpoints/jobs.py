@@ -2,12 +2,12 @@
 Job management endpoints for the transcription API.
 """
 from typing import Annotated
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from sqlalchemy.orm import Session
 
-from app.schemas.jobs import JobStatusResponse, JobStatus
+from app.api.responses import ORJSONResponse
+from app.schemas.jobs import JOB_STATUS_ADAPTER, JobStatusResponse, JobStatus
 from app.schemas.errors import ERROR_RESPONSES
 from app.models.job import Job
 from app.models import APIKey
@@ -148,8 +148,8 @@ async def get_job_status(
     if job.status == JobStatus.FAILED.value:
         error_message = job.error_message
 
-    return JobStatusResponse(
-        job_id=UUID(job.job_id),
+    response = JobStatusResponse(
+        job_id=job.job_id,
         status=job.status,
         created_at=job.created_at,
         completed_at=job.completed_at,
@@ -160,3 +160,6 @@ async def get_job_status(
         fuzzy_match_count=fuzzy_match_count,
         confidence_score=confidence_score
     )
+
+    # Serialize through the shared adapter and skip FastAPI's response_model pass
+    return ORJSONResponse(JOB_STATUS_ADAPTER.dump_python(response, mode="json"))
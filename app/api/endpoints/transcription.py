@@ -10,7 +10,8 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from sqlalchemy.orm import Session
 from rq import Queue
 
-from app.schemas.jobs import JobCreateResponse, JobStatus
+from app.api.responses import ORJSONResponse
+from app.schemas.jobs import JOB_CREATE_ADAPTER, JobCreateResponse, JobStatus
 from app.models.job import Job
 from app.database import get_db
 from app.config.settings import get_settings
@@ -133,7 +134,6 @@ async def create_transcription_job(
 
         db.add(job)
         db.commit()
-        db.refresh(job)
 
     except Exception as e:
         # Clean up audio file if database insert fails
@@ -164,8 +164,14 @@ async def create_transcription_job(
             detail=f"Job created but failed to queue for processing: {str(e)}"
         )
 
-    return JobCreateResponse(
+    # Built from server-generated values only, so skip validation and
+    # serialize through the shared adapter instead of response_model
+    response = JobCreateResponse.model_construct(
         job_id=job.job_id,
         status=JobStatus.PENDING,
         created_at=job.created_at
     )
+    return ORJSONResponse(
+        JOB_CREATE_ADAPTER.dump_python(response, mode="json"),
+        status_code=status.HTTP_201_CREATED
+    )
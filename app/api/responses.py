@@ -0,0 +1,23 @@
+"""
+Custom response classes for the API.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as FastAPIORJSONResponse
+
+
+class ORJSONResponse(FastAPIORJSONResponse):
+    """
+    FastAPI's orjson response, with timezone-aware UTC datetimes emitted
+    with a trailing "Z".
+
+    Used as the application's default response class so paginated list
+    responses (feedback, lexicon terms) are serialized in a single fast pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -48,7 +48,7 @@ async def get_api_key(
             detail="API key is required. Provide X-API-Key header."
         )
 
-    # Use bcrypt verification to validate the plaintext API key against stored hashes
+    # Hash and verify the plaintext API key against stored hashes
     api_key = validate_and_get_api_key(db, x_api_key)
 
     if not api_key:
@@ -19,14 +19,22 @@ class Settings(BaseSettings):
 
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_POOL_SIZE: int = 32
 
     # OpenAI API Configuration
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "whisper-1"
+    OPENAI_MAX_CONCURRENCY: int = 8  # Uploads in flight per transcribe_audio_batch
+    OPENAI_MAX_RETRIES: int = 3  # Retries of a transient Whisper failure
+    OPENAI_RETRY_MIN_DELAY: float = 1.0  # Seconds; backoff is randomized between these
+    OPENAI_RETRY_MAX_DELAY: float = 60.0
 
     # Admin Configuration
     ADMIN_API_KEY: str = ""
 
+    # Optional server-side secret mixed into API key hashes (HMAC-SHA256)
+    API_KEY_PEPPER: str = ""
+
     # Application Settings
     APP_NAME: str = "Speech-to-Text Transcription Service"
     DEBUG: bool = False
@@ -32,10 +32,14 @@ def get_db() -> Session:
     """
     Get database session.
 
+    The session lives for one request, so instances keep their loaded
+    values after commit instead of being expired and re-selected when the
+    handler builds its response.
+
     Yields:
         Session: Database session
     """
-    db = SessionLocal()
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -7,14 +7,18 @@ and securing protected endpoints.
 
 import logging
 from typing import Annotated, Optional
-from datetime import datetime
 
 from fastapi import Depends, HTTPException, Header, Query, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.api_key import ApiKey
-from app.services.api_key_service import verify_api_key
+from app.services.api_key_service import (
+    find_active_api_key,
+    hash_api_key,
+    is_legacy_hash,
+    record_api_key_usage,
+)
 from app.config.settings import get_settings
 
 # Configure logging
@@ -78,29 +82,8 @@ def get_current_api_key(
         )
 
     try:
-        # Query all active API keys
-        # Note: We query all active keys and verify hashes to prevent timing attacks
-        active_keys = db.query(ApiKey).filter(ApiKey.is_active == True).all()
-
-        if not active_keys:
-            logger.warning("Authentication failed: No active API keys in database")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid API key",
-                headers={"WWW-Authenticate": "ApiKey"}
-            )
-
-        # Verify against each active key
-        authenticated_key = None
-        for key_record in active_keys:
-            try:
-                if verify_api_key(plaintext_key, key_record.key_hash):
-                    authenticated_key = key_record
-                    break
-            except Exception as e:
-                # Log verification error but continue checking other keys
-                logger.error(f"Error verifying key {key_record.id}: {str(e)}")
-                continue
+        # Resolve the key with an indexed hash lookup
+        authenticated_key = find_active_api_key(db, plaintext_key)
 
         # No matching key found
         if not authenticated_key:
@@ -123,19 +106,22 @@ def get_current_api_key(
                 headers={"WWW-Authenticate": "ApiKey"}
             )
 
-        # Update last_used_at timestamp
-        try:
-            authenticated_key.last_used_at = datetime.utcnow()
-            db.commit()
-            db.refresh(authenticated_key)
-        except Exception as e:
-            # Don't fail authentication if timestamp update fails
-            # Just log the error and continue
-            logger.error(
-                f"Failed to update last_used_at for key {authenticated_key.id}: {str(e)}",
-                extra={"api_key_id": str(authenticated_key.id)}
-            )
-            db.rollback()
+        # Upgrade legacy bcrypt hashes now that the plaintext is known
+        if is_legacy_hash(authenticated_key.key_hash):
+            try:
+                authenticated_key.key_hash = hash_api_key(plaintext_key)
+                db.commit()
+            except Exception as e:
+                # Don't fail authentication if the rehash fails
+                # Just log the error and continue
+                logger.error(
+                    f"Failed to rehash key {authenticated_key.id}: {str(e)}",
+                    extra={"api_key_id": str(authenticated_key.id)}
+                )
+                db.rollback()
+
+        # Buffer last_used_at; written in bulk by the usage flush task
+        record_api_key_usage(authenticated_key.id)
 
         # Log successful authentication
         logger.info(
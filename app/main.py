@@ -15,9 +15,17 @@ from fastapi.openapi.utils import get_openapi
 from app.config.settings import get_settings
 from app.database import engine
 from app.services.storage import cleanup_old_audio_files, get_storage_stats
-from app.redis_client import redis_client
+from app.services.api_key_service import (
+    LAST_USED_FLUSH_INTERVAL_SECONDS,
+    flush_api_key_usage,
+    start_api_key_invalidation_listener,
+)
+from app.services.lexicon_service import start_lexicon_invalidation_listener
+from app.services.queue import close_redis_connection
+from app.redis_client import redis_binary_pool, redis_client, redis_pool
 from app.api import health, admin
-from app.api.endpoints import transcription, jobs
+from app.api.responses import ORJSONResponse
+from app.api.endpoints import transcription, jobs, feedback
 
 # Configure logging
 settings = get_settings()
@@ -61,31 +69,83 @@ async def cleanup_task():
             # Continue running even if one iteration fails
 
 
+# Background task for API key usage tracking
+async def api_key_usage_flush_task():
+    """Background task to periodically persist buffered API key last_used_at values."""
+    from app.database import get_db
+
+    logger.info("Starting API key usage flush task")
+
+    while True:
+        try:
+            await asyncio.sleep(LAST_USED_FLUSH_INTERVAL_SECONDS)
+
+            db = next(get_db())
+            try:
+                updated = flush_api_key_usage(db)
+                if updated:
+                    logger.debug(f"Flushed last_used_at for {updated} API keys")
+            finally:
+                db.close()
+
+        except asyncio.CancelledError:
+            logger.info("API key usage flush task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error in API key usage flush task: {e}", exc_info=True)
+            # Continue running even if one iteration fails
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
 
-    Starts the cleanup background task on startup and cancels it on shutdown.
+    Starts the cleanup and API key usage flush background tasks and the
+    lexicon and API key cache invalidation listeners on startup, and
+    stops them on shutdown.
     """
     # Startup
     logger.info("Starting application")
 
     # Start the cleanup background task
     cleanup_task_handle = asyncio.create_task(cleanup_task())
+    usage_flush_task_handle = asyncio.create_task(api_key_usage_flush_task())
+
+    # Keep this worker's in-process lexicon cache coherent with other workers
+    lexicon_listener_stop = start_lexicon_invalidation_listener()
+    # Evict keys revoked or updated through any worker
+    api_key_listener_stop = start_api_key_invalidation_listener()
 
     yield
 
     # Shutdown
     logger.info("Shutting down application")
     cleanup_task_handle.cancel()
+    usage_flush_task_handle.cancel()
+    lexicon_listener_stop.set()
+    api_key_listener_stop.set()
+    for handle in (cleanup_task_handle, usage_flush_task_handle):
+        try:
+            await handle
+        except asyncio.CancelledError:
+            pass
+
+    # Persist any last_used_at values still buffered
+    from app.database import get_db
+    db = next(get_db())
     try:
-        await cleanup_task_handle
-    except asyncio.CancelledError:
-        pass
+        flush_api_key_usage(db)
+    except Exception as e:
+        logger.error(f"Failed to flush API key usage on shutdown: {e}")
+    finally:
+        db.close()
 
-    # Close Redis connection
+    # Close Redis connections (the client doesn't own the shared pool)
     redis_client.close()
+    redis_pool.disconnect()
+    redis_binary_pool.disconnect()
+    close_redis_connection()
 
 
 # Create FastAPI application
@@ -127,6 +187,7 @@ When rate limited, you'll receive a 429 status code with retry information.
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     contact={
         "name": "API Support",
         "email": "support@transcription-service.example.com",
@@ -185,13 +246,8 @@ app.include_router(transcription.router)
 app.include_router(jobs.router)
 app.include_router(admin.router)
 app.include_router(lexicons.router)
-
-# Feedback endpoint disabled due to syntax errors
-# try:
-#     from app.api.endpoints import feedback
-#     app.include_router(feedback.router)
-# except ImportError as e:
-#     logger.warning(f"Feedback endpoint not available: {e}")
+app.include_router(feedback.jobs_router)
+app.include_router(feedback.router)
 
 
 @app.get(
@@ -8,7 +8,7 @@ Purpose: Store and manage API keys for authentication and rate limiting
 
 Fields:
 - id: Unique identifier for each API key record
-- key_hash: Hashed version of the API key (bcrypt/argon2) for secure storage
+- key_hash: SHA-256 hash of the API key (legacy rows may hold bcrypt hashes)
 - project_name: Human-readable identifier for the project/application using this key
 - description: Optional detailed description of the key's purpose or usage
 - is_active: Flag to enable/disable keys without deletion (soft disable)
@@ -63,7 +63,7 @@ class ApiKey(Base):
     key_hash = Column(
         String(255),
         nullable=False,
-        comment="Bcrypt/Argon2 hashed API key for secure storage"
+        comment="SHA-256 hashed API key (legacy rows may hold bcrypt hashes)"
     )
 
     # Project identification (mapped to 'name' column in database)
@@ -126,6 +126,10 @@ class ApiKey(Base):
         comment="Timestamp of last successful authentication"
     )
     
+    # Fetch server-generated defaults (e.g. updated_at) with RETURNING on
+    # INSERT/UPDATE instead of a separate SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Table-level constraints and indexes
     __table_args__ = (
         # Unique constraint to prevent duplicate key hashes
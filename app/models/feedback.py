@@ -181,6 +181,10 @@ class Feedback(Base):
         comment="When feedback was processed for learning"
     )
 
+    # Fetch server-generated defaults (e.g. updated_at) with RETURNING on
+    # INSERT/UPDATE instead of a separate SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Table-level constraints and indexes
     __table_args__ = (
         {'comment': 'User-submitted corrections and feedback for learning'}
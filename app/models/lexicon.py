@@ -11,18 +11,27 @@ from sqlalchemy import (
     Integer,
     String,
     Boolean,
+    Computed,
     DateTime,
     Text,
     Float,
     Index,
-    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from pydantic import BaseModel, Field
 
 from app.models.api_key import Base
 
+# normalized_term is generated by the database from this expression, and
+# normalize_term() mirrors it in Python. SQL trim() strips spaces only.
+NORMALIZED_TERM_EXPRESSION = "lower(trim(term))"
+
+
+def normalize_term(text: str) -> str:
+    """Normalize text the way the normalized_term column does: strip spaces, then lowercase."""
+    return text.strip(" ").lower()
+
 
 class LexiconTerm(Base):
     """
@@ -57,8 +66,10 @@ class LexiconTerm(Base):
         comment="The term to match in transcriptions"
     )
 
+    # Generated by the database; never written by the application
     normalized_term = Column(
         String(255),
+        Computed(NORMALIZED_TERM_EXPRESSION, persisted=True),
         nullable=False,
         index=True,
         comment="Normalized/lowercased version for case-insensitive matching"
@@ -154,11 +165,26 @@ class LexiconTerm(Base):
 
     # Table-level constraints and indexes
     __table_args__ = (
-        # Unique constraint on lexicon_id and normalized_term
-        UniqueConstraint(
+        # Active terms are unique per lexicon by normalized_term;
+        # soft-deleted terms don't block re-adding the same term
+        Index(
+            'uq_lexicon_terms_active_normalized',
             'lexicon_id',
             'normalized_term',
-            name='uq_lexicon_terms_lexicon_normalized'
+            unique=True,
+            postgresql_where=text('is_active'),
+            sqlite_where=text('is_active')
+        ),
+
+        # Partial covering index so active terms ordered by term are
+        # served by an index-only scan (listing, export and the
+        # term/replacement dictionary load)
+        Index(
+            'ix_lexicon_active_term',
+            'lexicon_id',
+            'term',
+            postgresql_where=text('is_active'),
+            postgresql_include=['id', 'normalized_term', 'replacement', 'updated_at']
         ),
 
         # Table comment
@@ -8,10 +8,39 @@ from app.config.settings import get_settings
 
 settings = get_settings()
 
-# Initialize Redis connection pool
-redis_client = redis.from_url(
+# Shared, bounded connection pool. When every connection is checked out,
+# callers wait up to HEALTH_CHECK_TIMEOUT seconds for one to be released
+# instead of opening an unbounded number of sockets.
+redis_pool = redis.BlockingConnectionPool.from_url(
     settings.REDIS_URL,
+    max_connections=settings.REDIS_POOL_SIZE,
+    timeout=settings.HEALTH_CHECK_TIMEOUT,
     decode_responses=True,
     socket_connect_timeout=settings.HEALTH_CHECK_TIMEOUT,
     socket_timeout=settings.HEALTH_CHECK_TIMEOUT
 )
+
+# Initialize Redis client bound to the shared pool
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Separate pool for callers that store binary (e.g. compressed) values,
+# which can't go through a client with decode_responses=True
+redis_binary_pool = redis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_POOL_SIZE,
+    timeout=settings.HEALTH_CHECK_TIMEOUT,
+    decode_responses=False,
+    socket_connect_timeout=settings.HEALTH_CHECK_TIMEOUT,
+    socket_timeout=settings.HEALTH_CHECK_TIMEOUT
+)
+redis_binary_client = redis.Redis(connection_pool=redis_binary_pool)
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the process-wide Redis client."""
+    return redis_client
+
+
+def get_redis_binary_client() -> redis.Redis:
+    """Return the process-wide Redis client that returns raw bytes."""
+    return redis_binary_client
@@ -7,6 +7,7 @@ terms in JSON/CSV formats.
 
 import logging
 from datetime import datetime
+from typing import Iterator
 from fastapi import (
     APIRouter,
     Depends,
@@ -16,12 +17,14 @@ from fastapi import (
     status,
     Query
 )
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.auth import get_api_key
-from app.database import get_db
+from app.database import SessionLocal, get_db
+from app.api.responses import ORJSONResponse
 from app.schemas.lexicons import (
+    IMPORT_SUMMARY_ADAPTER,
     ImportSummaryResponse,
     ExportFormat,
     ErrorDetail
@@ -35,8 +38,8 @@ from app.utils.file_parsers import (
     validate_file_size,
     parse_json_file,
     parse_csv_file,
-    generate_json_export,
-    generate_csv_export
+    stream_json_export,
+    stream_csv_export
 )
 
 logger = logging.getLogger(__name__)
@@ -103,12 +106,31 @@ async def import_lexicon_terms(
             errors.append(f"Database error: {str(e)}")
 
     # Return summary
-    return ImportSummaryResponse(
+    summary = ImportSummaryResponse(
         imported=imported_count,
         skipped=len(skipped_terms),
         errors=errors,
         skipped_terms=skipped_terms
     )
+    return ORJSONResponse(IMPORT_SUMMARY_ADAPTER.dump_python(summary, mode="json"))
+
+
+def _stream_lexicon_export(lexicon_id: str, format: ExportFormat) -> Iterator[str]:
+    """
+    Stream a lexicon export from a session owned by the stream itself.
+
+    The response body is produced after the handler returns, when request
+    dependencies such as get_db may already have closed their session.
+    """
+    db = SessionLocal()
+    try:
+        terms = export_terms_from_database(lexicon_id, db)
+        if format == ExportFormat.JSON:
+            yield from stream_json_export(terms)
+        else:
+            yield from stream_csv_export(terms)
+    finally:
+        db.close()
 
 
 @router.get(
@@ -121,37 +143,31 @@ async def export_lexicon_terms(
         ExportFormat.JSON,
         description="Export format: 'json' or 'csv'"
     ),
-    db: Session = Depends(get_db),
     api_key=Depends(get_api_key)
 ):
     """
     Export all active lexicon terms in the specified format.
 
-    Returns a file download response with appropriate headers.
+    Returns a file download response with appropriate headers. The file
+    is streamed as rows are read from the database.
     """
     logger.info(f"Export request for lexicon '{lexicon_id}' in format '{format}'")
 
-    # Get terms from database
-    terms = export_terms_from_database(lexicon_id, db)
-
     # Generate timestamp for filename
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
 
-    # Generate export content and set headers based on format
+    # Set headers based on format
     if format == ExportFormat.JSON:
-        content = generate_json_export(terms)
         media_type = "application/json"
         filename = f"{lexicon_id}_terms_{timestamp}.json"
     else:  # CSV
-        content = generate_csv_export(terms)
         media_type = "text/csv"
         filename = f"{lexicon_id}_terms_{timestamp}.csv"
 
-    logger.info(f"Exported {len(terms)} terms from lexicon '{lexicon_id}'")
-
-    # Return response with appropriate headers
-    return Response(
-        content=content,
+    # Return response with appropriate headers; terms are read from the
+    # database as the body is streamed
+    return StreamingResponse(
+        content=_stream_lexicon_export(lexicon_id, format),
         media_type=media_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
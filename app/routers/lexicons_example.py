@@ -1,21 +1,30 @@
 """
 EXAMPLE: Lexicon CRUD Endpoints with Cache Invalidation
 
-This is a reference implementation showing how to integrate cache invalidation
-into lexicon CRUD endpoints (Task #26).
+This is a reference implementation of lexicon CRUD endpoints (Task #26).
+Cache invalidation is not called here: lexicon_service invalidates cached
+metadata for every lexicon whose terms change, once the session commits.
 
 NOTE: This is an example file for reference. The actual CRUD endpoints should be
 implemented in a separate task with proper schemas, validation, and error handling.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
-import uuid
+from typing import List, Optional
 
 from app.database import get_db
 from app.models.lexicon import LexiconTerm
-from app.services.lexicon_service import invalidate_lexicon_cache
+from app.services.lexicon_service import (
+    decode_terms_cursor,
+    encode_terms_cursor,
+    get_term_by_id,
+    get_terms_cursor,
+    soft_delete_term,
+    update_term as update_lexicon_term
+)
 
 router = APIRouter(prefix="/lexicons", tags=["lexicons"])
 
@@ -31,13 +40,16 @@ async def create_term(
     """
     Create a new lexicon term.
     
-    After creating the term, invalidates the cache for this lexicon
-    to ensure subsequent requests get the updated terms.
+    The cache for this lexicon is invalidated when the insert commits,
+    so subsequent requests get the updated terms.
+    
+    Duplicates are rejected by the partial unique index on active
+    (lexicon_id, normalized_term) rather than a separate SELECT before
+    the insert.
     """
     try:
         # Create new term in database
         new_term = LexiconTerm(
-            id=uuid.uuid4(),
             lexicon_id=lexicon_id,
             term=term,
             replacement=replacement,
@@ -47,9 +59,6 @@ async def create_term(
         db.commit()
         db.refresh(new_term)
         
-        # Invalidate cache for this lexicon
-        await invalidate_lexicon_cache(lexicon_id)
-        
         return {
             "id": str(new_term.id),
             "lexicon_id": new_term.lexicon_id,
@@ -58,6 +67,12 @@ async def create_term(
             "is_active": new_term.is_active
         }
         
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Term '{term}' already exists in lexicon {lexicon_id}"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -70,7 +85,7 @@ async def create_term(
 @router.put("/{lexicon_id}/terms/{term_id}")
 async def update_term(
     lexicon_id: str,
-    term_id: str,
+    term_id: int,
     replacement: str = None,
     is_active: bool = None,
     db: Session = Depends(get_db)
@@ -78,14 +93,21 @@ async def update_term(
     """
     Update an existing lexicon term.
     
-    After updating, invalidates the cache to ensure changes are reflected.
+    The cache is invalidated when the update commits.
     """
     try:
-        # Find term
-        term = db.query(LexiconTerm).filter(
-            LexiconTerm.id == term_id,
-            LexiconTerm.lexicon_id == lexicon_id
-        ).first()
+        # Collect fields to update
+        values = {}
+        if replacement is not None:
+            values["replacement"] = replacement
+        if is_active is not None:
+            values["is_active"] = is_active
+        
+        # Single UPDATE ... RETURNING; nothing to write means a plain lookup
+        if values:
+            term = update_lexicon_term(db, lexicon_id, term_id, values)
+        else:
+            term = get_term_by_id(db, lexicon_id, term_id)
         
         if not term:
             raise HTTPException(
@@ -93,18 +115,6 @@ async def update_term(
                 detail=f"Term {term_id} not found in lexicon {lexicon_id}"
             )
         
-        # Update fields
-        if replacement is not None:
-            term.replacement = replacement
-        if is_active is not None:
-            term.is_active = is_active
-        
-        db.commit()
-        db.refresh(term)
-        
-        # Invalidate cache
-        await invalidate_lexicon_cache(lexicon_id)
-        
         return {
             "id": str(term.id),
             "lexicon_id": term.lexicon_id,
@@ -115,6 +125,12 @@ async def update_term(
         
     except HTTPException:
         raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Term {term_id} conflicts with an existing term in lexicon {lexicon_id}"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -127,34 +143,22 @@ async def update_term(
 @router.delete("/{lexicon_id}/terms/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_term(
     lexicon_id: str,
-    term_id: str,
+    term_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Soft delete a lexicon term (sets is_active=False).
     
-    After deletion, invalidates the cache.
+    The cache is invalidated when the deletion commits.
     """
     try:
-        # Find term
-        term = db.query(LexiconTerm).filter(
-            LexiconTerm.id == term_id,
-            LexiconTerm.lexicon_id == lexicon_id
-        ).first()
-        
-        if not term:
+        # Soft delete (set is_active=False) in a single UPDATE
+        if not soft_delete_term(db, lexicon_id, term_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Term {term_id} not found in lexicon {lexicon_id}"
             )
         
-        # Soft delete (set is_active=False)
-        term.is_active = False
-        db.commit()
-        
-        # Invalidate cache
-        await invalidate_lexicon_cache(lexicon_id)
-        
         return None
         
     except HTTPException:
@@ -171,29 +175,66 @@ async def delete_term(
 @router.get("/{lexicon_id}/terms")
 async def get_terms(
     lexicon_id: str,
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=500),
+    include_total: bool = Query(True, description="Compute the total number of active terms"),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db: Session = Depends(get_db)
 ):
     """
-    Get all active terms for a lexicon.
+    Get a page of active terms for a lexicon, ordered by term.
+    
+    The first page and any request carrying a cursor use keyset pagination;
+    page numbers beyond the first fall back to LIMIT/OFFSET.
     
     Note: This endpoint queries the database directly (not using cache)
     to provide administrative access to all terms with metadata.
     The cache is used for post-processing only.
     """
-    terms = db.query(LexiconTerm).filter(
+    base = db.query(LexiconTerm).filter(
         LexiconTerm.lexicon_id == lexicon_id,
         LexiconTerm.is_active == True
-    ).all()
+    )
     
-    return [
-        {
-            "id": str(term.id),
-            "lexicon_id": term.lexicon_id,
-            "term": term.term,
-            "replacement": term.replacement,
-            "is_active": term.is_active,
-            "created_at": term.created_at.isoformat(),
-            "updated_at": term.updated_at.isoformat()
-        }
-        for term in terms
-    ]
+    # Count on the unordered base query so no ORDER BY ends up in the
+    # COUNT statement; skipped entirely when the caller doesn't need it
+    total = None
+    if include_total:
+        total = base.with_entities(func.count(LexiconTerm.id)).scalar()
+    
+    next_cursor = None
+    if cursor is not None or page == 1:
+        try:
+            position = decode_terms_cursor(cursor) if cursor is not None else None
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        
+        terms, next_position = get_terms_cursor(db, lexicon_id, position, limit)
+        if next_position is not None:
+            next_cursor = encode_terms_cursor(next_position)
+    else:
+        terms = (
+            base.order_by(LexiconTerm.term, LexiconTerm.id)
+            .offset((page - 1) * limit)
+            .limit(limit)
+            .all()
+        )
+    
+    return {
+        "items": [
+            {
+                "id": str(term.id),
+                "lexicon_id": term.lexicon_id,
+                "term": term.term,
+                "replacement": term.replacement,
+                "is_active": term.is_active,
+                "created_at": term.created_at.isoformat(),
+                "updated_at": term.updated_at.isoformat()
+            }
+            for term in terms
+        ],
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "next_cursor": next_cursor
+    }
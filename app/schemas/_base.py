@@ -0,0 +1,24 @@
+"""
+Shared base classes for API schemas.
+
+Common model configuration lives here once instead of being repeated in a
+per-class Config on every schema. Subclasses set only their own keys (such
+as json_schema_extra) in model_config, which pydantic merges with these.
+"""
+from pydantic import BaseModel, ConfigDict
+
+
+class APIModel(BaseModel):
+    """Base class for API schemas that may be built from ORM objects."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        str_strip_whitespace=False,
+    )
+
+
+class APIResponse(APIModel):
+    """Base class for response payloads, which are never mutated after construction."""
+
+    model_config = ConfigDict(frozen=True)
@@ -4,12 +4,14 @@ Feedback Schemas
 Pydantic models for feedback API request/response validation.
 """
 
-from typing import Optional, List
+from typing import Optional, Tuple
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from enum import Enum
 
+from app.schemas._base import APIResponse
+
 
 class FeedbackStatus(str, Enum):
     """
@@ -121,7 +123,35 @@ class FeedbackSubmitRequest(BaseModel):
         }
 
 
-class FeedbackResponse(BaseModel):
+class FeedbackStatusUpdate(BaseModel):
+    """
+    Request schema for updating the review status of a feedback record.
+
+    The confidence range is enforced by the field constraint alone; no
+    additional Python validator is needed.
+    """
+    status: FeedbackStatus = Field(
+        ...,
+        description="New status for the feedback (approved or rejected)"
+    )
+    confidence: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Optional confidence score for the correction (0.0-1.0)"
+    )
+
+    class Config:
+        """Pydantic configuration."""
+        json_schema_extra = {
+            "example": {
+                "status": "approved",
+                "confidence": 0.95
+            }
+        }
+
+
+class FeedbackResponse(APIResponse):
     """
     Response schema for feedback submission and retrieval.
 
@@ -139,12 +169,11 @@ class FeedbackResponse(BaseModel):
     created_at: datetime = Field(..., description="Timestamp when the feedback was created")
     updated_at: Optional[datetime] = Field(None, description="Timestamp when the feedback was last modified")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
+    model_config = ConfigDict(
+        json_encoders={
             datetime: lambda v: v.isoformat() if v else None
-        }
-        json_schema_extra = {
+        },
+        json_schema_extra={
             "example": {
                 "id": 123,
                 "job_id": 456,
@@ -159,17 +188,28 @@ class FeedbackResponse(BaseModel):
                 "updated_at": "2024-01-15T10:30:00Z"
             }
         }
+    )
 
 
-class FeedbackListResponse(BaseModel):
+class FeedbackListResponse(APIResponse):
     """Response model for paginated feedback list."""
 
-    total: int = Field(..., description="Total number of feedback records matching filters")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of feedback records matching filters (only when count=true)"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of records per page")
-    items: List[FeedbackResponse] = Field(..., description="List of feedback items")
+    has_more: bool = Field(False, description="Whether another page of results exists")
+    items: Tuple[FeedbackResponse, ...] = Field(..., description="List of feedback items")
 
-    class Config:
-        json_encoders = {
+    model_config = ConfigDict(
+        json_encoders={
             datetime: lambda v: v.isoformat() if v else None
         }
+    )
+
+
+# Prebuilt adapters so route handlers share one serializer per response model
+FEEDBACK_ADAPTER = TypeAdapter(FeedbackResponse)
+FEEDBACK_LIST_ADAPTER = TypeAdapter(FeedbackListResponse)
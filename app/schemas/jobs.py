@@ -4,9 +4,14 @@ Job request and response schemas for the transcription API.
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, TypeAdapter
+
+from app.schemas._base import APIResponse
+
+
+# Job IDs are stored as canonical UUID strings; responses pass them through as-is
+JOB_ID_PATTERN = r"^[0-9a-fA-F-]{36}$"
 
 
 class JobStatus(str, Enum):
@@ -24,31 +29,31 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-class JobCreateResponse(BaseModel):
+class JobCreateResponse(APIResponse):
     """Response model for job creation."""
-    job_id: UUID = Field(..., description="Unique identifier for the created job")
+    job_id: str = Field(..., pattern=JOB_ID_PATTERN, description="Unique identifier for the created job")
     status: JobStatus = Field(..., description="Initial status (pending)")
     created_at: datetime = Field(..., description="ISO 8601 timestamp when job was created")
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "job_id": "123e4567-e89b-12d3-a456-426614174000",
                 "status": "pending",
                 "created_at": "2024-01-15T10:30:00Z"
             }
         }
+    )
 
 
-class JobStatusResponse(BaseModel):
+class JobStatusResponse(APIResponse):
     """
     Response model for job status retrieval.
 
     Represents the current state of a transcription job including
     timestamps, status, and results (if available).
     """
-    job_id: UUID = Field(..., description="Unique identifier for the job")
+    job_id: str = Field(..., pattern=JOB_ID_PATTERN, description="Unique identifier for the job")
     status: JobStatus = Field(..., description="Current status of the job")
     created_at: datetime = Field(..., description="ISO 8601 timestamp when job was created")
     completed_at: Optional[datetime] = Field(None, description="ISO 8601 timestamp when job completed (null if not completed)")
@@ -61,9 +66,8 @@ class JobStatusResponse(BaseModel):
     fuzzy_match_count: Optional[int] = Field(None, description="Number of fuzzy matches used")
     confidence_score: Optional[float] = Field(None, description="Overall confidence score (0.0-1.0)")
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "job_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -94,3 +98,9 @@ class JobStatusResponse(BaseModel):
                 }
             ]
         }
+    )
+
+
+# Prebuilt adapters so route handlers share one serializer per job response
+JOB_CREATE_ADAPTER = TypeAdapter(JobCreateResponse)
+JOB_STATUS_ADAPTER = TypeAdapter(JobStatusResponse)
@@ -5,8 +5,10 @@ This module defines the request and response schemas for lexicon term endpoints.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.schemas._base import APIResponse
 
 
 class TermCreate(BaseModel):
@@ -30,11 +32,12 @@ class TermCreate(BaseModel):
         description="The corrected/replacement term (1-500 characters)"
     )
     
-    @validator('term', 'replacement')
-    def validate_non_empty(cls, v, field):
+    @field_validator('term', 'replacement')
+    @classmethod
+    def validate_non_empty(cls, v, info):
         """Validate that strings are not just whitespace."""
         if not v or not v.strip():
-            raise ValueError(f"{field.name.capitalize()} cannot be empty or whitespace only")
+            raise ValueError(f"{info.field_name.capitalize()} cannot be empty or whitespace only")
         # Return trimmed value
         trimmed = v.strip()
         if v != trimmed:
@@ -72,11 +75,12 @@ class TermUpdate(BaseModel):
         description="The corrected/replacement term (1-500 characters)"
     )
     
-    @validator('term', 'replacement')
-    def validate_non_empty(cls, v, field):
+    @field_validator('term', 'replacement')
+    @classmethod
+    def validate_non_empty(cls, v, info):
         """Validate that strings are not just whitespace."""
         if not v or not v.strip():
-            raise ValueError(f"{field.name.capitalize()} cannot be empty or whitespace only")
+            raise ValueError(f"{info.field_name.capitalize()} cannot be empty or whitespace only")
         # Return trimmed value
         trimmed = v.strip()
         if v != trimmed:
@@ -93,7 +97,7 @@ class TermUpdate(BaseModel):
         }
 
 
-class TermResponse(BaseModel):
+class TermResponse(APIResponse):
     """Schema for lexicon term response."""
     
     id: int = Field(..., description="Unique identifier for the term")
@@ -104,9 +108,8 @@ class TermResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        orm_mode = True
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "lexicon_id": "radiology",
@@ -117,18 +120,20 @@ class TermResponse(BaseModel):
                 "updated_at": "2024-01-01T12:00:00Z"
             }
         }
+    )
 
 
-class TermListResponse(BaseModel):
+class TermListResponse(APIResponse):
     """Schema for paginated list of lexicon terms."""
     
-    items: List[TermResponse] = Field(..., description="List of terms")
-    total: int = Field(..., description="Total number of active terms in the lexicon")
+    items: Tuple[TermResponse, ...] = Field(..., description="List of terms")
+    total: Optional[int] = Field(None, description="Total number of active terms in the lexicon, if requested")
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "items": [
                     {
@@ -143,6 +148,8 @@ class TermListResponse(BaseModel):
                 ],
                 "total": 100,
                 "page": 1,
-                "limit": 50
+                "limit": 50,
+                "next_cursor": None
             }
         }
+    )
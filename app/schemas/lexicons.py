@@ -3,9 +3,11 @@ Pydantic schemas for lexicon import/export endpoints.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from enum import Enum
 
+from app.schemas._base import APIResponse
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -31,7 +33,7 @@ class SkippedTerm(BaseModel):
     reason: str = Field(..., description="Reason why the term was skipped")
 
 
-class ImportSummaryResponse(BaseModel):
+class ImportSummaryResponse(APIResponse):
     """
     Response schema for lexicon import operation.
     
@@ -46,9 +48,8 @@ class ImportSummaryResponse(BaseModel):
         description="Details of skipped terms"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "imported": 150,
@@ -64,6 +65,7 @@ class ImportSummaryResponse(BaseModel):
                 }
             ]
         }
+    )
 
 
 class LexiconTermExport(LexiconTermBase):
@@ -71,6 +73,10 @@ class LexiconTermExport(LexiconTermBase):
     pass
 
 
+# Prebuilt adapter so the import endpoint shares one serializer across requests
+IMPORT_SUMMARY_ADAPTER = TypeAdapter(ImportSummaryResponse)
+
+
 class ErrorDetail(BaseModel):
     """Schema for error details."""
     detail: str = Field(..., description="Error message")
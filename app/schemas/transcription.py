@@ -3,11 +3,13 @@ Transcription API request/response schemas.
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 from typing import Optional
 
+from app.schemas._base import APIResponse
 
-class TranscriptionSubmitResponse(BaseModel):
+
+class TranscriptionSubmitResponse(APIResponse):
     """
     Response model for audio transcription submission.
     
@@ -35,8 +37,8 @@ class TranscriptionSubmitResponse(BaseModel):
         examples=["radiology", "legal", "general"]
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "job_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -46,3 +48,4 @@ class TranscriptionSubmitResponse(BaseModel):
                 }
             ]
         }
+    )
@@ -3,19 +3,74 @@ API Key generation, hashing, and validation service.
 
 This module provides secure API key management functionality including:
 - Cryptographically secure key generation
-- Bcrypt-based key hashing for secure storage
-- Key verification against stored hashes
+- SHA-256 (optionally HMAC-peppered) key hashing for secure storage
+- Key verification against stored hashes, including legacy bcrypt hashes
 - Database operations for API key creation
+
+Generated keys carry 256 bits of entropy, so a single fast hash is enough to
+protect them at rest; a slow KDF such as bcrypt only adds per-request latency.
+Hashes created before the switch still start with bcrypt's "$2" prefix and
+are verified with bcrypt, then upgraded on the next successful validation.
 """
 
+import base64
+import hashlib
+import hmac
+import logging
 import secrets
-from typing import Optional, Tuple
+import threading
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
-from passlib.hash import bcrypt
+from cachetools import TTLCache
+from passlib.context import CryptContext
+import redis
+from sqlalchemy import case, inspect, update
 from sqlalchemy.orm import Session
 
+from app.config.settings import get_settings
 from app.models.api_key import ApiKey
+from app.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Random bytes per generated key (256 bits of entropy)
+API_KEY_BYTES = 32
+
+# Prefix shared by all bcrypt hash variants ($2a$, $2b$, $2y$)
+LEGACY_BCRYPT_PREFIX = "$2"
+
+# Built once at import so legacy verification doesn't re-resolve the bcrypt
+# backend on every call
+_legacy_crypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Successful validations are cached per process for a short time. The
+# SHA-256 digest of the plaintext key (plaintext is never stored) maps to
+# the key's ID, and the ID to a detached ApiKey snapshot, so a hit needs no
+# database access and a key can be evicted by ID directly.
+VALIDATION_CACHE_TTL_SECONDS = 60
+VALIDATION_CACHE_MAX_SIZE = 10_000
+
+_cached_key_ids: TTLCache = TTLCache(
+    maxsize=VALIDATION_CACHE_MAX_SIZE,
+    ttl=VALIDATION_CACHE_TTL_SECONDS
+)
+_validation_cache: TTLCache = TTLCache(
+    maxsize=VALIDATION_CACHE_MAX_SIZE,
+    ttl=VALIDATION_CACHE_TTL_SECONDS
+)
+_validation_cache_lock = threading.RLock()
+
+# Revoked or updated key IDs are published here so every process evicts
+# them, not just the one that handled the admin request
+CACHE_INVALIDATION_CHANNEL = "api_keys:invalidate"
+
+# last_used_at is buffered in memory and written in one bulk UPDATE by
+# flush_api_key_usage instead of committing on every authenticated request.
+LAST_USED_FLUSH_INTERVAL_SECONDS = 30
+
+_pending_last_used: Dict[int, datetime] = {}
+_pending_last_used_lock = threading.Lock()
 
 
 class APIKeyError(Exception):
@@ -37,8 +92,8 @@ def generate_api_key() -> str:
     """
     Generate a cryptographically secure API key.
 
-    Uses secrets.token_urlsafe to generate a 32-byte random key
-    that is URL-safe and suitable for use as an API key.
+    Encodes 32 bytes from secrets.token_bytes as unpadded URL-safe base64,
+    the same format secrets.token_urlsafe produces.
 
     Returns:
         str: A secure, URL-safe API key (base64-encoded, approximately 43 characters)
@@ -48,18 +103,22 @@ def generate_api_key() -> str:
         >>> len(key) >= 43
         True
     """
-    return secrets.token_urlsafe(32)
+    return base64.urlsafe_b64encode(secrets.token_bytes(API_KEY_BYTES)).rstrip(b'=').decode('ascii')
 
 
 def hash_api_key(key: str) -> str:
     """
-    Hash an API key using bcrypt for secure storage.
+    Hash an API key using SHA-256 for secure storage.
+
+    When API_KEY_PEPPER is configured the digest is an HMAC-SHA256 keyed
+    with the pepper, otherwise a plain SHA-256 digest. The result is
+    deterministic, so the hash can be looked up directly in the database.
 
     Args:
         key: Plain text API key to hash
 
     Returns:
-        str: Bcrypt hash of the API key
+        str: Hex-encoded SHA-256 digest of the API key
 
     Raises:
         APIKeyError: If hashing fails
@@ -67,11 +126,14 @@ def hash_api_key(key: str) -> str:
     Example:
         >>> key = "test_key_12345"
         >>> hash_value = hash_api_key(key)
-        >>> hash_value.startswith("$2b$")
-        True
+        >>> len(hash_value)
+        64
     """
     try:
-        return bcrypt.hash(key)
+        pepper = get_settings().API_KEY_PEPPER
+        if pepper:
+            return hmac.new(pepper.encode(), key.encode(), hashlib.sha256).hexdigest()
+        return hashlib.sha256(key.encode()).hexdigest()
     except Exception as e:
         raise APIKeyError(f"Failed to hash API key: {str(e)}")
 
@@ -82,7 +144,7 @@ def verify_api_key(plain_key: str, key_hash: str) -> bool:
 
     Args:
         plain_key: Plain text API key to verify
-        key_hash: Bcrypt hash to verify against
+        key_hash: SHA-256 or legacy bcrypt hash to verify against
 
     Returns:
         bool: True if the key matches the hash, False otherwise
@@ -99,11 +161,26 @@ def verify_api_key(plain_key: str, key_hash: str) -> bool:
         False
     """
     try:
-        return bcrypt.verify(plain_key, key_hash)
+        if is_legacy_hash(key_hash):
+            return _legacy_crypt_context.verify(plain_key, key_hash)
+        return hmac.compare_digest(key_hash, hash_api_key(plain_key))
     except Exception as e:
         raise APIKeyValidationError(f"Failed to verify API key: {str(e)}")
 
 
+def is_legacy_hash(key_hash: str) -> bool:
+    """
+    Check whether a stored hash uses the legacy bcrypt scheme.
+
+    Args:
+        key_hash: Stored API key hash
+
+    Returns:
+        bool: True for bcrypt hashes that should be rehashed with SHA-256
+    """
+    return key_hash.startswith(LEGACY_BCRYPT_PREFIX)
+
+
 def create_api_key(
     db: Session,
     project_name: str,
@@ -115,7 +192,7 @@ def create_api_key(
 
     This function:
     1. Generates a new cryptographically secure API key
-    2. Hashes it using bcrypt
+    2. Hashes it using SHA-256
     3. Stores the hash in the database with metadata
     4. Returns the plaintext key (only time it's available) and the database record
 
@@ -159,20 +236,20 @@ def create_api_key(
         key_hash = hash_api_key(plaintext_key)
 
         # Create database record
+        now = datetime.utcnow()
         api_key = ApiKey(
             key_hash=key_hash,
             project_name=project_name.strip(),
             description=description.strip() if description else None,
             is_active=True,
             rate_limit=rate_limit,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
 
         # Save to database
         db.add(api_key)
         db.commit()
-        db.refresh(api_key)
 
         return plaintext_key, api_key
 
@@ -192,7 +269,7 @@ def get_api_key_by_hash(db: Session, key_hash: str) -> Optional[ApiKey]:
 
     Args:
         db: Database session
-        key_hash: The bcrypt hash to search for
+        key_hash: The SHA-256 hash to search for
 
     Returns:
         Optional[ApiKey]: The API key record if found, None otherwise
@@ -206,20 +283,196 @@ def get_api_key_by_id(db: Session, key_id: str) -> Optional[ApiKey]:
 
     Args:
         db: Database session
-        key_id: The UUID of the API key
+        key_id: The ID of the API key
 
     Returns:
         Optional[ApiKey]: The API key record if found, None otherwise
     """
-    return db.query(ApiKey).filter(ApiKey.id == key_id).first()
+    return db.get(ApiKey, key_id)
+
+
+def find_active_api_key(db: Session, plaintext_key: str) -> Optional[ApiKey]:
+    """
+    Find the active API key record matching a plaintext key.
+
+    SHA-256 hashes are deterministic, so the key is resolved with a single
+    lookup on the unique key_hash index. Only when that misses are the
+    remaining legacy bcrypt rows checked one by one.
+
+    Args:
+        db: Database session
+        plaintext_key: The plaintext API key to look up
+
+    Returns:
+        Optional[ApiKey]: The matching active API key record, or None
+    """
+    api_key = db.query(ApiKey).filter(
+        ApiKey.key_hash == hash_api_key(plaintext_key),
+        ApiKey.is_active == True
+    ).first()
+    if api_key:
+        return api_key
+
+    legacy_keys = db.query(ApiKey).filter(
+        ApiKey.key_hash.startswith(LEGACY_BCRYPT_PREFIX),
+        ApiKey.is_active == True
+    ).all()
+    for legacy_key in legacy_keys:
+        try:
+            if verify_api_key(plaintext_key, legacy_key.key_hash):
+                return legacy_key
+        except APIKeyValidationError:
+            # Continue checking other keys if verification fails
+            continue
+
+    return None
+
+
+def _validation_cache_key(plaintext_key: str) -> bytes:
+    """Return the cache key for a plaintext API key."""
+    return hashlib.sha256(plaintext_key.encode()).digest()
+
+
+def _snapshot_api_key(api_key: ApiKey) -> ApiKey:
+    """Copy the column values of an API key into a detached instance."""
+    return ApiKey(**{
+        attr.key: getattr(api_key, attr.key)
+        for attr in inspect(ApiKey).column_attrs
+    })
+
+
+def _evict_local(key_id) -> None:
+    """Drop the cached validation for an API key ID in this process."""
+    with _validation_cache_lock:
+        _validation_cache.pop(str(key_id), None)
+
+
+def invalidate_cached_api_key(key_id) -> None:
+    """
+    Drop any cached validation for the given API key ID.
+
+    Evicts the entry here and publishes the ID so other processes evict
+    theirs. If Redis is unavailable the error is logged, and other
+    processes keep serving the old entry for up to
+    VALIDATION_CACHE_TTL_SECONDS.
+
+    Args:
+        key_id: ID of the API key to evict
+    """
+    _evict_local(key_id)
+
+    try:
+        get_redis_client().publish(CACHE_INVALIDATION_CHANNEL, str(key_id))
+    except redis.RedisError as e:
+        logger.warning(f"Failed to publish invalidation for API key '{key_id}': {str(e)}")
+
+
+def clear_api_key_cache() -> None:
+    """Remove all cached API key validations."""
+    with _validation_cache_lock:
+        _cached_key_ids.clear()
+        _validation_cache.clear()
+
+
+def _listen_for_invalidations(stop_event: threading.Event) -> None:
+    """Evict cached validations for key IDs published by any process."""
+    while not stop_event.is_set():
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            # Anything published while unsubscribed was missed
+            clear_api_key_cache()
+            while not stop_event.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    _evict_local(message['data'])
+        except redis.RedisError as e:
+            logger.warning(f"API key invalidation listener disconnected: {str(e)}")
+            clear_api_key_cache()
+            stop_event.wait(5)
+        finally:
+            pubsub.close()
+
+
+def start_api_key_invalidation_listener() -> threading.Event:
+    """
+    Start the background thread that evicts revoked keys from this process's cache.
+
+    Returns:
+        Event that stops the listener when set
+    """
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=_listen_for_invalidations,
+        args=(stop_event,),
+        name="api-key-cache-invalidation",
+        daemon=True
+    )
+    thread.start()
+    return stop_event
+
+
+def record_api_key_usage(key_id: int, used_at: Optional[datetime] = None) -> None:
+    """
+    Buffer a last_used_at timestamp for an API key.
+
+    The value is persisted by the next flush_api_key_usage call.
+
+    Args:
+        key_id: ID of the API key that was used
+        used_at: Time of use (default: now, UTC)
+    """
+    used_at = used_at or datetime.utcnow()
+    with _pending_last_used_lock:
+        previous = _pending_last_used.get(key_id)
+        if previous is None or used_at > previous:
+            _pending_last_used[key_id] = used_at
+
+
+def flush_api_key_usage(db: Session) -> int:
+    """
+    Write buffered last_used_at timestamps with a single UPDATE statement.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of API keys updated
+
+    Raises:
+        APIKeyStorageError: If the update fails (buffered values are kept)
+    """
+    with _pending_last_used_lock:
+        pending = dict(_pending_last_used)
+        _pending_last_used.clear()
+
+    if not pending:
+        return 0
+
+    try:
+        db.execute(
+            update(ApiKey)
+            .where(ApiKey.id.in_(pending))
+            .values(last_used_at=case(pending, value=ApiKey.id))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return len(pending)
+    except Exception as e:
+        db.rollback()
+        # Put the timestamps back so the next flush retries them
+        for key_id, used_at in pending.items():
+            record_api_key_usage(key_id, used_at)
+        raise APIKeyStorageError(f"Failed to flush API key usage: {str(e)}")
 
 
 def validate_and_get_api_key(db: Session, plaintext_key: str) -> Optional[ApiKey]:
     """
     Validate a plaintext API key and return the associated record if valid.
 
-    This function searches all active API keys and verifies the plaintext key
-    against their hashes. This is intentionally slower to prevent timing attacks.
+    Recently validated keys are served from an in-process TTL cache as
+    detached snapshots. Otherwise the key is resolved with an indexed hash
+    lookup (see find_active_api_key) and the result is cached.
 
     Args:
         db: Database session
@@ -229,23 +482,34 @@ def validate_and_get_api_key(db: Session, plaintext_key: str) -> Optional[ApiKey
         Optional[ApiKey]: The API key record if valid and active, None otherwise
 
     Note:
-        This function updates the last_used_at timestamp for valid keys.
+        This function buffers the last_used_at timestamp for valid keys (see
+        record_api_key_usage) and transparently upgrades legacy bcrypt hashes
+        to SHA-256.
     """
-    # Get all active API keys
-    active_keys = db.query(ApiKey).filter(ApiKey.is_active == True).all()
+    cache_key = _validation_cache_key(plaintext_key)
+    with _validation_cache_lock:
+        key_id = _cached_key_ids.get(cache_key)
+        cached = _validation_cache.get(key_id) if key_id is not None else None
+    if cached is not None and cached.is_active:
+        record_api_key_usage(cached.id)
+        return cached
+
+    api_key = find_active_api_key(db, plaintext_key)
+    if not api_key:
+        return None
+
+    # Upgrade legacy bcrypt hashes now that the plaintext is known
+    if is_legacy_hash(api_key.key_hash):
+        api_key.key_hash = hash_api_key(plaintext_key)
+        db.commit()
 
-    for api_key in active_keys:
-        try:
-            if verify_api_key(plaintext_key, api_key.key_hash):
-                # Update last used timestamp
-                api_key.last_used_at = datetime.utcnow()
-                db.commit()
-                return api_key
-        except APIKeyValidationError:
-            # Continue checking other keys if verification fails
-            continue
+    snapshot = _snapshot_api_key(api_key)
+    record_api_key_usage(api_key.id)
 
-    return None
+    with _validation_cache_lock:
+        _cached_key_ids[cache_key] = str(api_key.id)
+        _validation_cache[str(api_key.id)] = snapshot
+    return api_key
 
 
 def deactivate_api_key(db: Session, key_id: str) -> bool:
@@ -272,6 +536,7 @@ def deactivate_api_key(db: Session, key_id: str) -> bool:
         api_key.updated_at = datetime.utcnow()
         db.commit()
 
+        invalidate_cached_api_key(key_id)
         return True
 
     except Exception as e:
@@ -4,7 +4,7 @@ Feedback Service
 Business logic for feedback management including status transition validation.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -17,7 +17,38 @@ class InvalidStatusTransitionError(Exception):
     pass
 
 
-def validate_status_transition(current_status: str, new_status: str) -> None:
+# Allowed target statuses for each current status. Terminal statuses map to
+# an empty set; statuses not listed here are not restricted.
+_ALLOWED_TRANSITIONS = {
+    FeedbackStatus.PENDING.value: frozenset({
+        FeedbackStatus.APPROVED.value,
+        FeedbackStatus.REJECTED.value,
+    }),
+    FeedbackStatus.APPROVED.value: frozenset(),
+    FeedbackStatus.REJECTED.value: frozenset(),
+    "auto-approved": frozenset(),  # future state
+}
+
+# Error message prefix for each restricted current status
+_TRANSITION_ERRORS = {
+    FeedbackStatus.PENDING.value: "Pending feedback can only be approved or rejected.",
+    FeedbackStatus.APPROVED.value: "Cannot change status of already approved feedback.",
+    FeedbackStatus.REJECTED.value: "Cannot change status of already rejected feedback.",
+    "auto-approved": "Cannot change status of auto-approved feedback.",
+}
+
+
+def _status_value(status_value: Union[str, FeedbackStatus]) -> str:
+    """Return the lowercase status string, skipping .lower() for enum members."""
+    if isinstance(status_value, FeedbackStatus):
+        return status_value.value
+    return status_value.lower()
+
+
+def validate_status_transition(
+    current_status: Union[str, FeedbackStatus],
+    new_status: Union[str, FeedbackStatus]
+) -> None:
     """
     Validate that a status transition is allowed.
     
@@ -29,47 +60,26 @@ def validate_status_transition(current_status: str, new_status: str) -> None:
     - auto-approved → any ✗ (invalid, future state)
     
     Args:
-        current_status: Current status of the feedback
-        new_status: Desired new status
+        current_status: Current status of the feedback (string or FeedbackStatus)
+        new_status: Desired new status (string or FeedbackStatus)
         
     Raises:
         InvalidStatusTransitionError: If the transition is not allowed
     """
-    # Normalize to lowercase for comparison
-    current = current_status.lower()
-    new = new_status.lower()
-    
-    # Auto-approved feedback cannot be changed
-    if current == FeedbackStatus.AUTO_APPROVED.value:
-        raise InvalidStatusTransitionError(
-            f"Cannot change status of auto-approved feedback. "
-            f"Transition from '{current_status}' to '{new_status}' is not allowed."
-        )
+    # Fast path for the only non-terminal state
+    if current_status is FeedbackStatus.PENDING and (
+        new_status is FeedbackStatus.APPROVED or new_status is FeedbackStatus.REJECTED
+    ):
+        return
     
-    # Approved feedback cannot be changed
-    if current == FeedbackStatus.APPROVED.value:
-        raise InvalidStatusTransitionError(
-            f"Cannot change status of already approved feedback. "
-            f"Transition from '{current_status}' to '{new_status}' is not allowed."
-        )
+    current = _status_value(current_status)
+    allowed = _ALLOWED_TRANSITIONS.get(current)
     
-    # Rejected feedback cannot be changed
-    if current == FeedbackStatus.REJECTED.value:
+    if allowed is not None and _status_value(new_status) not in allowed:
         raise InvalidStatusTransitionError(
-            f"Cannot change status of already rejected feedback. "
-            f"Transition from '{current_status}' to '{new_status}' is not allowed."
+            f"{_TRANSITION_ERRORS[current]} "
+            f"Transition from '{current}' to '{_status_value(new_status)}' is not allowed."
         )
-    
-    # Pending feedback can only transition to approved or rejected
-    if current == FeedbackStatus.PENDING.value:
-        if new not in [FeedbackStatus.APPROVED.value, FeedbackStatus.REJECTED.value]:
-            raise InvalidStatusTransitionError(
-                f"Pending feedback can only be approved or rejected. "
-                f"Transition from '{current_status}' to '{new_status}' is not allowed."
-            )
-    
-    # If we reach here, the transition is valid
-    return
 
 
 def get_feedback_by_id(db: Session, feedback_id: int) -> Optional[Feedback]:
@@ -83,7 +93,7 @@ def get_feedback_by_id(db: Session, feedback_id: int) -> Optional[Feedback]:
     Returns:
         Feedback object if found, None otherwise
     """
-    return db.query(Feedback).filter(Feedback.id == feedback_id).first()
+    return db.get(Feedback, feedback_id)
 
 
 def update_feedback_status(
@@ -132,10 +142,9 @@ def update_feedback_status(
     if confidence is not None:
         feedback.confidence = confidence
     
-    # updated_at will be automatically updated by the onupdate trigger
+    # updated_at is set by the onupdate default and returned by the UPDATE
     
     # Commit the changes
     db.commit()
-    db.refresh(feedback)
     
     return feedback
@@ -4,6 +4,7 @@ Job service for managing transcription job status and metadata.
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
+from sqlalchemy import inspect, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -24,6 +25,36 @@ class JobServiceError(Exception):
     pass
 
 
+# Attribute names that map to columns on the jobs table
+_JOB_COLUMNS = frozenset(attr.key for attr in inspect(Job).column_attrs)
+
+
+def _update_job_returning(session: Session, job_id: str, values: Dict[str, Any]) -> Optional[Job]:
+    """
+    Apply column updates to a job with a single UPDATE ... RETURNING.
+    
+    Unknown keys are ignored. The returned Job is populated from the
+    RETURNING row, so no separate SELECT is issued.
+    
+    Args:
+        session: Database session
+        job_id: The job ID to update
+        values: Column values to set
+    
+    Returns:
+        Updated Job object, or None if no job matched
+    """
+    values = {key: value for key, value in values.items() if key in _JOB_COLUMNS}
+    stmt = (
+        update(Job)
+        .where(Job.job_id == job_id)
+        .values(**values)
+        .returning(Job)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    return session.execute(stmt).scalars().first()
+
+
 def get_job(job_id: str, session: Optional[Session] = None) -> Job:
     """
     Retrieve a job from the database by ID.
@@ -112,8 +143,18 @@ def update_job_status(
         manage_transaction = True
     
     try:
-        # Get the job
-        job = session.query(Job).filter(Job.job_id == job_id).first()
+        values = {"status": status}
+        
+        # Update timestamp based on status
+        if status == "processing" and "started_at" not in kwargs:
+            values["started_at"] = datetime.utcnow()
+        elif status in ["completed", "failed"] and "completed_at" not in kwargs:
+            values["completed_at"] = datetime.utcnow()
+        
+        # Update additional fields
+        values.update(kwargs)
+        
+        job = _update_job_returning(session, job_id, values)
         
         if job is None:
             log_with_context(
@@ -125,30 +166,15 @@ def update_job_status(
             )
             raise JobNotFoundError(f"Job with ID {job_id} not found")
         
-        old_status = job.status
-        
-        # Update status
-        job.status = status
-        
-        # Update timestamp based on status
-        if status == "processing" and "started_at" not in kwargs:
-            job.started_at = datetime.utcnow()
-        elif status in ["completed", "failed"] and "completed_at" not in kwargs:
-            job.completed_at = datetime.utcnow()
-        
-        # Update additional fields
-        for key, value in kwargs.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-        
         if manage_transaction:
+            # Detach first so commit doesn't expire the returned values
+            session.expunge(job)
             session.commit()
-            session.refresh(job)
         
         log_with_context(
             logger,
             logging.INFO,
-            f"Job status updated: {old_status} -> {status}",
+            f"Job status updated to {status}",
             job_id=job_id,
             status=status
         )
@@ -222,19 +248,15 @@ def update_job_fields(
         manage_transaction = True
     
     try:
-        job = session.query(Job).filter(Job.job_id == job_id).first()
+        job = _update_job_returning(session, job_id, fields)
         
         if job is None:
             raise JobNotFoundError(f"Job with ID {job_id} not found")
         
-        # Update fields
-        for key, value in fields.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-        
         if manage_transaction:
+            # Detach first so commit doesn't expire the returned values
+            session.expunge(job)
             session.commit()
-            session.refresh(job)
         
         log_with_context(
             logger,
@@ -5,37 +5,706 @@ Handles validation, database transactions, and data transformation
 for lexicon term management.
 """
 
+import base64
+import binascii
+import json
 import logging
-from typing import List, Dict, Tuple
+import random
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 from datetime import datetime
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import bindparam, event, func, and_, select, text, tuple_, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import column, table
+from sqlalchemy.dialects.postgresql import insert
 import redis
-from sqlalchemy import func
+import zstandard
 
-from app.models.lexicon import LexiconTerm
+from app.models.lexicon import LexiconTerm, normalize_term
+from app.redis_client import get_redis_binary_client
 from app.schemas.lexicons import SkippedTerm
+from app.services.numeral_handler import invalidate_lexicon_strategy_cache
 
 logger = logging.getLogger(__name__)
 
+# Redis keys for {term: replacement} dictionaries used by post-processing
+CACHE_KEY_LEXICON_TERMS_PREFIX = "lexicons:terms:"
+# Set of every terms key written, so bulk invalidation never needs SCAN
+CACHE_KEY_LEXICON_INDEX = "lexicons:index"
 
-def load_lexicon_sync(lexicon_id: str, db: Session) -> Dict[str, str]:
+# Cached JSON payloads above this size are stored zstd-compressed. A zstd
+# frame starts with a magic number that JSON text never does, so
+# compressed and plain payloads can be told apart on read.
+CACHE_COMPRESSION_THRESHOLD_BYTES = 1024
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# zstd contexts must not be shared between threads, and term dictionaries
+# are encoded from request threads and workers alike
+_zstd_contexts = threading.local()
+
+# Cache TTL (seconds) for term dictionaries; writes invalidate them sooner
+TTL_LEXICON_TERMS = 3600
+
+# In-process cache in front of Redis, keyed by the Redis key. Entries are
+# evicted in every process through the invalidation pub/sub channel, whose
+# listener runs in the API (main.py lifespan) and in TranscriptionWorker.
+LOCAL_CACHE_MAX_SIZE = 256
+LOCAL_CACHE_TTL_SECONDS = 30
+CACHE_INVALIDATION_CHANNEL = "lexicons:invalidate"
+_INVALIDATE_ALL_MESSAGE = "*"
+
+_local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAX_SIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
+_local_cache_lock = threading.Lock()
+
+# Circuit breaker for cache reads and writes. After this many consecutive
+# Redis errors the cache is skipped for a cool-down, so requests go
+# straight to the database instead of each waiting out a socket timeout.
+# Invalidation is always attempted.
+CACHE_FAILURE_THRESHOLD = 3
+CACHE_COOLDOWN_SECONDS = 30.0
+_cache_failures = 0
+_cache_down_until = 0.0
+_cache_breaker_lock = threading.Lock()
+
+# Materialized view of per-lexicon summaries, read here for numeral
+# strategy overrides (PostgreSQL only). Writes schedule a debounced
+# REFRESH; other databases fall back to querying lexicon_terms.
+_lexicon_summary = table(
+    'lexicon_summary',
+    column('lexicon_id'),
+    column('numeral_strategy')
+)
+LEXICON_SUMMARY_REFRESH_DELAY_SECONDS = 2.0
+_summary_refresh_lock = threading.Lock()
+# Lexicons written since the pending refresh was scheduled; empty when
+# no refresh is pending
+_summary_refresh_lexicons: Set[str] = set()
+
+# Session.info key holding lexicon IDs modified in the current transaction.
+# The cache entries for these lexicons are invalidated once it commits.
+_DIRTY_LEXICONS_KEY = "dirty_lexicons"
+
+# Core insert on the table itself, bypassing the ORM. Executed with a list
+# of parameter dicts, so it compiles once and the driver batches the rows
+# into multi-VALUES statements. Conflicting terms are skipped by the
+# partial unique index on active terms, and RETURNING reports which rows
+# were inserted.
+_lexicon_terms_table = LexiconTerm.__table__
+_IMPORT_TERMS_STMT = (
+    insert(_lexicon_terms_table)
+    .on_conflict_do_nothing(
+        index_elements=['lexicon_id', 'normalized_term'],
+        index_where=text('is_active')
+    )
+    .returning(_lexicon_terms_table.c.id)
+)
+
+# Term dictionary query, built once and reused on every cache miss. Only
+# the two needed columns are selected, so no ORM instances are built.
+_LOAD_TERMS_STMT = select(LexiconTerm.term, LexiconTerm.replacement).where(
+    LexiconTerm.lexicon_id == bindparam('lexicon_id'),
+    LexiconTerm.is_active == True
+)
+
+
+def _share_lexicon(cache_key: str, lexicon: Dict[str, str]) -> Mapping[str, str]:
+    """Wrap a term dictionary read-only and keep it in the in-process cache."""
+    shared = MappingProxyType(lexicon)
+    _local_set(cache_key, shared)
+    return shared
+
+
+def _query_lexicon_terms(db: Session, lexicon_id: str) -> Dict[str, str]:
+    """Read a lexicon's active {term: replacement} dictionary from the database."""
+    return dict(db.execute(_LOAD_TERMS_STMT, {'lexicon_id': lexicon_id}).all())
+
+
+def _write_lexicon_terms(pipe: Any, cache_key: str, lexicon: Dict[str, str]) -> None:
+    """
+    Queue the SETEX that caches a term dictionary, and index its key.
+
+    Takes a sync or asyncio pipeline, so every loader writes the same
+    payload and TTL in one round-trip.
+    """
+    pipe.setex(cache_key, _ttl(TTL_LEXICON_TERMS), _encode_cache_payload(lexicon))
+    pipe.sadd(CACHE_KEY_LEXICON_INDEX, cache_key)
+
+
+def load_lexicon_sync(lexicon_id: str, db: Session) -> Mapping[str, str]:
+    """
+    Load lexicon terms synchronously, from Redis when cached.
+
+    Checks the in-process cache, then Redis, then the database. The
+    dictionary is cached in Redis as orjson bytes, zstd-compressed when
+    large, and both layers are invalidated whenever the lexicon's terms
+    change. Redis errors are logged and the terms are read from the
+    database.
+
+    The same read-only mapping is returned to every caller until the
+    in-process entry expires, so repeat loads don't decode or copy.
+
+    Args:
+        lexicon_id: The lexicon ID to load terms from
+        db: Database session
+
+    Returns:
+        Read-only mapping of terms to their replacements
     """
-    Load lexicon terms from database synchronously.
+    cache = get_redis_binary_client()
+    cache_key = CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id
+    lexicon = _local_get(cache_key)
+    if lexicon is not None:
+        return lexicon
+
+    cached_data = _cache_call("read", cache.get, cache_key)
+
+    if cached_data is not None:
+        return _share_lexicon(cache_key, _decode_cache_payload(cached_data))
+
+    lexicon = _query_lexicon_terms(db, lexicon_id)
+    pipe = cache.pipeline(transaction=False)
+    _write_lexicon_terms(pipe, cache_key, lexicon)
+    _cache_call("write", pipe.execute)
+
+    return _share_lexicon(cache_key, lexicon)
+
+
+def load_lexicons_sync(lexicon_ids: List[str], db: Session) -> Dict[str, Mapping[str, str]]:
+    """
+    Load the term dictionaries for several lexicons at once.
+
+    Uses one MGET for everything not in the in-process cache, one IN
+    query for the Redis misses, and one pipelined round-trip to cache
+    them, instead of a load_lexicon_sync call per lexicon.
+
+    Args:
+        lexicon_ids: Lexicon IDs to load terms from
+        db: Database session
+
+    Returns:
+        Mapping of lexicon ID to its read-only {term: replacement} mapping
+    """
+    lexicons: Dict[str, Mapping[str, str]] = {}
+    pending = []
+    for lexicon_id in dict.fromkeys(lexicon_ids):
+        lexicon = _local_get(CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id)
+        if lexicon is not None:
+            lexicons[lexicon_id] = lexicon
+        else:
+            pending.append(lexicon_id)
+
+    if not pending:
+        return lexicons
+
+    cache = get_redis_binary_client()
+    cached_values = _cache_call(
+        "read", cache.mget, [CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id for lexicon_id in pending]
+    ) or [None] * len(pending)
+
+    misses = []
+    for lexicon_id, cached_data in zip(pending, cached_values):
+        if cached_data is None:
+            misses.append(lexicon_id)
+        else:
+            lexicons[lexicon_id] = _share_lexicon(
+                CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id,
+                _decode_cache_payload(cached_data)
+            )
+
+    if misses:
+        loaded: Dict[str, Dict[str, str]] = {lexicon_id: {} for lexicon_id in misses}
+        rows = db.query(LexiconTerm.lexicon_id, LexiconTerm.term, LexiconTerm.replacement).filter(
+            LexiconTerm.lexicon_id.in_(misses),
+            LexiconTerm.is_active == True
+        )
+        for lexicon_id, term, replacement in rows:
+            loaded[lexicon_id][term] = replacement
+
+        pipe = cache.pipeline(transaction=False)
+        for lexicon_id, lexicon in loaded.items():
+            _write_lexicon_terms(pipe, CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id, lexicon)
+        _cache_call("write", pipe.execute)
+
+        for lexicon_id, lexicon in loaded.items():
+            lexicons[lexicon_id] = _share_lexicon(CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id, lexicon)
+
+    return lexicons
+
+
+async def load_lexicon(lexicon_id: str, db: Session) -> Mapping[str, str]:
+    """
+    Load lexicon terms from an async request handler, from Redis when cached.
+
+    Runs load_lexicon_sync in the threadpool: the SQLAlchemy session and
+    the Redis client are both blocking, so calling them inline would stall
+    the event loop on every cache miss.
 
     Args:
         lexicon_id: The lexicon ID to load terms from
         db: Database session
 
     Returns:
-        Dictionary mapping terms to their replacements
+        Read-only mapping of terms to their replacements
     """
-    terms = db.query(LexiconTerm).filter(
+    return await run_in_threadpool(load_lexicon_sync, lexicon_id, db)
+
+
+def _ttl(base: int) -> int:
+    """Apply +/-10% jitter to a TTL so entries written together don't expire together."""
+    return base + random.randint(-base // 10, base // 10)
+
+
+def _zstd_context() -> threading.local:
+    """Return this thread's zstd compressor and decompressor."""
+    if not hasattr(_zstd_contexts, 'compressor'):
+        _zstd_contexts.compressor = zstandard.ZstdCompressor(level=3)
+        _zstd_contexts.decompressor = zstandard.ZstdDecompressor()
+    return _zstd_contexts
+
+
+def _encode_cache_payload(payload: Any) -> bytes:
+    """Serialize a payload with orjson, compressing it if it is large."""
+    blob = orjson.dumps(payload)
+    if len(blob) > CACHE_COMPRESSION_THRESHOLD_BYTES:
+        return _zstd_context().compressor.compress(blob)
+    return blob
+
+
+def _decode_cache_payload(blob: bytes) -> Any:
+    """Inverse of _encode_cache_payload."""
+    if blob.startswith(_ZSTD_MAGIC):
+        blob = _zstd_context().decompressor.decompress(blob)
+    return orjson.loads(blob)
+
+
+def _cache_available() -> bool:
+    """Whether the cache circuit breaker currently allows Redis calls."""
+    return time.monotonic() >= _cache_down_until
+
+
+def _record_cache_success() -> None:
+    """Reset the consecutive failure count after a successful Redis call."""
+    global _cache_failures
+    if _cache_failures:
+        with _cache_breaker_lock:
+            _cache_failures = 0
+
+
+def _record_cache_failure(action: str, error: redis.RedisError) -> None:
+    """Log a failed Redis call and open the breaker once failures reach the threshold."""
+    global _cache_failures, _cache_down_until
+    logger.warning(f"Lexicon cache {action} failed: {str(error)}")
+    with _cache_breaker_lock:
+        _cache_failures += 1
+        if _cache_failures < CACHE_FAILURE_THRESHOLD:
+            return
+        _cache_failures = 0
+        _cache_down_until = time.monotonic() + CACHE_COOLDOWN_SECONDS
+    logger.error(
+        f"Lexicon cache unavailable after {CACHE_FAILURE_THRESHOLD} consecutive errors; "
+        f"skipping Redis for {CACHE_COOLDOWN_SECONDS:.0f}s"
+    )
+
+
+def _cache_call(action: str, command: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a best-effort Redis command through the circuit breaker.
+
+    Returns the command's result, or None if the breaker is open or the
+    command raised a Redis error.
+    """
+    if not _cache_available():
+        return None
+    try:
+        result = command(*args, **kwargs)
+    except redis.RedisError as e:
+        _record_cache_failure(action, e)
+        return None
+    _record_cache_success()
+    return result
+
+
+def _local_get(cache_key: str) -> Any:
+    """Return an entry from the in-process cache, or None."""
+    with _local_cache_lock:
+        return _local_cache.get(cache_key)
+
+
+def _local_set(cache_key: str, value: Any) -> None:
+    """Store an entry in the in-process cache."""
+    with _local_cache_lock:
+        _local_cache[cache_key] = value
+
+
+def _evict_local(message: str) -> None:
+    """Apply an invalidation message (a lexicon ID or "*") to the in-process cache."""
+    with _local_cache_lock:
+        if message == _INVALIDATE_ALL_MESSAGE:
+            _local_cache.clear()
+        else:
+            _local_cache.pop(CACHE_KEY_LEXICON_TERMS_PREFIX + message, None)
+    # Numeral strategies come from term metadata, so they go stale with the terms
+    invalidate_lexicon_strategy_cache(None if message == _INVALIDATE_ALL_MESSAGE else message)
+
+
+def clear_local_lexicon_cache() -> None:
+    """Remove all lexicon data cached in this process."""
+    with _local_cache_lock:
+        _local_cache.clear()
+    invalidate_lexicon_strategy_cache()
+
+
+def invalidate_lexicon_cache(lexicon_id: str) -> None:
+    """
+    Drop cached data for a lexicon after its terms change.
+
+    Deletes the lexicon's term dictionary and notifies other workers in
+    one pipelined round-trip. Redis errors are logged and swallowed; the
+    entry expires on its own.
+
+    Args:
+        lexicon_id: The lexicon whose terms were modified
+    """
+    _evict_local(lexicon_id)
+
+    cache_key = CACHE_KEY_LEXICON_TERMS_PREFIX + lexicon_id
+    try:
+        pipe = get_redis_binary_client().pipeline(transaction=False)
+        pipe.delete(cache_key)
+        pipe.srem(CACHE_KEY_LEXICON_INDEX, cache_key)
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, lexicon_id)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Failed to invalidate cache for lexicon '{lexicon_id}': {str(e)}")
+
+
+def _mark_lexicon_modified(session: Session, lexicon_id: str) -> None:
+    """Record that a lexicon's terms changed in the session's transaction."""
+    session.info.setdefault(_DIRTY_LEXICONS_KEY, set()).add(lexicon_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_modified_lexicons(session: Session, flush_context) -> None:
+    """Note every lexicon touched by flushed LexiconTerm inserts, updates and deletes."""
+    for instances in (session.new, session.dirty, session.deleted):
+        for instance in instances:
+            if isinstance(instance, LexiconTerm):
+                _mark_lexicon_modified(session, instance.lexicon_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_modified_lexicons(session: Session) -> None:
+    """Invalidate cached metadata for lexicons changed by the committed transaction."""
+    modified_lexicons = session.info.pop(_DIRTY_LEXICONS_KEY, ())
+    for lexicon_id in modified_lexicons:
+        invalidate_lexicon_cache(lexicon_id)
+
+    if modified_lexicons:
+        bind = session.get_bind()
+        if bind.dialect.name == "postgresql":
+            _schedule_lexicon_summary_refresh(bind, modified_lexicons)
+
+
+def refresh_lexicon_summary(engine: Engine) -> None:
+    """
+    Recompute the lexicon_summary materialized view.
+
+    Runs CONCURRENTLY so readers are not blocked, then invalidates the
+    lexicons written since the refresh was scheduled, whose numeral
+    strategies may have been read from the previous contents. Other
+    lexicons' rows are unchanged, so their caches are left alone.
+
+    Args:
+        engine: Engine bound to the PostgreSQL database
+    """
+    global _summary_refresh_lexicons
+    with _summary_refresh_lock:
+        lexicon_ids, _summary_refresh_lexicons = _summary_refresh_lexicons, set()
+
+    try:
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY lexicon_summary")
+            )
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to refresh lexicon summary: {str(e)}")
+        return
+
+    for lexicon_id in lexicon_ids:
+        invalidate_lexicon_cache(lexicon_id)
+
+
+def _schedule_lexicon_summary_refresh(engine: Engine, lexicon_ids: Iterable[str]) -> None:
+    """Refresh the summary view shortly, coalescing writes that land in the meantime."""
+    with _summary_refresh_lock:
+        already_pending = bool(_summary_refresh_lexicons)
+        _summary_refresh_lexicons.update(lexicon_ids)
+        if already_pending or not _summary_refresh_lexicons:
+            return
+
+    timer = threading.Timer(
+        LEXICON_SUMMARY_REFRESH_DELAY_SECONDS,
+        refresh_lexicon_summary,
+        args=(engine,)
+    )
+    timer.daemon = True
+    timer.start()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_modified_lexicons(session: Session) -> None:
+    """Forget pending lexicon changes; nothing reached the database."""
+    session.info.pop(_DIRTY_LEXICONS_KEY, None)
+
+
+def invalidate_all_lexicon_caches() -> None:
+    """
+    Drop every cached lexicon entry.
+
+    Term dictionary keys are read from the lexicons:index set rather than
+    found with SCAN, so the cost depends on the number of cached lexicons,
+    not the size of the Redis keyspace.
+    """
+    clear_local_lexicon_cache()
+
+    try:
+        cache = get_redis_binary_client()
+        cache_keys = cache.smembers(CACHE_KEY_LEXICON_INDEX)
+        pipe = cache.pipeline(transaction=False)
+        pipe.delete(*cache_keys, CACHE_KEY_LEXICON_INDEX)
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, _INVALIDATE_ALL_MESSAGE)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Failed to invalidate lexicon caches: {str(e)}")
+
+
+def _listen_for_invalidations(stop_event: threading.Event) -> None:
+    """Evict in-process entries for invalidations published by any worker."""
+    while not stop_event.is_set():
+        pubsub = get_redis_binary_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            # Anything published while unsubscribed was missed
+            clear_local_lexicon_cache()
+            while not stop_event.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    _evict_local(message['data'].decode('utf-8'))
+        except redis.RedisError as e:
+            logger.warning(f"Lexicon invalidation listener disconnected: {str(e)}")
+            clear_local_lexicon_cache()
+            stop_event.wait(5)
+        finally:
+            pubsub.close()
+
+
+def start_lexicon_invalidation_listener() -> threading.Event:
+    """
+    Start the background thread that keeps this worker's local cache coherent.
+
+    Returns:
+        Event that stops the listener when set
+    """
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=_listen_for_invalidations,
+        args=(stop_event,),
+        name="lexicon-cache-invalidation",
+        daemon=True
+    )
+    thread.start()
+    return stop_event
+
+
+def query_lexicon_numeral_strategies(db: Session) -> Dict[str, str]:
+    """
+    Load the numeral strategy override of every lexicon that has one.
+
+    On PostgreSQL this reads the lexicon_summary materialized view, which
+    keeps the smallest numeral_strategy found in any active term's
+    metadata. Other databases read the active terms' metadata and reduce
+    it the same way.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mapping of lexicon ID to numeral strategy
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = select(_lexicon_summary.c.lexicon_id, _lexicon_summary.c.numeral_strategy).where(
+            _lexicon_summary.c.numeral_strategy.isnot(None)
+        )
+        return dict(db.execute(stmt).all())
+
+    strategies: Dict[str, str] = {}
+    rows = db.query(LexiconTerm.lexicon_id, LexiconTerm.term_metadata).filter(
+        LexiconTerm.is_active == True,
+        LexiconTerm.term_metadata.isnot(None)
+    )
+    for lexicon_id, term_metadata in rows:
+        strategy = term_metadata.get('numeral_strategy') if isinstance(term_metadata, dict) else None
+        if strategy and (lexicon_id not in strategies or strategy < strategies[lexicon_id]):
+            strategies[lexicon_id] = strategy
+    return strategies
+
+
+def encode_terms_cursor(cursor: Tuple[str, int]) -> str:
+    """
+    Encode a (term, id) keyset position as an opaque URL-safe token.
+
+    Args:
+        cursor: Tuple of (term, id) of the last row on a page
+
+    Returns:
+        Base64-encoded JSON cursor string
+    """
+    payload = json.dumps(list(cursor), ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_terms_cursor(token: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_terms_cursor.
+
+    Args:
+        token: Opaque cursor string from a previous page
+
+    Returns:
+        Tuple of (term, id)
+
+    Raises:
+        ValueError: If the token is not a valid cursor
+    """
+    try:
+        term, term_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+    if not isinstance(term, str) or not isinstance(term_id, int):
+        raise ValueError(f"Invalid cursor: {token}")
+
+    return term, term_id
+
+
+def get_terms_cursor(
+    db: Session,
+    lexicon_id: str,
+    cursor: Optional[Tuple[str, int]],
+    limit: int
+) -> Tuple[List[LexiconTerm], Optional[Tuple[str, int]]]:
+    """
+    Fetch a page of active terms using keyset pagination.
+
+    Rows are ordered by (term, id) and the page starts strictly after the
+    cursor, so the cost is an index range seek regardless of page depth.
+
+    Args:
+        db: Database session
+        lexicon_id: The lexicon ID to list terms from
+        cursor: (term, id) of the last row of the previous page, or None
+            for the first page
+        limit: Maximum number of terms to return
+
+    Returns:
+        Tuple of (terms, next_cursor); next_cursor is None on the last page
+    """
+    query = db.query(LexiconTerm).filter(
         LexiconTerm.lexicon_id == lexicon_id,
         LexiconTerm.is_active == True
-    ).all()
+    )
+    if cursor is not None:
+        query = query.filter(tuple_(LexiconTerm.term, LexiconTerm.id) > tuple_(*cursor))
+
+    # Fetch one extra row to find out whether another page exists
+    terms = query.order_by(LexiconTerm.term, LexiconTerm.id).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(terms) > limit:
+        terms = terms[:limit]
+        last = terms[-1]
+        next_cursor = (last.term, last.id)
+
+    return terms, next_cursor
+
+
+def get_term_by_id(db: Session, lexicon_id: str, term_id: int) -> Optional[LexiconTerm]:
+    """
+    Load a term by primary key, checking that it belongs to the lexicon.
+
+    Uses the session identity map, so a term already loaded in this
+    session is returned without another SELECT.
+
+    Args:
+        db: Database session
+        lexicon_id: The lexicon the term must belong to
+        term_id: Primary key of the term
+
+    Returns:
+        The LexiconTerm, or None if it doesn't exist in this lexicon
+    """
+    term = db.get(LexiconTerm, term_id)
+    if term is None or term.lexicon_id != lexicon_id:
+        return None
+    return term
+
+
+def update_term(
+    db: Session,
+    lexicon_id: str,
+    term_id: int,
+    values: Dict[str, Any]
+) -> Optional[LexiconTerm]:
+    """
+    Update a term with a single UPDATE ... RETURNING and commit.
 
-    return {term.term: term.replacement for term in terms}
+    Args:
+        db: Database session
+        lexicon_id: The lexicon the term must belong to
+        term_id: Primary key of the term
+        values: Column values to set
+
+    Returns:
+        The updated LexiconTerm, or None if it doesn't exist in this lexicon
+
+    Raises:
+        IntegrityError: If the update violates a constraint (not committed)
+    """
+    stmt = (
+        update(LexiconTerm)
+        .where(LexiconTerm.id == term_id, LexiconTerm.lexicon_id == lexicon_id)
+        .values(**values)
+        .returning(LexiconTerm)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    term = db.execute(stmt).scalars().first()
+
+    if term is not None:
+        # ORM UPDATE statements bypass flush events, so flag the lexicon directly
+        _mark_lexicon_modified(db, lexicon_id)
+    db.commit()
+    return term
+
+
+def soft_delete_term(db: Session, lexicon_id: str, term_id: int) -> bool:
+    """
+    Deactivate a term with a single UPDATE and commit.
+
+    Args:
+        db: Database session
+        lexicon_id: The lexicon the term must belong to
+        term_id: Primary key of the term
+
+    Returns:
+        True if the term was found and deactivated
+    """
+    return update_term(db, lexicon_id, term_id, {'is_active': False}) is not None
 
 
 def validate_terms_for_import(
@@ -61,44 +730,62 @@ def validate_terms_for_import(
     skipped_terms = []
     seen_terms = {}  # Track terms seen in this batch (case-insensitive)
     
-    # Get existing terms for this lexicon (case-insensitive lookup)
-    existing_terms_query = db.query(LexiconTerm).filter(
-        LexiconTerm.lexicon_id == lexicon_id,
-        LexiconTerm.is_active == True
-    ).all()
+    # Normalize every incoming term once up front, as the database does
+    lowered_terms = [normalize_term(term_data['term']) for term_data in terms]
     
-    # Create case-insensitive lookup of existing terms
-    existing_terms_map = {
-        term.term.lower(): term.term 
-        for term in existing_terms_query
-    }
+    # Look up only the incoming terms that already exist in this lexicon.
+    # normalized_term is generated by the database as lower(trim(term))
+    # and is covered by the partial unique index on active terms.
+    incoming_terms = set(lowered_terms)
+    existing_terms_map = {}
+    if incoming_terms:
+        existing_terms_query = db.query(
+            LexiconTerm.normalized_term,
+            LexiconTerm.term
+        ).filter(
+            LexiconTerm.lexicon_id == lexicon_id,
+            LexiconTerm.is_active == True,
+            LexiconTerm.normalized_term.in_(incoming_terms)
+        )
+        
+        # Create case-insensitive lookup of existing terms
+        existing_terms_map = {
+            normalized_term: existing_term
+            for normalized_term, existing_term in existing_terms_query
+        }
     
-    for term_data in terms:
+    # Hoist bound methods out of the loop; imports can hold many thousands of rows
+    valid_append = valid_terms.append
+    skipped_append = skipped_terms.append
+    seen_get = seen_terms.get
+    existing_get = existing_terms_map.get
+    
+    for term_data, term_lower in zip(terms, lowered_terms):
         term = term_data['term']
-        replacement = term_data['replacement']
-        term_lower = term.lower()
         
         # Check for duplicate within import batch
-        if term_lower in seen_terms:
-            skipped_terms.append(SkippedTerm(
+        first_occurrence = seen_get(term_lower)
+        if first_occurrence is not None:
+            skipped_append(SkippedTerm(
                 term=term,
-                replacement=replacement,
-                reason=f"Duplicate term in import file (first occurrence at term: '{seen_terms[term_lower]}')"
+                replacement=term_data['replacement'],
+                reason=f"Duplicate term in import file (first occurrence at term: '{first_occurrence}')"
             ))
             continue
         
         # Check for conflict with existing terms (case-insensitive)
-        if term_lower in existing_terms_map:
-            skipped_terms.append(SkippedTerm(
+        existing_term = existing_get(term_lower)
+        if existing_term is not None:
+            skipped_append(SkippedTerm(
                 term=term,
-                replacement=replacement,
-                reason=f"Term already exists in lexicon (existing term: '{existing_terms_map[term_lower]}')"
+                replacement=term_data['replacement'],
+                reason=f"Term already exists in lexicon (existing term: '{existing_term}')"
             ))
             continue
         
         # Term is valid
         seen_terms[term_lower] = term
-        valid_terms.append(term_data)
+        valid_append(term_data)
     
     return valid_terms, skipped_terms
 
@@ -111,40 +798,48 @@ def import_terms_to_database(
     """
     Import validated terms into the database using an atomic transaction.
     
+    Rows are written through a Core executemany INSERT ... ON CONFLICT DO
+    NOTHING, so terms that already exist (same lexicon and normalized term)
+    are skipped by the database rather than failing the whole import.
+    
     Args:
         lexicon_id: The lexicon ID to import terms into
         terms: List of validated term dictionaries
         db: Database session
         
     Returns:
-        Number of terms successfully imported
+        Number of terms actually inserted
         
     Raises:
         Exception: If database transaction fails (will rollback automatically)
     """
+    if not terms:
+        return 0
+    
     try:
-        # Create LexiconTerm objects
-        lexicon_terms = []
         current_time = datetime.utcnow()
+        rows = [
+            {
+                'lexicon_id': lexicon_id,
+                'term': term_data['term'],
+                'replacement': term_data['replacement'],
+                'is_active': True,
+                'created_at': current_time,
+                'updated_at': current_time,
+            }
+            for term_data in terms
+        ]
         
-        for term_data in terms:
-            lexicon_term = LexiconTerm(
-                lexicon_id=lexicon_id,
-                term=term_data['term'],
-                normalized_term=term_data['term'].lower(),
-                replacement=term_data['replacement'],
-                is_active=True,
-                created_at=current_time,
-                updated_at=current_time
-            )
-            lexicon_terms.append(lexicon_term)
+        inserted_ids = db.execute(_IMPORT_TERMS_STMT, rows).all()
         
-        # Bulk insert all terms
-        db.bulk_save_objects(lexicon_terms)
+        # Core inserts bypass ORM flush events, so flag the lexicon directly
+        if inserted_ids:
+            _mark_lexicon_modified(db, lexicon_id)
         db.commit()
         
-        logger.info(f"Successfully imported {len(lexicon_terms)} terms to lexicon '{lexicon_id}'")
-        return len(lexicon_terms)
+        imported_count = len(inserted_ids)
+        logger.info(f"Successfully imported {imported_count} terms to lexicon '{lexicon_id}'")
+        return imported_count
         
     except Exception as e:
         db.rollback()
@@ -155,34 +850,37 @@ def import_terms_to_database(
 def export_terms_from_database(
     lexicon_id: str,
     db: Session
-) -> List[Dict[str, str]]:
+) -> Iterator[Dict[str, str]]:
     """
     Export all active terms for a given lexicon from the database.
     
+    Rows are streamed from the database in batches, so the caller can write
+    them out without materializing the whole lexicon.
+    
     Args:
         lexicon_id: The lexicon ID to export terms from
         db: Database session
         
-    Returns:
-        List of dictionaries with 'term' and 'replacement' keys
+    Yields:
+        Dictionaries with 'term' and 'replacement' keys
     """
-    # Query all active terms for this lexicon
-    terms = db.query(LexiconTerm).filter(
-        LexiconTerm.lexicon_id == lexicon_id,
-        LexiconTerm.is_active == True
-    ).order_by(LexiconTerm.term).all()
+    # Query only the exported columns for all active terms in this lexicon
+    rows = db.execute(
+        select(LexiconTerm.term, LexiconTerm.replacement).where(
+            LexiconTerm.lexicon_id == lexicon_id,
+            LexiconTerm.is_active == True
+        ).order_by(LexiconTerm.term)
+    ).yield_per(1000)
     
-    # Convert to list of dictionaries
-    exported_terms = [
-        {
-            'term': term.term,
-            'replacement': term.replacement
+    exported_count = 0
+    for row in rows:
+        exported_count += 1
+        yield {
+            'term': row.term,
+            'replacement': row.replacement
         }
-        for term in terms
-    ]
     
-    logger.info(f"Exported {len(exported_terms)} terms from lexicon '{lexicon_id}'")
-    return exported_terms
+    logger.info(f"Exported {exported_count} terms from lexicon '{lexicon_id}'")
 
 
 def build_whisper_prompt_from_lexicon(lexicon_id: str, db: Session, max_length: int = 224) -> str:
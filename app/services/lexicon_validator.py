@@ -12,14 +12,23 @@ Validation Rules:
 """
 
 import logging
+from bisect import bisect_right
 from typing import List, Dict, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 
-from app.models.lexicon import LexiconTerm
+from app.models.lexicon import LexiconTerm, normalize_term
 
 logger = logging.getLogger(__name__)
 
+# pyahocorasick is a C extension; without it, conflict detection falls back
+# to checking each distinct existing term against the candidate
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on the install
+    ahocorasick = None
+    logger.warning("pyahocorasick is not installed; lexicon conflict detection will scan terms one by one")
+
 # Validation constants
 MIN_TERM_LENGTH = 1
 MAX_TERM_LENGTH = 200
@@ -119,29 +128,35 @@ def validate_format(term: str, replacement: str) -> ValidationResult:
     """
     result = ValidationResult()
     
+    # Strip each value once
+    term_stripped = term.strip() if term else ""
+    term_length = len(term_stripped)
+    replacement_stripped = replacement.strip() if replacement else ""
+    replacement_length = len(replacement_stripped)
+    
     # Check term
-    if not term or not term.strip():
+    if not term_stripped:
         result.add_error("term", "empty_or_whitespace", term)
-    elif len(term.strip()) < MIN_TERM_LENGTH:
+    elif term_length < MIN_TERM_LENGTH:
         result.add_error("term", "too_short", term, min_length=MIN_TERM_LENGTH)
-    elif len(term.strip()) > MAX_TERM_LENGTH:
-        result.add_error("term", "too_long", term, max_length=MAX_TERM_LENGTH, actual_length=len(term.strip()))
+    elif term_length > MAX_TERM_LENGTH:
+        result.add_error("term", "too_long", term, max_length=MAX_TERM_LENGTH, actual_length=term_length)
     
     # Check for excessive whitespace
-    if term and term != term.strip():
+    if term and term != term_stripped:
         result.add_warning("term", "leading_or_trailing_whitespace", term)
     
     # Check replacement
-    if not replacement or not replacement.strip():
+    if not replacement_stripped:
         result.add_error("replacement", "empty_or_whitespace", replacement)
-    elif len(replacement.strip()) < MIN_REPLACEMENT_LENGTH:
+    elif replacement_length < MIN_REPLACEMENT_LENGTH:
         result.add_error("replacement", "too_short", replacement, min_length=MIN_REPLACEMENT_LENGTH)
-    elif len(replacement.strip()) > MAX_REPLACEMENT_LENGTH:
+    elif replacement_length > MAX_REPLACEMENT_LENGTH:
         result.add_error("replacement", "too_long", replacement, 
-                        max_length=MAX_REPLACEMENT_LENGTH, actual_length=len(replacement.strip()))
+                        max_length=MAX_REPLACEMENT_LENGTH, actual_length=replacement_length)
     
     # Check for excessive whitespace
-    if replacement and replacement != replacement.strip():
+    if replacement and replacement != replacement_stripped:
         result.add_warning("replacement", "leading_or_trailing_whitespace", replacement)
     
     return result
@@ -151,7 +166,8 @@ def validate_uniqueness(
     db: Session,
     lexicon_id: str,
     term: str,
-    exclude_term_id: Optional[int] = None
+    exclude_term_id: Optional[int] = None,
+    normalized_term: Optional[str] = None
 ) -> ValidationResult:
     """
     Validate term uniqueness within a lexicon (case-insensitive).
@@ -161,18 +177,20 @@ def validate_uniqueness(
         lexicon_id: The lexicon identifier
         term: The term to check
         exclude_term_id: Optional term ID to exclude (for updates)
+        normalized_term: normalize_term(term), if already computed
     
     Returns:
         ValidationResult with uniqueness errors if duplicate found
     """
     result = ValidationResult()
     
-    if not term or not term.strip():
+    if normalized_term is None:
+        normalized_term = normalize_term(term) if term else ""
+    
+    if not normalized_term:
         # Format validation will catch this
         return result
     
-    normalized_term = term.lower().strip()
-    
     # Query for existing term
     query = db.query(LexiconTerm).filter(
         LexiconTerm.lexicon_id == lexicon_id,
@@ -186,24 +204,121 @@ def validate_uniqueness(
     existing_term = query.first()
     
     if existing_term:
-        result.add_error(
-            "term",
-            "duplicate",
-            term,
-            existing_term_id=existing_term.id,
-            existing_term=existing_term.term,
-            message=f"Term '{term}' already exists in lexicon '{lexicon_id}'"
-        )
+        _add_duplicate_error(result, lexicon_id, term, existing_term)
     
     return result
 
 
+def _add_duplicate_error(result: ValidationResult, lexicon_id: str, term: str, existing_term) -> None:
+    """Record that term duplicates an existing active term."""
+    result.add_error(
+        "term",
+        "duplicate",
+        term,
+        existing_term_id=existing_term.id,
+        existing_term=existing_term.term,
+        message=f"Term '{term}' already exists in lexicon '{lexicon_id}'"
+    )
+
+
+def _load_active_terms(db: Session, lexicon_id: str, exclude_term_id: Optional[int] = None) -> List:
+    """
+    Load the columns the validators need for every active term in a lexicon.
+    
+    Returns rows with id, term, normalized_term and replacement attributes.
+    """
+    query = db.query(
+        LexiconTerm.id,
+        LexiconTerm.term,
+        LexiconTerm.normalized_term,
+        LexiconTerm.replacement
+    ).filter(
+        LexiconTerm.lexicon_id == lexicon_id,
+        LexiconTerm.is_active == True
+    )
+    
+    if exclude_term_id:
+        query = query.filter(LexiconTerm.id != exclude_term_id)
+    
+    return query.all()
+
+
+class _ConflictIndex:
+    """
+    Substring index over a lexicon's active terms for conflict detection.
+    
+    Existing terms contained in a candidate are found with one pass of an
+    Aho-Corasick automaton over the candidate, or with an 'in' check per
+    distinct term when pyahocorasick isn't installed. Existing terms containing
+    the candidate are found with str.find over all normalized terms joined
+    by NUL, which never occurs in a term. Both replace a Python-level
+    comparison against every existing term.
+    """
+    
+    _SEPARATOR = "\x00"
+    
+    def __init__(self, all_terms: List):
+        self.all_terms = all_terms
+        
+        positions_by_term: Dict[str, List[int]] = {}
+        for position, t in enumerate(all_terms):
+            positions_by_term.setdefault(t.normalized_term, []).append(position)
+        
+        self._positions_by_term = positions_by_term
+        self._automaton = None
+        if positions_by_term and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for normalized, positions in positions_by_term.items():
+                self._automaton.add_word(normalized, positions)
+            self._automaton.make_automaton()
+        
+        self._haystack = self._SEPARATOR.join(t.normalized_term for t in all_terms)
+        self._starts: List[int] = []
+        offset = 0
+        for t in all_terms:
+            self._starts.append(offset)
+            offset += len(t.normalized_term) + len(self._SEPARATOR)
+    
+    def contained_in(self, normalized_term: str) -> Set[int]:
+        """Positions of existing terms that occur inside normalized_term."""
+        if self._automaton is None:
+            return {
+                position
+                for existing, positions in self._positions_by_term.items()
+                if existing in normalized_term
+                for position in positions
+            }
+        return {
+            position
+            for _, positions in self._automaton.iter(normalized_term)
+            for position in positions
+        }
+    
+    def containing(self, normalized_term: str) -> Set[int]:
+        """Positions of existing terms that normalized_term occurs inside."""
+        found: Set[int] = set()
+        index = self._haystack.find(normalized_term)
+        while index != -1:
+            position = bisect_right(self._starts, index) - 1
+            found.add(position)
+            if position + 1 == len(self._starts):
+                break
+            index = self._haystack.find(normalized_term, self._starts[position + 1])
+        return found
+
+
+def _build_replacement_graph(all_terms: List) -> Dict[str, str]:
+    """Map each normalized term to its normalized replacement."""
+    return {t.normalized_term: normalize_term(t.replacement) for t in all_terms}
+
+
 def detect_circular_replacements(
     db: Session,
     lexicon_id: str,
     term: str,
     replacement: str,
-    exclude_term_id: Optional[int] = None
+    exclude_term_id: Optional[int] = None,
+    normalized_term: Optional[str] = None
 ) -> ValidationResult:
     """
     Detect circular replacement chains.
@@ -218,6 +333,7 @@ def detect_circular_replacements(
         term: The term being validated
         replacement: The replacement for the term
         exclude_term_id: Optional term ID to exclude (for updates)
+        normalized_term: normalize_term(term), if already computed
     
     Returns:
         ValidationResult with circular reference errors if cycle detected
@@ -227,9 +343,45 @@ def detect_circular_replacements(
     if not term or not replacement:
         return result
     
-    # Normalize for comparison
-    normalized_term = term.lower().strip()
-    normalized_replacement = replacement.lower().strip()
+    if normalized_term is None:
+        normalized_term = normalize_term(term)
+    
+    all_terms = _load_active_terms(db, lexicon_id, exclude_term_id)
+    
+    return _detect_circular(
+        term,
+        replacement,
+        normalized_term,
+        normalize_term(replacement),
+        all_terms,
+        _build_replacement_graph(all_terms)
+    )
+
+
+def _detect_circular(
+    term: str,
+    replacement: str,
+    normalized_term: str,
+    normalized_replacement: str,
+    all_terms: List,
+    replacement_graph: Dict[str, str]
+) -> ValidationResult:
+    """
+    Check a term for circular replacement chains against preloaded terms.
+    
+    Args:
+        term: The term being validated
+        replacement: The replacement for the term
+        normalized_term: normalize_term(term)
+        normalized_replacement: normalize_term(replacement)
+        all_terms: Active term rows, used to display the chain
+        replacement_graph: Normalized term -> normalized replacement for
+            the other terms; not modified
+    
+    Returns:
+        ValidationResult with circular reference errors if cycle detected
+    """
+    result = ValidationResult()
     
     # Quick check: term and replacement are the same (self-reference)
     if normalized_term == normalized_replacement:
@@ -242,63 +394,27 @@ def detect_circular_replacements(
         )
         return result
     
-    # Build a map of all active terms and their replacements in this lexicon
-    query = db.query(LexiconTerm).filter(
-        LexiconTerm.lexicon_id == lexicon_id,
-        LexiconTerm.is_active == True
-    )
-    
-    if exclude_term_id:
-        query = query.filter(LexiconTerm.id != exclude_term_id)
-    
-    all_terms = query.all()
-    
-    # Create replacement graph: term -> replacement (normalized)
-    replacement_graph: Dict[str, str] = {}
-    for t in all_terms:
-        replacement_graph[t.normalized_term] = t.replacement.lower().strip()
-    
-    # Add the term being validated to the graph
-    replacement_graph[normalized_term] = normalized_replacement
-    
-    # Detect cycles using DFS
-    def find_cycle(start: str, current: str, path: List[str], visited: Set[str]) -> Optional[List[str]]:
-        """
-        Find a cycle starting from 'start' node.
-        
-        Args:
-            start: The starting node
-            current: Current node in traversal
-            path: Current path taken
-            visited: Set of visited nodes in current path
-        
-        Returns:
-            The cycle path if found, None otherwise
-        """
-        if current in visited:
-            # Found a cycle
-            if current == start:
-                return path + [current]
-            return None
-        
-        if current not in replacement_graph:
+    # Every node has at most one outgoing edge, so a cycle through the new
+    # term is found by following replacements until the chain ends,
+    # returns to the start, or reaches a node already seen
+    cycle: Optional[List[str]] = None
+    path: List[str] = []
+    visited: Set[str] = set()
+    current = normalized_term
+    while current not in visited:
+        if current == normalized_term:
+            next_node = normalized_replacement
+        else:
+            next_node = replacement_graph.get(current)
+        if next_node is None:
             # Dead end, no replacement for this term
-            return None
-        
-        next_node = replacement_graph[current]
-        
-        # Check if next node creates a cycle back to start
-        if next_node == start:
-            return path + [current, next_node]
-        
-        # Continue searching
+            break
+        path.append(current)
+        if next_node == normalized_term:
+            cycle = path + [next_node]
+            break
         visited.add(current)
-        cycle = find_cycle(start, next_node, path + [current], visited.copy())
-        
-        return cycle
-    
-    # Check for cycle starting from our new term
-    cycle = find_cycle(normalized_term, normalized_term, [], set())
+        current = next_node
     
     if cycle:
         # Convert back to original case for display
@@ -315,7 +431,7 @@ def detect_circular_replacements(
                     if t.normalized_term == normalized:
                         original = t.term
                         break
-                    if t.replacement.lower().strip() == normalized:
+                    if normalize_term(t.replacement) == normalized:
                         original = t.replacement
                         break
             
@@ -339,7 +455,8 @@ def detect_conflicts(
     db: Session,
     lexicon_id: str,
     term: str,
-    exclude_term_id: Optional[int] = None
+    exclude_term_id: Optional[int] = None,
+    normalized_term: Optional[str] = None
 ) -> ValidationResult:
     """
     Detect overlapping/conflicting terms within a lexicon.
@@ -353,30 +470,46 @@ def detect_conflicts(
         lexicon_id: The lexicon identifier
         term: The term being validated
         exclude_term_id: Optional term ID to exclude (for updates)
+        normalized_term: normalize_term(term), if already computed
     
     Returns:
         ValidationResult with conflict warnings
     """
     result = ValidationResult()
     
-    if not term or not term.strip():
-        return result
+    if normalized_term is None:
+        normalized_term = normalize_term(term) if term else ""
     
-    normalized_term = term.lower().strip()
+    if not normalized_term:
+        return result
     
-    # Get all active terms in this lexicon
-    query = db.query(LexiconTerm).filter(
-        LexiconTerm.lexicon_id == lexicon_id,
-        LexiconTerm.is_active == True
+    return _detect_conflicts(
+        term,
+        normalized_term,
+        _ConflictIndex(_load_active_terms(db, lexicon_id, exclude_term_id))
     )
+
+
+def _detect_conflicts(term: str, normalized_term: str, conflict_index: _ConflictIndex) -> ValidationResult:
+    """
+    Check a term for substring overlaps with preloaded active terms.
     
-    if exclude_term_id:
-        query = query.filter(LexiconTerm.id != exclude_term_id)
+    Args:
+        term: The term being validated
+        normalized_term: normalize_term(term)
+        conflict_index: Substring index over the active terms
+    
+    Returns:
+        ValidationResult with conflict warnings
+    """
+    result = ValidationResult()
     
-    all_terms = query.all()
+    contained = conflict_index.contained_in(normalized_term)
+    containing = conflict_index.containing(normalized_term)
     
-    # Check for substring conflicts
-    for existing_term in all_terms:
+    # Report in the existing terms' order
+    for position in sorted(contained | containing):
+        existing_term = conflict_index.all_terms[position]
         existing_normalized = existing_term.normalized_term
         
         # Skip if it's the exact same term (handled by uniqueness check)
@@ -384,7 +517,7 @@ def detect_conflicts(
             continue
         
         # Check if new term contains existing term
-        if existing_normalized in normalized_term:
+        if position in contained:
             # The new term contains an existing term
             result.add_warning(
                 "term",
@@ -396,7 +529,7 @@ def detect_conflicts(
             )
         
         # Check if existing term contains new term
-        elif normalized_term in existing_normalized:
+        else:
             # An existing term contains the new term
             result.add_warning(
                 "term",
@@ -449,19 +582,23 @@ def validate_term(
     if not format_result.is_valid:
         return combined_result
     
+    normalized_term = normalize_term(term)
+    
     # 2. Uniqueness validation
-    uniqueness_result = validate_uniqueness(db, lexicon_id, term, exclude_term_id)
+    uniqueness_result = validate_uniqueness(db, lexicon_id, term, exclude_term_id, normalized_term)
     combined_result.errors.extend(uniqueness_result.errors)
     combined_result.warnings.extend(uniqueness_result.warnings)
     
     # 3. Circular replacement detection
-    circular_result = detect_circular_replacements(db, lexicon_id, term, replacement, exclude_term_id)
+    circular_result = detect_circular_replacements(
+        db, lexicon_id, term, replacement, exclude_term_id, normalized_term
+    )
     combined_result.errors.extend(circular_result.errors)
     combined_result.warnings.extend(circular_result.warnings)
     
     # 4. Conflict detection (warnings only)
     if check_conflicts:
-        conflict_result = detect_conflicts(db, lexicon_id, term, exclude_term_id)
+        conflict_result = detect_conflicts(db, lexicon_id, term, exclude_term_id, normalized_term)
         combined_result.warnings.extend(conflict_result.warnings)
     
     return combined_result
@@ -481,6 +618,9 @@ def validate_bulk_terms(
     - Uniqueness within the batch itself
     - Circular references within the batch
     
+    The lexicon's active terms are loaded once and every term in the
+    batch is checked against them in memory.
+    
     Args:
         db: Database session
         lexicon_id: The lexicon identifier
@@ -492,9 +632,15 @@ def validate_bulk_terms(
     """
     results: Dict[int, ValidationResult] = {}
     
+    existing_terms = _load_active_terms(db, lexicon_id)
+    existing_by_normalized = {t.normalized_term: t for t in existing_terms}
+    # Existing terms plus accepted batch terms, so cycles through
+    # earlier terms in the batch are caught too
+    replacement_graph = _build_replacement_graph(existing_terms)
+    conflict_index = _ConflictIndex(existing_terms) if check_conflicts else None
+    
     # Track normalized terms in this batch
     batch_terms: Set[str] = set()
-    batch_map: Dict[str, str] = {}  # normalized_term -> normalized_replacement
     
     for idx, (term, replacement) in enumerate(terms):
         result = ValidationResult()
@@ -505,8 +651,8 @@ def validate_bulk_terms(
         result.warnings.extend(format_result.warnings)
         
         if format_result.is_valid:
-            normalized_term = term.lower().strip()
-            normalized_replacement = replacement.lower().strip()
+            normalized_term = normalize_term(term)
+            normalized_replacement = normalize_term(replacement)
             
             # Check for duplicates within the batch
             if normalized_term in batch_terms:
@@ -518,21 +664,30 @@ def validate_bulk_terms(
                 )
             else:
                 batch_terms.add(normalized_term)
-                batch_map[normalized_term] = normalized_replacement
                 
                 # Check uniqueness against database
-                uniqueness_result = validate_uniqueness(db, lexicon_id, term)
-                result.errors.extend(uniqueness_result.errors)
-                result.warnings.extend(uniqueness_result.warnings)
+                existing_term = existing_by_normalized.get(normalized_term)
+                if existing_term:
+                    _add_duplicate_error(result, lexicon_id, term, existing_term)
             
             # Check circular references (against DB + batch)
-            circular_result = detect_circular_replacements(db, lexicon_id, term, replacement)
+            circular_result = _detect_circular(
+                term,
+                replacement,
+                normalized_term,
+                normalized_replacement,
+                existing_terms,
+                replacement_graph
+            )
             result.errors.extend(circular_result.errors)
             result.warnings.extend(circular_result.warnings)
+            # Only terms that will be accepted can close a cycle later on
+            if not result.errors:
+                replacement_graph.setdefault(normalized_term, normalized_replacement)
             
             # Check conflicts
             if check_conflicts:
-                conflict_result = detect_conflicts(db, lexicon_id, term)
+                conflict_result = _detect_conflicts(term, normalized_term, conflict_index)
                 result.warnings.extend(conflict_result.warnings)
         
         results[idx] = result
@@ -14,7 +14,10 @@ Features:
 """
 
 import re
-from typing import Optional, Tuple
+import threading
+from bisect import bisect_right
+from typing import Callable, List, Optional, Tuple
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from app.utils.logging import get_logger
@@ -32,18 +35,61 @@ ENGLISH_TO_PERSIAN = {
     '5': '۵', '6': '۶', '7': '۷', '8': '۸', '9': '۹'
 }
 
+# Translation tables so each conversion is a single str.translate pass
+_P2E_TABLE = str.maketrans(PERSIAN_TO_ENGLISH)
+_E2P_TABLE = str.maketrans(ENGLISH_TO_PERSIAN)
+
+# Deletion tables for counting digits: the length difference after
+# deleting them is the count, computed in C instead of a Python loop
+_P_DELETE_TABLE = dict.fromkeys(map(ord, PERSIAN_TO_ENGLISH))
+_E_DELETE_TABLE = dict.fromkeys(map(ord, ENGLISH_TO_PERSIAN))
+
+# Presence checks so text without any digits to convert is returned as-is
+_PERSIAN_DIGIT_RE = re.compile('[۰-۹]')
+_ENGLISH_DIGIT_RE = re.compile('[0-9]')
+
+# Joins segments in process_numerals_batch. \x1f is a non-word character no
+# medical pattern consumes, so matches never span or shift segment edges
+BATCH_SEPARATOR = "\x1f" * 4
+
+# Per-lexicon numeral strategy overrides, cached in-process because they
+# change rarely and would otherwise cost a query per process_numerals call.
+# Lexicons without an override are cached too. Entries are dropped by the
+# lexicon invalidation listener, which runs in the API and in the
+# (non-forking) TranscriptionWorker, so the cache lasts across jobs.
+STRATEGY_CACHE_MAX_SIZE = 256
+STRATEGY_CACHE_TTL_SECONDS = 300
+_NO_STRATEGY = ""
+_strategy_cache: TTLCache = TTLCache(maxsize=STRATEGY_CACHE_MAX_SIZE, ttl=STRATEGY_CACHE_TTL_SECONDS)
+_strategy_cache_lock = threading.Lock()
+
 # Medical term patterns that should preserve English numerals
 MEDICAL_CODE_PATTERNS = [
     # Vertebral levels: T1-T12, L1-L5, C1-C7, S1-S5
     r'\b[TLCS]\d+(?:-[TLCS]?\d+)?\b',
     # Measurements with units: 10mg, 5cm, 3.5mm, 2.5kg
-    r'\b\d+(?:\.\d+)?(?:mg|g|kg|ml|l|cm|mm|m)\b',
+    # (units longest first, so the first alternative tried is usually the match)
+    r'\b\d+(?:\.\d+)?(?:kg|mg|ml|cm|mm|g|l|m)\b',
     # Medical codes with numbers: ICD codes, etc.
     r'\b[A-Z]\d+(?:\.\d+)?\b',
 ]
 
-# Compile medical patterns for efficiency
-COMPILED_MEDICAL_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in MEDICAL_CODE_PATTERNS]
+# One alternation over all medical patterns, so the text is scanned once and
+# matches come back in position order without overlapping
+COMPILED_MEDICAL_PATTERN = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in MEDICAL_CODE_PATTERNS),
+    re.IGNORECASE
+)
+
+
+def _count_persian_digits(text: str) -> int:
+    """Count Persian digits in text."""
+    return len(text) - len(text.translate(_P_DELETE_TABLE))
+
+
+def _count_english_digits(text: str) -> int:
+    """Count English digits in text."""
+    return len(text) - len(text.translate(_E_DELETE_TABLE))
 
 
 def persian_to_english(text: str) -> str:
@@ -56,9 +102,7 @@ def persian_to_english(text: str) -> str:
     Returns:
         Text with Persian numerals converted to English
     """
-    for persian, english in PERSIAN_TO_ENGLISH.items():
-        text = text.replace(persian, english)
-    return text
+    return text.translate(_P2E_TABLE)
 
 
 def english_to_persian(text: str) -> str:
@@ -71,9 +115,7 @@ def english_to_persian(text: str) -> str:
     Returns:
         Text with English numerals converted to Persian
     """
-    for english, persian in ENGLISH_TO_PERSIAN.items():
-        text = text.replace(english, persian)
-    return text
+    return text.translate(_E2P_TABLE)
 
 
 def detect_medical_terms(text: str) -> list:
@@ -84,35 +126,29 @@ def detect_medical_terms(text: str) -> list:
         text: Text to scan for medical terms
         
     Returns:
-        List of (start, end, matched_text) tuples for medical terms
+        List of non-overlapping (start, end, matched_text) tuples for medical
+        terms, in position order
     """
-    medical_terms = []
-    
-    for pattern in COMPILED_MEDICAL_PATTERNS:
-        for match in pattern.finditer(text):
-            medical_terms.append((match.start(), match.end(), match.group()))
-    
-    # Sort by position
-    medical_terms.sort(key=lambda x: x[0])
-    
-    return medical_terms
+    return [(match.start(), match.end(), match.group()) for match in COMPILED_MEDICAL_PATTERN.finditer(text)]
 
 
 def is_position_in_medical_term(position: int, medical_terms: list) -> bool:
     """
     Check if a position in text is within a medical term.
     
+    Binary-searches the terms, which detect_medical_terms returns sorted
+    and non-overlapping.
+    
     Args:
         position: Character position in text
-        medical_terms: List of (start, end, text) tuples
+        medical_terms: Sorted, non-overlapping list of (start, end, text) tuples
         
     Returns:
         True if position is within any medical term
     """
-    for start, end, _ in medical_terms:
-        if start <= position < end:
-            return True
-    return False
+    # Index of the last term starting at or before position
+    index = bisect_right(medical_terms, (position, float('inf'))) - 1
+    return index >= 0 and position < medical_terms[index][1]
 
 
 def convert_numerals_with_preservation(text: str, converter_func, medical_terms: list) -> str:
@@ -122,34 +158,28 @@ def convert_numerals_with_preservation(text: str, converter_func, medical_terms:
     Args:
         text: Text to convert
         converter_func: Function to convert numerals (persian_to_english or english_to_persian)
-        medical_terms: List of (start, end, text) tuples for medical terms to preserve
+        medical_terms: Sorted, non-overlapping list of (start, end, text) tuples
+            for medical terms to preserve
         
     Returns:
         Text with numerals converted except in medical terms
     """
+    converted = converter_func(text)
     if not medical_terms:
         # No medical terms to preserve, convert everything
-        return converter_func(text)
+        return converted
     
-    # Build result by processing segments
+    # The converters map one character to one character, so convert the
+    # whole text once and splice the original medical terms back in
     result = []
     last_end = 0
     
     for start, end, term_text in medical_terms:
-        # Convert text before medical term
-        if start > last_end:
-            segment = text[last_end:start]
-            result.append(converter_func(segment))
-        
-        # Preserve medical term as-is
+        result.append(converted[last_end:start])
         result.append(term_text)
         last_end = end
     
-    # Convert remaining text after last medical term
-    if last_end < len(text):
-        segment = text[last_end:]
-        result.append(converter_func(segment))
-    
+    result.append(converted[last_end:])
     return ''.join(result)
 
 
@@ -163,8 +193,11 @@ def apply_english_strategy(text: str) -> Tuple[str, int]:
     Returns:
         Tuple of (processed_text, conversion_count)
     """
+    if not _PERSIAN_DIGIT_RE.search(text):
+        return text, 0
+
     # Count Persian numerals before conversion
-    persian_count = sum(1 for char in text if char in PERSIAN_TO_ENGLISH)
+    persian_count = _count_persian_digits(text)
     
     processed_text = persian_to_english(text)
     
@@ -181,8 +214,11 @@ def apply_persian_strategy(text: str) -> Tuple[str, int]:
     Returns:
         Tuple of (processed_text, conversion_count)
     """
+    if not _ENGLISH_DIGIT_RE.search(text):
+        return text, 0
+
     # Count English numerals before conversion
-    english_count = sum(1 for char in text if char in ENGLISH_TO_PERSIAN)
+    english_count = _count_english_digits(text)
     
     processed_text = english_to_persian(text)
     
@@ -204,54 +240,69 @@ def apply_context_aware_strategy(text: str) -> Tuple[str, int]:
     Returns:
         Tuple of (processed_text, conversion_count)
     """
+    # Without digits of either kind there is nothing to convert or preserve
+    if not _ENGLISH_DIGIT_RE.search(text) and not _PERSIAN_DIGIT_RE.search(text):
+        return text, 0
+    
     # First, detect all medical terms in the text
     medical_terms = detect_medical_terms(text)
     
     logger.debug(f"Detected {len(medical_terms)} medical terms to preserve: {[term[2] for term in medical_terms]}")
     
-    # Convert medical terms to English numerals (if they have Persian numerals)
-    # This ensures medical terms always use English numerals
-    processed_text = text
-    conversion_count = 0
+    # Numeral conversion is per character, so convert the whole text to
+    # Persian in one pass and count its English digits once
+    processed_text = english_to_persian(text)
+    conversion_count = _count_english_digits(text)
     
     if medical_terms:
-        # Build result preserving medical terms with English numerals
+        # Splice the medical terms back in with English numerals
         result = []
         last_end = 0
         
         for start, end, term_text in medical_terms:
-            # Convert non-medical text before this term to Persian
-            if start > last_end:
-                segment = text[last_end:start]
-                converted_segment = english_to_persian(segment)
-                conversion_count += sum(1 for c in segment if c in ENGLISH_TO_PERSIAN)
-                result.append(converted_segment)
-            
-            # Ensure medical term uses English numerals
-            english_term = persian_to_english(term_text)
-            result.append(english_term)
+            result.append(processed_text[last_end:start])
+            result.append(persian_to_english(term_text))
+            conversion_count -= _count_english_digits(term_text)
             last_end = end
         
-        # Convert remaining text after last medical term to Persian
-        if last_end < len(text):
-            segment = text[last_end:]
-            converted_segment = english_to_persian(segment)
-            conversion_count += sum(1 for c in segment if c in ENGLISH_TO_PERSIAN)
-            result.append(converted_segment)
-        
+        result.append(processed_text[last_end:])
         processed_text = ''.join(result)
-    else:
-        # No medical terms, convert all to Persian
-        processed_text = english_to_persian(text)
-        conversion_count = sum(1 for char in text if char in ENGLISH_TO_PERSIAN)
     
     return processed_text, conversion_count
 
 
+def apply_preserve_strategy(text: str) -> Tuple[str, int]:
+    """
+    Apply preserve strategy: Keep original numerals (no conversion).
+    
+    Args:
+        text: Text to process
+        
+    Returns:
+        Tuple of (text unchanged, 0)
+    """
+    return text, 0
+
+
+# Strategy name -> implementation, used by process_numerals for dispatch
+# and validation
+STRATEGY_HANDLERS = {
+    "english": apply_english_strategy,
+    "persian": apply_persian_strategy,
+    "preserve": apply_preserve_strategy,
+    "context_aware": apply_context_aware_strategy,
+}
+
+
 def get_lexicon_numeral_strategy(db: Optional[Session], lexicon_id: Optional[str]) -> Optional[str]:
     """
     Get numeral strategy from lexicon metadata.
     
+    A cache miss loads the overrides of all lexicons in one query (from
+    the lexicon summary view on PostgreSQL) and caches every one of them
+    for STRATEGY_CACHE_TTL_SECONDS. invalidate_lexicon_strategy_cache
+    drops entries early.
+    
     Args:
         db: Database session
         lexicon_id: Lexicon identifier
@@ -262,28 +313,76 @@ def get_lexicon_numeral_strategy(db: Optional[Session], lexicon_id: Optional[str
     if not db or not lexicon_id:
         return None
     
+    with _strategy_cache_lock:
+        cached = _strategy_cache.get(lexicon_id)
+    if cached is not None:
+        return cached or None
+    
     try:
-        from app.models.lexicon import LexiconTerm
-        from sqlalchemy import and_
-        
-        # Query one term from this lexicon to get metadata
-        term = db.query(LexiconTerm).filter(
-            and_(
-                LexiconTerm.lexicon_id == lexicon_id,
-                LexiconTerm.is_active == True
-            )
-        ).first()
-        
-        if term and term.metadata and isinstance(term.metadata, dict):
-            numeral_strategy = term.metadata.get('numeral_strategy')
-            if numeral_strategy:
-                logger.info(f"Lexicon '{lexicon_id}' specifies numeral strategy: '{numeral_strategy}'")
-                return numeral_strategy
+        from app.services.lexicon_service import query_lexicon_numeral_strategies
         
+        strategies = query_lexicon_numeral_strategies(db)
     except Exception as e:
         logger.warning(f"Error retrieving numeral strategy from lexicon '{lexicon_id}': {e}")
+        return None
+    
+    numeral_strategy = strategies.get(lexicon_id)
+    
+    with _strategy_cache_lock:
+        _strategy_cache.update(strategies)
+        _strategy_cache[lexicon_id] = numeral_strategy or _NO_STRATEGY
+    
+    if numeral_strategy:
+        logger.info(f"Lexicon '{lexicon_id}' specifies numeral strategy: '{numeral_strategy}'")
+    return numeral_strategy
+
+
+def invalidate_lexicon_strategy_cache(lexicon_id: Optional[str] = None) -> None:
+    """
+    Drop the cached numeral strategy for a lexicon, or for all lexicons.
+    
+    Args:
+        lexicon_id: Lexicon whose entry to drop; None clears the whole cache
+    """
+    with _strategy_cache_lock:
+        if lexicon_id is None:
+            _strategy_cache.clear()
+        else:
+            _strategy_cache.pop(lexicon_id, None)
+
+
+def _resolve_strategy(
+    strategy: str,
+    lexicon_id: Optional[str],
+    db: Optional[Session]
+) -> Tuple[str, Callable[[str], Tuple[str, int]]]:
+    """
+    Apply any lexicon override to a strategy and look up its handler.
+    
+    Args:
+        strategy: Requested numeral conversion strategy
+        lexicon_id: Optional lexicon ID for domain-specific preferences
+        db: Optional database session for loading lexicon metadata
+        
+    Returns:
+        Tuple of (effective strategy name, strategy handler)
+        
+    Raises:
+        ValueError: If the effective strategy is invalid
+    """
+    # Check for lexicon-specific strategy override
+    lexicon_strategy = get_lexicon_numeral_strategy(db, lexicon_id)
+    if lexicon_strategy:
+        strategy = lexicon_strategy
+    
+    # Validate and resolve the strategy in one lookup
+    apply_strategy = STRATEGY_HANDLERS.get(strategy)
+    if apply_strategy is None:
+        valid_strategies = list(STRATEGY_HANDLERS)
+        logger.error(f"Invalid numeral strategy '{strategy}'. Valid options: {valid_strategies}")
+        raise ValueError(f"Invalid numeral strategy '{strategy}'. Must be one of: {', '.join(valid_strategies)}")
     
-    return None
+    return strategy, apply_strategy
 
 
 def process_numerals(
@@ -320,48 +419,20 @@ def process_numerals(
     if not text:
         return text
     
-    # Check for lexicon-specific strategy override
-    lexicon_strategy = get_lexicon_numeral_strategy(db, lexicon_id)
-    if lexicon_strategy:
-        strategy = lexicon_strategy
+    strategy, apply_strategy = _resolve_strategy(strategy, lexicon_id, db)
     
     logger.info(
         f"Processing numerals with strategy '{strategy}'. "
         f"Text length: {len(text)}, Lexicon ID: {lexicon_id}"
     )
     
-    # Validate strategy
-    valid_strategies = ["english", "persian", "preserve", "context_aware"]
-    if strategy not in valid_strategies:
-        logger.error(f"Invalid numeral strategy '{strategy}'. Valid options: {valid_strategies}")
-        raise ValueError(f"Invalid numeral strategy '{strategy}'. Must be one of: {', '.join(valid_strategies)}")
-    
-    # Apply strategy
-    processed_text = text
-    conversion_count = 0
-    
     try:
-        if strategy == "preserve":
-            logger.info("Strategy 'preserve': No numeral conversion applied")
-            return text
-        
-        elif strategy == "english":
-            processed_text, conversion_count = apply_english_strategy(text)
-            logger.info(f"Strategy 'english': Converted {conversion_count} Persian numerals to English")
+        processed_text, conversion_count = apply_strategy(text)
+        logger.info(f"Strategy '{strategy}': Converted {conversion_count} numerals")
         
-        elif strategy == "persian":
-            processed_text, conversion_count = apply_persian_strategy(text)
-            logger.info(f"Strategy 'persian': Converted {conversion_count} English numerals to Persian")
-        
-        elif strategy == "context_aware":
-            processed_text, conversion_count = apply_context_aware_strategy(text)
-            logger.info(
-                f"Strategy 'context_aware': Applied context-aware conversion. "
-                f"Conversions: {conversion_count}"
-            )
-        
-        # Log if text changed
-        if processed_text != text:
+        # Log if text changed; unchanged text comes back as the same object,
+        # so the identity check skips the full comparison in the common case
+        if processed_text is not text and processed_text != text:
             logger.debug(f"Numeral conversion resulted in text changes (length: {len(text)} -> {len(processed_text)})")
         else:
             logger.debug("No numeral changes after processing")
@@ -372,3 +443,59 @@ def process_numerals(
         logger.error(f"Error processing numerals with strategy '{strategy}': {e}")
         # Return original text on error
         return text
+
+
+def process_numerals_batch(
+    texts: List[str],
+    strategy: str = "english",
+    lexicon_id: Optional[str] = None,
+    db: Optional[Session] = None
+) -> List[str]:
+    """
+    Process numerals in many texts, such as transcription segments, at once.
+    
+    Resolves the strategy once, then joins the texts with BATCH_SEPARATOR
+    so the medical-term scan and numeral conversion run once over the
+    whole batch. Results match calling process_numerals on each text.
+    
+    Args:
+        texts: Texts to process
+        strategy: Numeral conversion strategy (default: "english")
+        lexicon_id: Optional lexicon ID for domain-specific preferences
+        db: Optional database session for loading lexicon metadata
+        
+    Returns:
+        Processed texts, in the same order as the input
+        
+    Raises:
+        ValueError: If strategy is invalid
+    """
+    if not texts:
+        return list(texts)
+    
+    strategy, apply_strategy = _resolve_strategy(strategy, lexicon_id, db)
+    
+    logger.info(
+        f"Processing numerals in {len(texts)} texts with strategy '{strategy}'. "
+        f"Lexicon ID: {lexicon_id}"
+    )
+    
+    # A text containing the separator would split wrongly; process singly
+    if any(text and BATCH_SEPARATOR in text for text in texts):
+        return [process_numerals(text, strategy) for text in texts]
+    
+    try:
+        processed_text, conversion_count = apply_strategy(
+            BATCH_SEPARATOR.join(text or "" for text in texts)
+        )
+        logger.info(f"Strategy '{strategy}': Converted {conversion_count} numerals")
+    except Exception as e:
+        logger.error(f"Error processing numerals with strategy '{strategy}': {e}")
+        # Return original texts on error
+        return list(texts)
+    
+    # Empty and None texts come back as they were, like process_numerals
+    return [
+        processed if text else text
+        for text, processed in zip(texts, processed_text.split(BATCH_SEPARATOR))
+    ]
@@ -4,19 +4,66 @@ OpenAI Whisper API integration service.
 NOTE: This module is assumed to be implemented from task #34 (previous task).
 The implementation here provides the interface that the worker expects.
 """
-from typing import Optional
+import asyncio
+import atexit
+import logging
+import math
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, List, Optional, Union
 from pathlib import Path
-from io import BufferedReader
-from openai import OpenAI, APIError, RateLimitError, AuthenticationError
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 from app.config.settings import get_settings
 from app.utils.logging import get_logger
 
+# The openai package is large, so it's imported inside the functions that
+# use it rather than when the API or worker starts; this import only
+# serves the annotations.
+if TYPE_CHECKING:
+    from openai import OpenAI, AsyncOpenAI
+
 settings = get_settings()
 logger = get_logger(__name__)
 
-def get_openai_client():
-    """Get OpenAI client instance."""
-    return OpenAI(api_key=settings.OPENAI_API_KEY)
+# Shared client, so the underlying HTTP connection pool (and its TLS
+# sessions) is reused across requests instead of rebuilt per call
+_client: Optional["OpenAI"] = None
+_client_lock = threading.Lock()
+
+def get_openai_client() -> "OpenAI":
+    """
+    Get the shared OpenAI client instance.
+
+    Created once, under a lock, on first use and closed at process exit.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+
+                client = OpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+                atexit.register(client.close)
+                _client = client
+
+    return _client
+
+
+def create_async_openai_client() -> "AsyncOpenAI":
+    """
+    Create an AsyncOpenAI client for transcribe_audio_async.
+
+    Unlike the sync client this isn't shared process-wide: its pooled
+    connections belong to the event loop that opened them, and sync
+    callers may run each batch under its own asyncio.run. The caller owns
+    the client and must close it, e.g. with ``async with``.
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
 
 
 class OpenAIServiceError(Exception):
@@ -31,7 +78,160 @@ class OpenAIAPIError(OpenAIServiceError):
 
 class OpenAIQuotaError(OpenAIServiceError):
     """Raised when OpenAI API quota is exceeded (can retry later)."""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Seconds the API asked us to wait, if it said
+
+
+def _transcription_kwargs(language: Optional[str], prompt: Optional[str]) -> dict:
+    """Build the Whisper API arguments shared by the sync and async calls."""
+    kwargs = {
+        "model": getattr(settings, 'OPENAI_MODEL', 'whisper-1'),
+    }
+
+    if language:
+        kwargs["language"] = language
+    if prompt:
+        kwargs["prompt"] = prompt
+
+    return kwargs
+
+
+def _is_quota_exhausted(e: BaseException) -> bool:
+    """Whether a 429 means the account is out of quota rather than rate limited."""
+    code = getattr(e, "code", None)
+    if code is None:
+        # The SDK normally unwraps the error object, but not for every body shape
+        body = getattr(e, "body", None)
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            code = body["error"].get("code")
+    return code == "insufficient_quota"
+
+
+def _is_transient_error(e: BaseException) -> bool:
+    """Whether a failed Whisper call is worth retrying."""
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    if isinstance(e, RateLimitError):
+        # Exhausted quota won't recover within our retry window
+        return not _is_quota_exhausted(e)
+    return isinstance(e, (APIConnectionError, InternalServerError))
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a header's numeric delay, or None if it isn't a finite number."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+def _retry_after_seconds(e: BaseException) -> Optional[float]:
+    """
+    Read the Retry-After delay from a failed call's HTTP response, if any.
+
+    Accepts retry-after-ms, Retry-After in seconds, or Retry-After as an
+    HTTP date. Returns None when there is no usable value, and never a
+    negative delay.
+    """
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = _parse_seconds(headers.get("retry-after-ms"))
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    seconds = _parse_seconds(retry_after)
+    if seconds is not None:
+        return seconds
+
+    # Retry-After may also be an HTTP date
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+_backoff = wait_random_exponential(min=settings.OPENAI_RETRY_MIN_DELAY, max=settings.OPENAI_RETRY_MAX_DELAY)
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait as long as the API asked (plus jitter), else back off randomly."""
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    if retry_after is None:
+        return _backoff(retry_state)
+    # Clamped to [0, OPENAI_RETRY_MAX_DELAY], so a worker never sleeps for
+    # however long a header says; a longer Retry-After just retries early
+    return min(max(retry_after + random.uniform(0, 1), 0.0), settings.OPENAI_RETRY_MAX_DELAY)
+
+
+# Retries for transient Whisper failures, in place of the SDK's own (its
+# clients are built with max_retries=0). Rate limits wait out the API's
+# Retry-After; otherwise full jitter spreads out workers that failed
+# together instead of retrying them in lockstep.
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient_error),
+    wait=_retry_wait,
+    stop=stop_after_attempt(settings.OPENAI_MAX_RETRIES + 1),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
+@_retry_transient
+def _create_transcription(client: "OpenAI", file_path: Path, kwargs: dict) -> str:
+    """Upload one audio file to Whisper, retrying transient failures."""
+    # Pass an open file handle rather than a Path: the SDK reads a Path
+    # fully into memory, while a file object is handed to httpx, which
+    # streams the multipart body from disk in chunks. It's reopened on
+    # every attempt, since a failed upload leaves it partly consumed.
+    with file_path.open("rb") as audio_file:
+        # Call OpenAI Whisper API (new v1.0+ API)
+        response = client.audio.transcriptions.create(file=audio_file, **kwargs)
+
+    return response.text
+
+
+@_retry_transient
+async def _create_transcription_async(client: "AsyncOpenAI", file_path: Path, kwargs: dict) -> str:
+    """Upload one audio file to Whisper without blocking, retrying transient failures."""
+    # A plain file handle, as in _create_transcription: httpx streams the
+    # multipart body from it in chunks (it doesn't accept async files)
+    with file_path.open("rb") as audio_file:
+        response = await client.audio.transcriptions.create(file=audio_file, **kwargs)
+
+    return response.text
+
+
+def _transcription_error(e: Exception) -> OpenAIServiceError:
+    """Log a failed transcription and map it to a service exception."""
+    from openai import APIError, AuthenticationError, RateLimitError
+
+    if isinstance(e, RateLimitError):
+        logger.error(f"OpenAI rate limit exceeded: {str(e)}")
+        return OpenAIQuotaError(f"OpenAI quota exceeded: {str(e)}", retry_after=_retry_after_seconds(e))
+
+    if isinstance(e, APIError):
+        logger.error(f"OpenAI API error: {str(e)}")
+        return OpenAIAPIError(f"OpenAI API error: {str(e)}")
+
+    if isinstance(e, AuthenticationError):
+        logger.error(f"OpenAI authentication error: {str(e)}")
+        return OpenAIAPIError(f"OpenAI authentication failed: {str(e)}")
+
+    logger.error(f"Unexpected error during transcription: {str(e)}")
+    return OpenAIAPIError(f"Transcription failed: {str(e)}")
 
 
 def transcribe_audio(
@@ -66,27 +266,9 @@ def transcribe_audio(
         # Get OpenAI client
         client = get_openai_client()
 
-        # Open and transcribe audio file - use Path directly
-        # The OpenAI SDK handles Path objects correctly
-        kwargs = {
-            "model": getattr(settings, 'OPENAI_MODEL', 'whisper-1'),
-            "file": open(audio_file_path, "rb"),
-        }
+        kwargs = _transcription_kwargs(language, prompt)
 
-        if language:
-            kwargs["language"] = language
-        if prompt:
-            kwargs["prompt"] = prompt
-
-        # Call OpenAI Whisper API (new v1.0+ API)
-        try:
-            response = client.audio.transcriptions.create(**kwargs)
-        finally:
-            # Close the file handle
-            kwargs["file"].close()
-
-        # Extract transcription text
-        transcription = response.text
+        transcription = _create_transcription(client, file_path, kwargs)
 
         logger.info(
             f"OpenAI transcription completed successfully. "
@@ -95,18 +277,97 @@ def transcribe_audio(
 
         return transcription
 
-    except RateLimitError as e:
-        logger.error(f"OpenAI rate limit exceeded: {str(e)}")
-        raise OpenAIQuotaError(f"OpenAI quota exceeded: {str(e)}")
+    except Exception as e:
+        raise _transcription_error(e)
 
-    except APIError as e:
-        logger.error(f"OpenAI API error: {str(e)}")
-        raise OpenAIAPIError(f"OpenAI API error: {str(e)}")
 
-    except AuthenticationError as e:
-        logger.error(f"OpenAI authentication error: {str(e)}")
-        raise OpenAIAPIError(f"OpenAI authentication failed: {str(e)}")
+async def transcribe_audio_async(
+    audio_file_path: str,
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+    client: Optional["AsyncOpenAI"] = None
+) -> str:
+    """
+    Transcribe audio file using OpenAI Whisper API without blocking the event loop.
+    
+    Same behavior and errors as transcribe_audio, but awaits the upload on
+    an AsyncOpenAI client so concurrent transcriptions don't each hold a
+    thread.
+    
+    Args:
+        audio_file_path: Path to audio file to transcribe
+        language: Optional language code (e.g., 'en', 'es')
+        prompt: Optional prompt to guide transcription
+        client: Client to upload with, left open for the caller to reuse;
+            if omitted, one is created and closed for this call
+    
+    Returns:
+        Transcribed text
+    
+    Raises:
+        OpenAIAPIError: If API call fails
+        OpenAIQuotaError: If quota exceeded
+        FileNotFoundError: If audio file doesn't exist
+    """
+    # Validate file exists
+    file_path = Path(audio_file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+    
+    try:
+        logger.info(f"Starting async OpenAI transcription for file: {audio_file_path}")
+
+        kwargs = _transcription_kwargs(language, prompt)
+
+        if client is None:
+            async with create_async_openai_client() as own_client:
+                transcription = await _create_transcription_async(own_client, file_path, kwargs)
+        else:
+            transcription = await _create_transcription_async(client, file_path, kwargs)
+
+        logger.info(
+            f"Async OpenAI transcription completed successfully. "
+            f"Length: {len(transcription)} characters"
+        )
+
+        return transcription
 
     except Exception as e:
-        logger.error(f"Unexpected error during transcription: {str(e)}")
-        raise OpenAIAPIError(f"Transcription failed: {str(e)}")
+        raise _transcription_error(e)
+
+
+async def transcribe_audio_batch(
+    audio_file_paths: List[str],
+    language: Optional[str] = None,
+    prompt: Optional[str] = None
+) -> List[Union[str, Exception]]:
+    """
+    Transcribe several audio files concurrently.
+    
+    Runs transcribe_audio_async for every file, with at most
+    OPENAI_MAX_CONCURRENCY uploads in flight, so their network waits
+    overlap. The uploads share one AsyncOpenAI client, closed once the
+    batch finishes. Sync callers can drive it with asyncio.run.
+    
+    Args:
+        audio_file_paths: Paths to audio files to transcribe
+        language: Optional language code (e.g., 'en', 'es') for every file
+        prompt: Optional prompt to guide transcription of every file
+    
+    Returns:
+        One entry per path, in order: the transcribed text, or the
+        exception transcribe_audio_async raised for that file
+    """
+    semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+
+    async with create_async_openai_client() as client:
+        async def transcribe_one(audio_file_path: str) -> str:
+            async with semaphore:
+                return await transcribe_audio_async(
+                    audio_file_path, language=language, prompt=prompt, client=client
+                )
+
+        return await asyncio.gather(
+            *(transcribe_one(audio_file_path) for audio_file_path in audio_file_paths),
+            return_exceptions=True
+        )
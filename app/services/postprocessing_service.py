@@ -11,8 +11,11 @@ Comprehensive error handling and fallback strategies ensure pipeline resilience.
 The GPT cleanup step gracefully fails back to previous output on API errors.
 """
 import re
+import threading
 import traceback
-from typing import Optional, Dict, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Optional, Dict, Tuple
+from cachetools import LRUCache
 from sqlalchemy.orm import Session
 
 from rapidfuzz import fuzz
@@ -34,6 +37,76 @@ class PostProcessingError(Exception):
     pass
 
 
+class _CompiledLexicon(NamedTuple):
+    """A lexicon compiled into one regex alternation, longest terms first."""
+    pattern: "re.Pattern[str]"
+    terms: List[Tuple[str, str]]  # (term, replacement), longest first
+    lookup: Dict[str, Tuple[str, str]]  # lowercased term -> (term, replacement)
+
+
+# Compiled patterns for the read-only mappings returned by the lexicon
+# loaders, keyed by id() and holding a reference to the mapping so the id
+# can't be reused while the entry exists. Plain dicts may be mutated by
+# the caller, so they are compiled per call instead.
+COMPILED_LEXICON_CACHE_SIZE = 64
+_compiled_lexicons: LRUCache = LRUCache(maxsize=COMPILED_LEXICON_CACHE_SIZE)
+_compiled_lexicons_lock = threading.Lock()
+
+
+def _compile_lexicon(lexicon: Mapping[str, str]) -> _CompiledLexicon:
+    """
+    Build the single-pass matcher for a lexicon.
+    
+    Alternatives are tried longest first, and the word-boundary lookarounds
+    sit outside the group, so at each position the longest term that forms
+    a whole-word match wins.
+    """
+    terms = sorted(
+        ((term, replacement) for term, replacement in lexicon.items() if term),
+        key=lambda x: len(x[0]),
+        reverse=True
+    )
+    lookup: Dict[str, Tuple[str, str]] = {}
+    for term, replacement in terms:
+        lookup.setdefault(term.lower(), (term, replacement))
+    # \b doesn't work well with Unicode, so we use a more flexible pattern
+    # that handles Persian/English boundaries
+    pattern = re.compile(
+        r'(?<!\w)(?:' + '|'.join(re.escape(term) for term, _ in terms) + r')(?!\w)',
+        flags=re.IGNORECASE | re.UNICODE
+    )
+    return _CompiledLexicon(pattern, terms, lookup)
+
+
+def _get_compiled_lexicon(lexicon: Mapping[str, str]) -> _CompiledLexicon:
+    """Return the compiled matcher for a lexicon, reusing it for shared read-only mappings."""
+    if not isinstance(lexicon, MappingProxyType):
+        return _compile_lexicon(lexicon)
+    
+    with _compiled_lexicons_lock:
+        entry = _compiled_lexicons.get(id(lexicon))
+    if entry is not None and entry[0] is lexicon:
+        return entry[1]
+    
+    compiled = _compile_lexicon(lexicon)
+    with _compiled_lexicons_lock:
+        _compiled_lexicons[id(lexicon)] = (lexicon, compiled)
+    return compiled
+
+
+def _resolve_match(compiled: _CompiledLexicon, matched: str) -> Tuple[str, str]:
+    """Find the (term, replacement) a regex match came from."""
+    found = compiled.lookup.get(matched.lower())
+    if found is not None:
+        return found
+    # Case-insensitive regex matching and str.lower() disagree on a few
+    # Unicode characters; fall back to testing each term
+    for term, replacement in compiled.terms:
+        if re.fullmatch(re.escape(term), matched, flags=re.IGNORECASE | re.UNICODE):
+            return term, replacement
+    return matched, matched
+
+
 def _calculate_similarity_score(word1: str, word2: str) -> float:
     """
     Calculate similarity score between two words using token set ratio.
@@ -160,6 +233,7 @@ def apply_lexicon_corrections(
     Features:
     - Case-insensitive matching with case preservation
     - Longest-match-first to prefer longer terms
+    - Single regex pass over the text for all terms
     - Whole-word matching with word boundaries
     - Unicode-safe for Persian/English mixed text
     - Comprehensive logging for debugging
@@ -191,56 +265,49 @@ def apply_lexicon_corrections(
         return text, None
     
     try:
-        # Sort terms by length (longest first) for longest-match-first strategy
-        sorted_terms = sorted(lexicon.items(), key=lambda x: len(x[0]), reverse=True)
+        compiled = _get_compiled_lexicon(lexicon)
         logger.debug(
-            f"Processing {len(sorted_terms)} lexicon terms (longest-match-first), "
+            f"Processing {len(compiled.terms)} lexicon terms (longest-match-first), "
             f"fuzzy_matching={'enabled' if enable_fuzzy_matching else 'disabled'}"
         )
         
-        processed_text = text
         exact_replacements_made = 0
         fuzzy_replacements_made = 0
         replacement_log = []
         fuzzy_match_log = []
         
-        # Apply each term replacement with word boundary matching (case-insensitive)
-        for term, replacement in sorted_terms:
-            # Use word boundaries to prefer whole-word matches
-            # \b doesn't work well with Unicode, so we use a more flexible pattern
-            # that handles Persian/English boundaries
-            pattern = r'(?<!\w)' + re.escape(term) + r'(?!\w)'
+        # Replace every term in one pass, recording where each matched
+        match_positions: Dict[str, List[Tuple[int, int]]] = {}
+        
+        def replace_with_case_preservation(match):
+            original = match.group(0)
+            term, replacement = _resolve_match(compiled, original)
+            match_positions.setdefault(term, []).append(match.span())
+            return _preserve_case(original, replacement)
+        
+        if compiled.terms:
+            processed_text = compiled.pattern.sub(replace_with_case_preservation, text)
+        else:
+            processed_text = text
+        
+        for term, replacement in compiled.terms:
+            positions = match_positions.get(term)
+            if not positions:
+                continue
             
-            # Find all exact matches to log them
-            matches = list(re.finditer(pattern, processed_text, flags=re.IGNORECASE | re.UNICODE))
+            exact_replacements_made += len(positions)
+            replacement_log.append({
+                'term': term,
+                'replacement': replacement,
+                'count': len(positions),
+                'match_type': 'exact',
+                'positions': positions
+            })
             
-            if matches:
-                # Apply replacement with case preservation
-                def replace_with_case_preservation(match):
-                    original = match.group(0)
-                    preserved_replacement = _preserve_case(original, replacement)
-                    return preserved_replacement
-                
-                processed_text = re.sub(
-                    pattern, 
-                    replace_with_case_preservation, 
-                    processed_text, 
-                    flags=re.IGNORECASE | re.UNICODE
-                )
-                
-                exact_replacements_made += len(matches)
-                replacement_log.append({
-                    'term': term,
-                    'replacement': replacement,
-                    'count': len(matches),
-                    'match_type': 'exact',
-                    'positions': [match.span() for match in matches]
-                })
-                
-                logger.debug(
-                    f"Exact match: '{term}' → '{replacement}' "
-                    f"({len(matches)} occurrence{'s' if len(matches) > 1 else ''})"
-                )
+            logger.debug(
+                f"Exact match: '{term}' → '{replacement}' "
+                f"({len(positions)} occurrence{'s' if len(positions) > 1 else ''})"
+            )
         
         # Apply fuzzy matching if enabled
         if enable_fuzzy_matching:
@@ -256,7 +323,7 @@ def apply_lexicon_corrections(
                 seen_words.add(word.lower())
                 
                 # Skip if word is already in lexicon (exact match)
-                if any(word.lower() == term.lower() for term in lexicon.keys()):
+                if word.lower() in compiled.lookup:
                     continue
                 
                 # Try to find a fuzzy match
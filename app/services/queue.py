@@ -10,44 +10,63 @@ This module provides functions to:
 
 import os
 import logging
+import threading
 from typing import Optional, Dict, Any
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 from rq import Queue
 from rq.job import Job
 
+from app.config.settings import get_settings
+
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Configuration from environment variables
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 QUEUE_NAME = os.getenv("QUEUE_NAME", "transcription_jobs")
 DEFAULT_JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", "300"))  # 5 minutes default
 
+# Connection pool shared by every queue operation in the process, so
+# concurrent enqueue/status calls don't share a single socket. Bounded
+# like the pools in app.redis_client: when every connection is checked
+# out, callers wait for one instead of opening more.
+_redis_pool = BlockingConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=settings.REDIS_POOL_SIZE,
+    timeout=settings.HEALTH_CHECK_TIMEOUT,
+    decode_responses=True,
+    socket_keepalive=True,
+    socket_connect_timeout=5,
+    health_check_interval=30
+)
+
 # Global Redis connection and queue instances
 _redis_connection: Optional[Redis] = None
 _transcription_queue: Optional[Queue] = None
+_init_lock = threading.Lock()
 
 
 def get_redis_connection() -> Redis:
     """
     Get or create Redis connection.
     
+    The client is backed by the shared connection pool and created once,
+    under a lock, on first use.
+    
     Returns:
         Redis: Redis connection instance
     """
     global _redis_connection
     
     if _redis_connection is None:
-        logger.info(f"Connecting to Redis at {REDIS_URL}")
-        _redis_connection = Redis.from_url(
-            REDIS_URL,
-            decode_responses=True,
-            socket_keepalive=True,
-            socket_connect_timeout=5,
-            health_check_interval=30
-        )
-        # Test connection
-        _redis_connection.ping()
-        logger.info("Successfully connected to Redis")
+        with _init_lock:
+            if _redis_connection is None:
+                logger.info(f"Connecting to Redis at {REDIS_URL}")
+                connection = Redis(connection_pool=_redis_pool)
+                # Test connection
+                connection.ping()
+                _redis_connection = connection
+                logger.info("Successfully connected to Redis")
     
     return _redis_connection
 
@@ -63,16 +82,23 @@ def get_queue() -> Queue:
     
     if _transcription_queue is None:
         redis_conn = get_redis_connection()
-        _transcription_queue = Queue(
-            name=QUEUE_NAME,
-            connection=redis_conn,
-            default_timeout=DEFAULT_JOB_TIMEOUT
-        )
-        logger.info(f"Queue '{QUEUE_NAME}' initialized")
+        with _init_lock:
+            if _transcription_queue is None:
+                _transcription_queue = Queue(
+                    name=QUEUE_NAME,
+                    connection=redis_conn,
+                    default_timeout=DEFAULT_JOB_TIMEOUT
+                )
+                logger.info(f"Queue '{QUEUE_NAME}' initialized")
     
     return _transcription_queue
 
 
+def close_redis_connection() -> None:
+    """Close the queue's pooled Redis connections (called on shutdown)."""
+    _redis_pool.disconnect()
+
+
 def enqueue_transcription_job(
     job_id: str,
     audio_file_path: str,
@@ -8,7 +8,8 @@ lexicon term data.
 import csv
 import json
 import io
-from typing import List, Dict, Tuple
+import textwrap
+from typing import Dict, Iterable, Iterator, List, Tuple
 from fastapi import UploadFile, HTTPException, status
 
 
@@ -211,7 +212,35 @@ def generate_json_export(terms: List[Dict[str, str]]) -> str:
     Returns:
         JSON formatted string
     """
-    return json.dumps(terms, indent=2, ensure_ascii=False)
+    return ''.join(stream_json_export(terms))
+
+
+def stream_json_export(terms: Iterable[Dict[str, str]], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Generate a JSON array of lexicon terms in batches.
+    
+    Produces the same text as json.dumps(list(terms), indent=2,
+    ensure_ascii=False) without holding the whole document in memory.
+    
+    Args:
+        terms: Iterable of dictionaries with 'term' and 'replacement' keys
+        batch_size: Number of terms written per yielded chunk
+        
+    Yields:
+        Chunks of the JSON formatted string
+    """
+    parts = []
+    count = 0
+    for term in terms:
+        parts.append(',\n' if count else '[\n')
+        parts.append(textwrap.indent(json.dumps(term, indent=2, ensure_ascii=False), '  '))
+        count += 1
+        if count % batch_size == 0:
+            yield ''.join(parts)
+            parts.clear()
+    
+    parts.append('\n]' if count else '[]')
+    yield ''.join(parts)
 
 
 def generate_csv_export(terms: List[Dict[str, str]]) -> str:
@@ -224,8 +253,29 @@ def generate_csv_export(terms: List[Dict[str, str]]) -> str:
     Returns:
         CSV formatted string with header
     """
+    return ''.join(stream_csv_export(terms))
+
+
+def stream_csv_export(terms: Iterable[Dict[str, str]], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Generate CSV rows for lexicon terms in batches.
+    
+    Args:
+        terms: Iterable of dictionaries with 'term' and 'replacement' keys
+        batch_size: Number of rows written per yielded chunk
+        
+    Yields:
+        Chunks of the CSV formatted string, starting with the header
+    """
     output = io.StringIO()
     writer = csv.DictWriter(output, fieldnames=['term', 'replacement'])
     writer.writeheader()
-    writer.writerows(terms)
-    return output.getvalue()
+    
+    for index, term in enumerate(terms, start=1):
+        writer.writerow(term)
+        if index % batch_size == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+    
+    yield output.getvalue()
@@ -415,7 +415,8 @@ def process_transcription_job(job_id: str) -> None:
                 logging.ERROR,
                 error_msg,
                 job_id=job_id,
-                error_type="OpenAIQuotaError"
+                error_type="OpenAIQuotaError",
+                retry_after=e.retry_after
             )
             
             # Mark job as failed (could be retried later by external system)
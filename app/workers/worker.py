@@ -0,0 +1,31 @@
+"""
+RQ worker class for the transcription queue.
+
+rq's default Worker forks a child per job, so anything a job caches in
+process (lexicon terms, numeral strategies, the OpenAI client) is thrown
+away when the job ends. TranscriptionWorker runs jobs in the worker
+process itself and starts the lexicon invalidation listener, so those
+caches persist across jobs and still see edits made through the API.
+
+Run with:
+    rq worker transcription --url redis://redis:6379/0 -w app.workers.worker.TranscriptionWorker
+"""
+from rq import SimpleWorker
+
+from app.services.lexicon_service import start_lexicon_invalidation_listener
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TranscriptionWorker(SimpleWorker):
+    """Non-forking worker that keeps in-process lexicon caches coherent."""
+
+    def work(self, *args, **kwargs) -> bool:
+        """Process jobs with the lexicon invalidation listener running."""
+        stop_listener = start_lexicon_invalidation_listener()
+        logger.info("Started lexicon cache invalidation listener for worker")
+        try:
+            return super().work(*args, **kwargs)
+        finally:
+            stop_listener.set()
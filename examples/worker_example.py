@@ -139,7 +139,7 @@ if __name__ == "__main__":
         job_id = create_sample_job(audio_path)
         enqueue_job_with_rq(job_id)
         print("\nJob enqueued. Start RQ worker with:")
-        print("  rq worker transcription --url redis://localhost:6379/0")
+        print("  rq worker transcription --url redis://localhost:6379/0 -w app.workers.worker.TranscriptionWorker")
     
     # Example 3: Check status of existing job
     elif len(sys.argv) > 1 and sys.argv[1] == "status":
@@ -513,9 +513,9 @@ def mock_openai_service(mock_openai_client):
     Provide a mock OpenAI service with patched client.
 
     Yields:
-        Mock: Patched OpenAI constructor
+        Mock: Client returned by the patched get_openai_client
     """
-    with patch("app.services.openai_service.OpenAI", return_value=mock_openai_client):
+    with patch("app.services.openai_service.get_openai_client", return_value=mock_openai_client):
         yield mock_openai_client
 
 
@@ -241,12 +241,11 @@ def mock_openai_transcribe():
     
     Returns a mock that can be configured per test.
     """
-    with patch('app.services.openai_service.OpenAI') as mock:
-        mock_client = MagicMock()
-        mock_client.audio.transcriptions.create.return_value = MagicMock(
-            text="This is a test transcription"
-        )
-        mock.return_value = mock_client
+    mock_client = MagicMock()
+    mock_client.audio.transcriptions.create.return_value = MagicMock(
+        text="This is a test transcription"
+    )
+    with patch('app.services.openai_service.get_openai_client', return_value=mock_client):
         yield mock_client
 
 
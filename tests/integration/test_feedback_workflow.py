@@ -145,7 +145,7 @@ class TestFeedbackListing:
         test_db.commit()
         
         response = test_client.get(
-            "/feedback",
+            "/feedback?count=true",
             headers={"X-API-Key": admin_api_key.key}
         )
         
@@ -156,6 +156,31 @@ class TestFeedbackListing:
         assert "total" in data
         assert data["total"] >= 2
     
+    def test_list_feedback_total_is_opt_in(self, test_client, admin_api_key, test_db):
+        """Test that total is only counted when count=true is passed."""
+        from app.models import Feedback
+        
+        test_db.add(Feedback(
+            job_id=1,
+            original_text="text",
+            corrected_text="TEXT",
+            status="pending",
+            created_by="user@example.com",
+            frequency=1
+        ))
+        test_db.commit()
+        
+        response = test_client.get(
+            "/feedback",
+            headers={"X-API-Key": admin_api_key.key}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["total"] is None
+        assert len(data["items"]) >= 1
+    
     def test_list_feedback_requires_admin_key(self, test_client, api_key):
         """Test that listing feedback requires admin privileges."""
         response = test_client.get(
@@ -316,7 +341,7 @@ class TestFeedbackListing:
         
         # Request first page with page_size=10
         response = test_client.get(
-            "/feedback?page=1&page_size=10",
+            "/feedback?page=1&page_size=10&count=true",
             headers={"X-API-Key": admin_api_key.key}
         )
         
@@ -325,8 +350,22 @@ class TestFeedbackListing:
         
         assert data["page"] == 1
         assert data["page_size"] == 10
-        assert len(data["items"]) <= 10
+        assert len(data["items"]) == 10
+        assert data["has_more"] is True
         assert data["total"] >= 15
+        
+        # The last page reports no further page
+        last_page = (data["total"] + 9) // 10
+        response = test_client.get(
+            f"/feedback?page={last_page}&page_size=10",
+            headers={"X-API-Key": admin_api_key.key}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert len(data["items"]) >= 1
+        assert data["has_more"] is False
 
 
 @pytest.mark.integration
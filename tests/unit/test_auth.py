@@ -11,10 +11,38 @@ Tests cover:
 import pytest
 
 pytestmark = [pytest.mark.unit, pytest.mark.auth]
-from unittest.mock import Mock, AsyncMock, MagicMock
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 from fastapi import HTTPException
 
+from passlib.hash import bcrypt
+
 from app.auth import get_api_key, get_admin_api_key
+from app.services.api_key_service import (
+    CACHE_INVALIDATION_CHANNEL,
+    clear_api_key_cache,
+    flush_api_key_usage,
+    hash_api_key,
+    invalidate_cached_api_key,
+    is_legacy_hash,
+    validate_and_get_api_key,
+    verify_api_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_api_key_cache():
+    """Keep cached validations from leaking between tests."""
+    clear_api_key_cache()
+    yield
+    clear_api_key_cache()
+
+
+@pytest.fixture(autouse=True)
+def redis_client():
+    """Redis client that invalidations are published to."""
+    client = Mock()
+    with patch("app.services.api_key_service.get_redis_client", return_value=client):
+        yield client
 
 
 class TestGetApiKey:
@@ -373,3 +401,125 @@ class TestEdgeCases:
             await get_admin_api_key(api_key=mock_api_key)
         
         assert exc_info.value.status_code == 403
+
+
+class TestApiKeyHashing:
+    """Test API key hashing and legacy hash verification."""
+    
+    def test_hash_is_deterministic_sha256(self):
+        """Test that hashing the same key twice yields the same hex digest."""
+        key_hash = hash_api_key("test-api-key-12345")
+        
+        assert key_hash == hash_api_key("test-api-key-12345")
+        assert len(key_hash) == 64
+        assert not is_legacy_hash(key_hash)
+    
+    def test_verify_sha256_hash(self):
+        """Test verification against a SHA-256 hash."""
+        key_hash = hash_api_key("test-api-key-12345")
+        
+        assert verify_api_key("test-api-key-12345", key_hash) is True
+        assert verify_api_key("wrong-key", key_hash) is False
+    
+    def test_verify_legacy_bcrypt_hash(self):
+        """Test that bcrypt hashes created before the switch still verify."""
+        legacy_hash = bcrypt.hash("test-api-key-12345")
+        
+        assert is_legacy_hash(legacy_hash)
+        assert verify_api_key("test-api-key-12345", legacy_hash) is True
+        assert verify_api_key("wrong-key", legacy_hash) is False
+
+
+class TestApiKeyValidationCache:
+    """Test the in-process cache of successful validations."""
+    
+    def _mock_db(self, api_key):
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = api_key
+        return db
+    
+    def test_cache_hit_skips_database(self, mock_api_key):
+        """Test that a repeated validation is served without querying."""
+        mock_api_key.key_hash = hash_api_key("test-api-key-12345")
+        mock_db_session = self._mock_db(mock_api_key)
+        
+        first = validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        mock_db_session.query.reset_mock()
+        second = validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        
+        assert first == mock_api_key
+        assert second.id == mock_api_key.id
+        mock_db_session.query.assert_not_called()
+    
+    def test_invalidate_evicts_entry(self, mock_api_key):
+        """Test that invalidating a key forces the next validation to query."""
+        mock_api_key.key_hash = hash_api_key("test-api-key-12345")
+        mock_db_session = self._mock_db(mock_api_key)
+        
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        invalidate_cached_api_key(mock_api_key.id)
+        mock_db_session.query.reset_mock()
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        
+        mock_db_session.query.assert_called()
+    
+    def test_invalidate_publishes_key_id(self, mock_api_key, redis_client):
+        """Test that invalidation is broadcast so other workers evict the key too."""
+        invalidate_cached_api_key(mock_api_key.id)
+        
+        redis_client.publish.assert_called_once_with(CACHE_INVALIDATION_CHANNEL, str(mock_api_key.id))
+    
+    def test_published_invalidation_evicts_entry(self, mock_api_key, redis_client):
+        """Test that the listener evicts keys invalidated by another process."""
+        import threading
+        from app.services.api_key_service import _listen_for_invalidations
+        
+        mock_api_key.key_hash = hash_api_key("test-api-key-12345")
+        mock_db_session = self._mock_db(mock_api_key)
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        
+        stop_event = threading.Event()
+        pubsub = redis_client.pubsub.return_value
+        
+        def get_message(timeout):
+            stop_event.set()
+            return {"data": str(mock_api_key.id)}
+        
+        pubsub.get_message.side_effect = get_message
+        with patch("app.services.api_key_service.clear_api_key_cache"):
+            _listen_for_invalidations(stop_event)
+        
+        pubsub.subscribe.assert_called_once_with(CACHE_INVALIDATION_CHANNEL)
+        mock_db_session.query.reset_mock()
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        mock_db_session.query.assert_called()
+    
+    def test_invalidation_survives_redis_outage(self, mock_api_key, redis_client):
+        """Test that a failed publish still evicts the local entry."""
+        import redis
+        
+        mock_api_key.key_hash = hash_api_key("test-api-key-12345")
+        mock_db_session = self._mock_db(mock_api_key)
+        redis_client.publish.side_effect = redis.ConnectionError("down")
+        
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        invalidate_cached_api_key(mock_api_key.id)
+        mock_db_session.query.reset_mock()
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        
+        mock_db_session.query.assert_called()
+
+    def test_usage_is_buffered_not_committed(self, mock_api_key):
+        """Test that validation buffers last_used_at instead of committing."""
+        flush_api_key_usage(Mock())  # drain usage buffered by earlier tests
+        mock_api_key.key_hash = hash_api_key("test-api-key-12345")
+        mock_db_session = self._mock_db(mock_api_key)
+        
+        validate_and_get_api_key(mock_db_session, "test-api-key-12345")
+        mock_db_session.commit.assert_not_called()
+        
+        flush_db = Mock()
+        assert flush_api_key_usage(flush_db) == 1
+        flush_db.execute.assert_called_once()
+        flush_db.commit.assert_called_once()
+        assert flush_api_key_usage(flush_db) == 0
@@ -14,14 +14,37 @@ pytestmark = pytest.mark.unit
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
+import orjson
+
 from app.services.lexicon_service import (
     validate_terms_for_import,
     import_terms_to_database,
     export_terms_from_database,
+    encode_terms_cursor,
+    decode_terms_cursor,
+    invalidate_lexicon_cache,
+    invalidate_all_lexicon_caches,
+    CACHE_KEY_LEXICON_INDEX,
+    CACHE_KEY_LEXICON_TERMS_PREFIX,
+    CACHE_INVALIDATION_CHANNEL,
+    clear_local_lexicon_cache,
+    load_lexicon,
+    load_lexicon_sync,
+    load_lexicons_sync,
 )
 from app.schemas.lexicons import SkippedTerm
 
 
+@pytest.fixture(autouse=True)
+def reset_local_lexicon_cache(monkeypatch):
+    """Keep in-process lexicon cache entries and breaker state from leaking between tests."""
+    monkeypatch.setattr("app.services.lexicon_service._cache_failures", 0)
+    monkeypatch.setattr("app.services.lexicon_service._cache_down_until", 0.0)
+    clear_local_lexicon_cache()
+    yield
+    clear_local_lexicon_cache()
+
+
 class TestValidateTermsForImport:
     """Test term validation logic for import operations."""
     
@@ -189,11 +212,12 @@ class TestImportTermsToDatabase:
             {"term": "MRI", "replacement": "Magnetic Resonance Imaging"},
             {"term": "CT", "replacement": "Computed Tomography"}
         ]
+        mock_db_session.execute.return_value.all.return_value = [(i,) for i in range(2)]
         
         result_count = import_terms_to_database(lexicon_id, terms, mock_db_session)
         
         assert result_count == 2
-        mock_db_session.bulk_save_objects.assert_called_once()
+        mock_db_session.execute.assert_called_once()
         mock_db_session.commit.assert_called_once()
     
     def test_import_with_persian_terms(self, mock_db_session):
@@ -203,6 +227,7 @@ class TestImportTermsToDatabase:
             {"term": "ام آر آی", "replacement": "MRI"},
             {"term": "سی تی", "replacement": "CT"}
         ]
+        mock_db_session.execute.return_value.all.return_value = [(i,) for i in range(2)]
         
         result_count = import_terms_to_database(lexicon_id, terms, mock_db_session)
         
@@ -217,8 +242,7 @@ class TestImportTermsToDatabase:
         result_count = import_terms_to_database(lexicon_id, terms, mock_db_session)
         
         assert result_count == 0
-        mock_db_session.bulk_save_objects.assert_called_once()
-        mock_db_session.commit.assert_called_once()
+        mock_db_session.execute.assert_not_called()
     
     def test_import_failure_rollback(self, mock_db_session):
         """Test that import failures trigger rollback."""
@@ -243,16 +267,14 @@ class TestImportTermsToDatabase:
             {"term": f"term_{i}", "replacement": f"replacement_{i}"}
             for i in range(1000)
         ]
+        mock_db_session.execute.return_value.all.return_value = [(i,) for i in range(1000)]
         
         result_count = import_terms_to_database(lexicon_id, terms, mock_db_session)
         
         assert result_count == 1000
-        mock_db_session.bulk_save_objects.assert_called_once()
-        
-        # Check that all terms were passed to bulk_save_objects
-        call_args = mock_db_session.bulk_save_objects.call_args
-        saved_objects = call_args[0][0]
-        assert len(saved_objects) == 1000
+        # All terms go out in a single executemany call
+        mock_db_session.execute.assert_called_once()
+        assert len(mock_db_session.execute.call_args[0][1]) == 1000
     
     def test_import_special_characters(self, mock_db_session):
         """Test importing terms with special characters."""
@@ -262,6 +284,7 @@ class TestImportTermsToDatabase:
             {"term": "A/B test", "replacement": "Split test"},
             {"term": "pH", "replacement": "Potential of Hydrogen"}
         ]
+        mock_db_session.execute.return_value.all.return_value = [(i,) for i in range(3)]
         
         result_count = import_terms_to_database(lexicon_id, terms, mock_db_session)
         
@@ -285,11 +308,9 @@ class TestExportTermsFromDatabase:
         term2.term = "CT"
         term2.replacement = "Computed Tomography"
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = [term1, term2]
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = [term1, term2]
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 2
         assert result[0] == {"term": "MRI", "replacement": "Magnetic Resonance Imaging"}
@@ -299,11 +320,9 @@ class TestExportTermsFromDatabase:
         """Test exporting from an empty lexicon."""
         lexicon_id = "empty-lexicon"
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = []
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = []
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 0
         assert result == []
@@ -321,11 +340,9 @@ class TestExportTermsFromDatabase:
         term2.term = "سی تی"
         term2.replacement = "CT"
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = [term1, term2]
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = [term1, term2]
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 2
         assert result[0]["term"] == "ام آر آی"
@@ -341,11 +358,9 @@ class TestExportTermsFromDatabase:
         active_term.term = "MRI"
         active_term.replacement = "Magnetic Resonance Imaging"
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = [active_term]
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = [active_term]
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 1
         assert result[0]["term"] == "MRI"
@@ -362,11 +377,9 @@ class TestExportTermsFromDatabase:
             term.replacement = f"replacement_{i}"
             terms.append(term)
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = terms
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = terms
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 1000
         assert result[0]["term"] == "term_0"
@@ -384,16 +397,394 @@ class TestExportTermsFromDatabase:
         term2.term = "A/B test"
         term2.replacement = "Split test"
         
-        mock_query = Mock()
-        mock_query.filter.return_value.order_by.return_value.all.return_value = [term1, term2]
-        mock_db_session.query.return_value = mock_query
+        mock_db_session.execute.return_value.yield_per.return_value = [term1, term2]
         
-        result = export_terms_from_database(lexicon_id, mock_db_session)
+        result = list(export_terms_from_database(lexicon_id, mock_db_session))
         
         assert len(result) == 2
         assert result[0]["term"] == "C++"
         assert result[1]["term"] == "A/B test"
 
+    @pytest.mark.parametrize("count", [0, 1, 1000, 2500])
+    def test_json_stream_batches_terms(self, count):
+        """Test that the JSON export yields one chunk per 1000 terms and matches json.dumps."""
+        import json
+        from app.utils.file_parsers import stream_json_export
+
+        terms = [{"term": f"term_{i}", "replacement": f"ترم_{i}"} for i in range(count)]
+
+        chunks = list(stream_json_export(iter(terms)))
+
+        assert "".join(chunks) == json.dumps(terms, indent=2, ensure_ascii=False)
+        assert len(chunks) == count // 1000 + 1
+
+
+class TestTermsCursor:
+    """Test opaque keyset cursor encoding for term pagination."""
+    
+    def test_cursor_round_trip(self):
+        """Test that an encoded cursor decodes to the same position."""
+        cursor = encode_terms_cursor(("atrial fibrillation", 42))
+        
+        assert decode_terms_cursor(cursor) == ("atrial fibrillation", 42)
+    
+    def test_cursor_round_trip_persian(self):
+        """Test cursor encoding with Persian terms."""
+        cursor = encode_terms_cursor(("سینوس", 7))
+        
+        assert decode_terms_cursor(cursor) == ("سینوس", 7)
+    
+    @pytest.mark.parametrize("token", ["not-a-cursor", "bm90IGpzb24=", "WyJhIiwiYiJd"])
+    def test_invalid_cursor_raises_value_error(self, token):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_terms_cursor(token)
+
+
+class TestLoadLexiconSync:
+    """Test Redis caching of lexicon term dictionaries."""
+    
+    def test_cache_hit_skips_database(self):
+        """Test that a cached dictionary is decoded without querying."""
+        cache = Mock()
+        cache.get.return_value = orjson.dumps({"ام آر آی": "MRI", "ct": "CT"})
+        db = Mock()
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            result = load_lexicon_sync("radiology", db)
+        
+        cache.get.assert_called_once_with(CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology")
+        db.execute.assert_not_called()
+        assert result == {"ام آر آی": "MRI", "ct": "CT"}
+    
+    def test_cache_miss_loads_and_stores_terms(self):
+        """Test that a miss reads the database and caches orjson bytes."""
+        cache = Mock()
+        cache.get.return_value = None
+        db = Mock()
+        db.execute.return_value.all.return_value = [("mri", "MRI")]
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            result = load_lexicon_sync("radiology", db)
+        
+        assert result == {"mri": "MRI"}
+        key, ttl, value = cache.pipeline.return_value.setex.call_args.args
+        assert key == CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology"
+        assert orjson.loads(value) == {"mri": "MRI"}
+    
+    def test_large_dictionary_stored_compressed(self):
+        """Test that large term dictionaries are written compressed and read back."""
+        from app.services.lexicon_service import _ZSTD_MAGIC
+        
+        terms = {f"term {i}": f"replacement {i}" for i in range(200)}
+        cache = Mock()
+        cache.get.return_value = None
+        db = Mock()
+        db.execute.return_value.all.return_value = list(terms.items())
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            load_lexicon_sync("radiology", db)
+            stored = cache.pipeline.return_value.setex.call_args.args[2]
+            clear_local_lexicon_cache()
+            cache.get.return_value = stored
+            result = load_lexicon_sync("radiology", db)
+        
+        assert stored.startswith(_ZSTD_MAGIC)
+        assert result == terms
+    
+    def test_local_cache_hit_skips_redis(self):
+        """Test that a repeat load in the same process doesn't touch Redis."""
+        cache = Mock()
+        cache.get.return_value = orjson.dumps({"mri": "MRI"})
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            load_lexicon_sync("radiology", Mock())
+            result = load_lexicon_sync("radiology", Mock())
+        
+        cache.get.assert_called_once()
+        assert result == {"mri": "MRI"}
+    
+    def test_repeat_loads_share_one_read_only_mapping(self):
+        """Test that callers get the same immutable mapping from the local cache."""
+        cache = Mock()
+        cache.get.return_value = orjson.dumps({"mri": "MRI"})
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            first = load_lexicon_sync("radiology", Mock())
+            second = load_lexicon_sync("radiology", Mock())
+        
+        assert first is second
+        with pytest.raises(TypeError):
+            first["ct"] = "CT"
+    
+    def test_invalidation_evicts_local_terms(self):
+        """Test that invalidating a lexicon drops its local term dictionary."""
+        cache = Mock()
+        cache.get.return_value = orjson.dumps({"mri": "MRI"})
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            load_lexicon_sync("radiology", Mock())
+            invalidate_lexicon_cache("radiology")
+            load_lexicon_sync("radiology", Mock())
+        
+        assert cache.get.call_count == 2
+    
+    def test_batch_load_uses_one_mget_and_one_query(self):
+        """Test that several lexicons are loaded in one MGET, query and pipeline."""
+        cache = Mock()
+        cache.mget.return_value = [orjson.dumps({"mri": "MRI"}), None, None]
+        db = Mock()
+        db.query.return_value.filter.return_value = [
+            ("cardiology", "ecg", "ECG"),
+            ("cardiology", "ekg", "ECG"),
+        ]
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            result = load_lexicons_sync(["radiology", "cardiology", "empty"], db)
+        
+        cache.mget.assert_called_once()
+        assert db.query.call_count == 1
+        assert result == {
+            "radiology": {"mri": "MRI"},
+            "cardiology": {"ecg": "ECG", "ekg": "ECG"},
+            "empty": {},
+        }
+        assert cache.pipeline.return_value.setex.call_count == 2
+        cache.pipeline.return_value.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_load_runs_sync_loader_off_event_loop(self):
+        """Test that the async loader reads the same entry from a worker thread."""
+        import threading
+        
+        threads = []
+        cache = Mock()
+        cache.get.side_effect = lambda key: (
+            threads.append(threading.current_thread()) or orjson.dumps({"mri": "MRI"})
+        )
+        db = Mock()
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            result = await load_lexicon("radiology", db)
+        
+        cache.get.assert_called_once_with(CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology")
+        assert len(threads) == 1 and threads[0] is not threading.main_thread()
+        db.execute.assert_not_called()
+        assert result == {"mri": "MRI"}
+    
+    def test_repeated_redis_errors_open_circuit_breaker(self):
+        """Test that Redis is skipped once consecutive failures reach the threshold."""
+        import redis
+        from app.services.lexicon_service import CACHE_FAILURE_THRESHOLD
+        
+        cache = Mock()
+        cache.get.side_effect = redis.ConnectionError("down")
+        cache.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        db = Mock()
+        db.execute.return_value.all.return_value = [("mri", "MRI")]
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            for _ in range(CACHE_FAILURE_THRESHOLD + 2):
+                clear_local_lexicon_cache()
+                result = load_lexicon_sync("radiology", db)
+        
+        assert result == {"mri": "MRI"}
+        assert cache.get.call_count + cache.pipeline.return_value.execute.call_count == CACHE_FAILURE_THRESHOLD
+        assert db.execute.call_count == CACHE_FAILURE_THRESHOLD + 2
+
+
+class TestLexiconCacheInvalidation:
+    """Test invalidation of cached lexicon term dictionaries."""
+    
+    def test_invalidation_evicts_local_entry_and_publishes(self):
+        """Test that invalidation clears the local entry and notifies other workers."""
+        cache = Mock()
+        cache.get.return_value = orjson.dumps({"mri": "MRI"})
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            load_lexicon_sync("radiology", Mock())
+            invalidate_lexicon_cache("radiology")
+            load_lexicon_sync("radiology", Mock())
+        
+        assert cache.get.call_count == 2
+        cache.pipeline.return_value.publish.assert_called_once_with(
+            CACHE_INVALIDATION_CHANNEL, "radiology"
+        )
+    
+    def test_invalidate_deletes_terms_key(self):
+        """Test that invalidation removes the lexicon's key in one pipeline."""
+        cache = Mock()
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            invalidate_lexicon_cache("radiology")
+        
+        cache.pipeline.return_value.delete.assert_called_once_with(
+            CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology"
+        )
+        cache.pipeline.return_value.srem.assert_called_once_with(
+            CACHE_KEY_LEXICON_INDEX, CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology"
+        )
+        cache.pipeline.return_value.execute.assert_called_once()
+    
+    def test_invalidate_all_uses_index_set_instead_of_scan(self):
+        """Test that bulk invalidation deletes the tracked keys without SCAN."""
+        cache = Mock()
+        cache.smembers.return_value = {CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology"}
+        
+        with patch("app.services.lexicon_service.get_redis_binary_client", return_value=cache):
+            invalidate_all_lexicon_caches()
+        
+        cache.scan_iter.assert_not_called()
+        cache.pipeline.return_value.delete.assert_called_once_with(
+            CACHE_KEY_LEXICON_TERMS_PREFIX + "radiology",
+            CACHE_KEY_LEXICON_INDEX
+        )
+    
+    def test_commit_invalidates_lexicons_changed_in_transaction(self):
+        """Test that flushed term changes invalidate their lexicon on commit."""
+        from app.models.lexicon import LexiconTerm
+        from app.services.lexicon_service import (
+            _collect_modified_lexicons,
+            _invalidate_modified_lexicons,
+        )
+        
+        session = Mock(info={}, dirty=[], deleted=[])
+        session.new = [LexiconTerm(lexicon_id="radiology"), LexiconTerm(lexicon_id="radiology")]
+        
+        with patch("app.services.lexicon_service.invalidate_lexicon_cache") as invalidate:
+            _collect_modified_lexicons(session, None)
+            _invalidate_modified_lexicons(session)
+        
+        invalidate.assert_called_once_with("radiology")
+        assert session.info == {}
+
+
+class TestCachePayloadEncoding:
+    """Test serialization of cached lexicon payloads."""
+    
+    def test_small_payload_stored_uncompressed(self):
+        """Test that small payloads are stored as plain JSON."""
+        from app.services.lexicon_service import _encode_cache_payload, _decode_cache_payload
+        
+        blob = _encode_cache_payload({"lexicon_id": "radiology"})
+        
+        assert blob.startswith(b"{")
+        assert _decode_cache_payload(blob) == {"lexicon_id": "radiology"}
+    
+    def test_large_payload_compressed_round_trip(self):
+        """Test that payloads over the threshold are compressed and restored."""
+        from app.services.lexicon_service import (
+            CACHE_COMPRESSION_THRESHOLD_BYTES,
+            _encode_cache_payload,
+            _decode_cache_payload,
+        )
+        
+        payload = [{"lexicon_id": f"lexicon-{i}", "term_count": i} for i in range(200)]
+        blob = _encode_cache_payload(payload)
+        
+        assert len(orjson.dumps(payload)) > CACHE_COMPRESSION_THRESHOLD_BYTES
+        assert len(blob) < len(orjson.dumps(payload))
+        assert _decode_cache_payload(blob) == payload
+
+
+class TestLexiconSummaryRefresh:
+    """Test debounced refresh of the lexicon_summary materialized view."""
+    
+    def test_refreshes_are_coalesced(self):
+        """Test that writes in quick succession schedule a single refresh."""
+        from app.services import lexicon_service
+        
+        engine = MagicMock()
+        with patch.object(lexicon_service, "_summary_refresh_lexicons", set()), \
+                patch("app.services.lexicon_service.threading.Timer") as timer:
+            lexicon_service._schedule_lexicon_summary_refresh(engine, {"radiology"})
+            lexicon_service._schedule_lexicon_summary_refresh(engine, {"cardiology"})
+            
+            timer.assert_called_once()
+            
+            with patch("app.services.lexicon_service.invalidate_lexicon_cache") as invalidate:
+                lexicon_service.refresh_lexicon_summary(engine)
+            
+            assert sorted(call.args[0] for call in invalidate.call_args_list) == ["cardiology", "radiology"]
+            lexicon_service._schedule_lexicon_summary_refresh(engine, {"radiology"})
+            assert timer.call_count == 2
+    
+    def test_refresh_does_not_invalidate_every_lexicon(self):
+        """Test that a refresh leaves lexicons nobody wrote to cached."""
+        from app.services import lexicon_service
+        
+        engine = MagicMock()
+        with patch.object(lexicon_service, "_summary_refresh_lexicons", set()), \
+                patch("app.services.lexicon_service.threading.Timer"), \
+                patch("app.services.lexicon_service.invalidate_all_lexicon_caches") as invalidate_all, \
+                patch("app.services.lexicon_service.invalidate_lexicon_cache") as invalidate:
+            lexicon_service._schedule_lexicon_summary_refresh(engine, {"radiology"})
+            lexicon_service.refresh_lexicon_summary(engine)
+        
+        invalidate_all.assert_not_called()
+        invalidate.assert_called_once_with("radiology")
+
+
+class TestActiveTermUniqueness:
+    """Test the partial unique index on active terms."""
+    
+    @pytest.fixture
+    def session(self):
+        """SQLite session with just the lexicon_terms table."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.dialects.postgresql import JSONB
+        from sqlalchemy.ext.compiler import compiles
+        from sqlalchemy.orm import sessionmaker
+        from app.models.lexicon import LexiconTerm
+        
+        @compiles(JSONB, "sqlite")
+        def compile_jsonb(type_, compiler, **kw):
+            return "JSON"
+        
+        engine = create_engine("sqlite://")
+        LexiconTerm.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+    
+    def test_deactivated_term_can_be_recreated(self, session):
+        """Test that a soft-deleted term doesn't block adding it again."""
+        from sqlalchemy.exc import IntegrityError
+        from app.models.lexicon import LexiconTerm
+        
+        term = LexiconTerm(lexicon_id="radiology", term="MRI", replacement="Magnetic Resonance Imaging")
+        session.add(term)
+        session.flush()
+        
+        session.add(LexiconTerm(lexicon_id="radiology", term=" mri ", replacement="MRI scan"))
+        with pytest.raises(IntegrityError):
+            session.flush()
+        session.rollback()
+        
+        term = LexiconTerm(lexicon_id="radiology", term="MRI", replacement="Magnetic Resonance Imaging")
+        session.add(term)
+        session.flush()
+        term.is_active = False
+        session.flush()
+        
+        session.add(LexiconTerm(lexicon_id="radiology", term="mri", replacement="MRI scan"))
+        session.flush()
+        
+        assert session.query(LexiconTerm).filter(LexiconTerm.is_active == True).count() == 1
+
+    @pytest.mark.parametrize("text", ["MRI", "  Ct Scan ", "\tMRI\n"])
+    def test_normalize_term_matches_generated_column(self, session, text):
+        """Test that normalize_term computes what the database generates."""
+        from app.models.lexicon import LexiconTerm, normalize_term
+
+        term = LexiconTerm(lexicon_id="radiology", term=text, replacement="x")
+        session.add(term)
+        session.flush()
+
+        stored = session.query(LexiconTerm.normalized_term).filter(LexiconTerm.id == term.id).scalar()
+        assert stored == normalize_term(text)
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
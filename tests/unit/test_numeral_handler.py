@@ -10,14 +10,18 @@ Tests cover:
 """
 
 import pytest
+from unittest.mock import Mock, patch
 
 pytestmark = [pytest.mark.unit, pytest.mark.numerals]
 from app.services.numeral_handler import (
+    get_lexicon_numeral_strategy,
+    invalidate_lexicon_strategy_cache,
     persian_to_english,
     english_to_persian,
     detect_medical_terms,
     is_position_in_medical_term,
     process_numerals,
+    process_numerals_batch,
     apply_english_strategy,
     apply_persian_strategy,
     apply_context_aware_strategy,
@@ -68,6 +72,62 @@ class TestBasicNumeralConversion:
         assert english_to_persian(english_text) == expected_persian
 
 
+class TestLexiconNumeralStrategy:
+    """Test loading and caching of lexicon numeral strategy overrides."""
+    
+    def setup_method(self):
+        invalidate_lexicon_strategy_cache()
+    
+    def test_strategy_loaded_once_for_all_lexicons(self):
+        """Test that one load serves repeat and other-lexicon lookups."""
+        with patch(
+            "app.services.lexicon_service.query_lexicon_numeral_strategies",
+            return_value={"radiology": "persian", "cardiology": "english"}
+        ) as query:
+            assert get_lexicon_numeral_strategy(Mock(), "radiology") == "persian"
+            assert get_lexicon_numeral_strategy(Mock(), "radiology") == "persian"
+            assert get_lexicon_numeral_strategy(Mock(), "cardiology") == "english"
+        
+        assert query.call_count == 1
+    
+    def test_missing_strategy_is_cached(self):
+        """Test that lexicons without an override don't re-query."""
+        with patch(
+            "app.services.lexicon_service.query_lexicon_numeral_strategies",
+            return_value={}
+        ) as query:
+            assert get_lexicon_numeral_strategy(Mock(), "radiology") is None
+            assert get_lexicon_numeral_strategy(Mock(), "radiology") is None
+        
+        assert query.call_count == 1
+    
+    def test_invalidation_forces_reload(self):
+        """Test that invalidating a lexicon drops its cached strategy."""
+        with patch(
+            "app.services.lexicon_service.query_lexicon_numeral_strategies",
+            return_value={"radiology": "persian"}
+        ) as query:
+            get_lexicon_numeral_strategy(Mock(), "radiology")
+            invalidate_lexicon_strategy_cache("radiology")
+            get_lexicon_numeral_strategy(Mock(), "radiology")
+        
+        assert query.call_count == 2
+    
+    def test_invalidation_message_forces_reload(self):
+        """Test that a lexicon invalidation from another process drops the strategy."""
+        from app.services.lexicon_service import _evict_local
+        
+        with patch(
+            "app.services.lexicon_service.query_lexicon_numeral_strategies",
+            return_value={"radiology": "persian"}
+        ) as query:
+            get_lexicon_numeral_strategy(Mock(), "radiology")
+            _evict_local("radiology")
+            get_lexicon_numeral_strategy(Mock(), "radiology")
+        
+        assert query.call_count == 2
+
+
 class TestMedicalTermDetection:
     """Test detection of medical terms with numerals."""
     
@@ -86,6 +146,13 @@ class TestMedicalTermDetection:
         assert len(medical_terms) == 1
         assert "L4-L5" in medical_terms[0][2]
     
+    def test_terms_matched_by_several_patterns_reported_once(self):
+        """Test that a code matching more than one pattern isn't duplicated."""
+        text = "درد در L4 و 5 عدد"
+        assert detect_medical_terms(text) == [(7, 9, "L4")]
+        result, _ = apply_context_aware_strategy(text)
+        assert result == "درد در L4 و ۵ عدد"
+    
     def test_detect_measurements(self):
         """Test detecting measurements with units."""
         text = "دوز 10mg با اندازه 5cm و عمق 3.5mm"
@@ -138,7 +205,7 @@ class TestEnglishStrategy:
         """Test text with already English numerals."""
         text = "بیمار 35 ساله"
         result, count = apply_english_strategy(text)
-        assert result == text
+        assert result is text
         assert count == 0
     
     def test_mixed_numerals(self):
@@ -184,6 +251,13 @@ class TestContextAwareStrategy:
         # L4-L5 should remain in English
         assert "L4-L5" in result
     
+    def test_text_without_digits_returned_unchanged(self):
+        """Test that digit-free text skips detection and conversion."""
+        text = "بیمار با درد مزمن"
+        result, count = apply_context_aware_strategy(text)
+        assert result is text
+        assert count == 0
+    
     def test_converts_standalone_numbers(self):
         """Test that standalone numbers convert to Persian."""
         text = "بیمار 35 ساله"
@@ -272,6 +346,36 @@ class TestProcessNumeralsMainFunction:
         assert result is None
 
 
+class TestProcessNumeralsBatch:
+    """Test process_numerals_batch against per-text processing."""
+    
+    def test_matches_per_text_processing(self):
+        """Test that each segment converts as it would on its own."""
+        texts = ["بیمار 35 ساله", "L4-L5", "T1", "dose 10mg", "۱۲۰ BP"]
+        for strategy in ("english", "persian", "preserve", "context_aware"):
+            expected = [process_numerals(text, strategy=strategy) for text in texts]
+            assert process_numerals_batch(texts, strategy=strategy) == expected
+    
+    def test_empty_and_none_texts_kept(self):
+        """Test that empty and None segments come back unchanged."""
+        result = process_numerals_batch(["", None, "بیمار 35"], strategy="persian")
+        assert result == ["", None, "بیمار ۳۵"]
+    
+    def test_text_containing_separator(self):
+        """Test that a segment containing the separator still round-trips."""
+        texts = ["a\x1f\x1f\x1f\x1f35", "12"]
+        assert process_numerals_batch(texts, strategy="persian") == ["a\x1f\x1f\x1f\x1f۳۵", "۱۲"]
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        assert process_numerals_batch([], strategy="english") == []
+    
+    def test_invalid_strategy(self):
+        """Test that an invalid strategy raises error."""
+        with pytest.raises(ValueError, match="Invalid numeral strategy"):
+            process_numerals_batch(["35"], strategy="invalid_strategy")
+
+
 class TestEdgeCases:
     """Test edge cases and complex scenarios."""
     
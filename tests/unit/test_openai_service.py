@@ -0,0 +1,283 @@
+"""
+Unit tests for the OpenAI Whisper service.
+
+Tests cover:
+- Retry policy for transient Whisper failures
+- Retry-After handling for rate-limited calls
+- Concurrent batch transcription and async client lifetime
+"""
+import pytest
+
+pytestmark = pytest.mark.unit
+import asyncio
+from email.utils import formatdate
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import openai
+
+from app.config.settings import get_settings
+from app.services import openai_service
+from app.services.openai_service import (
+    OpenAIAPIError,
+    OpenAIQuotaError,
+    transcribe_audio,
+    transcribe_audio_async,
+    transcribe_audio_batch,
+)
+
+settings = get_settings()
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/audio/transcriptions")
+
+
+def rate_limit_error(code="rate_limit_exceeded", headers=None):
+    """Build the RateLimitError the SDK raises for a 429 response."""
+    response = httpx.Response(429, headers=headers, request=_REQUEST)
+    return openai.RateLimitError("Rate limited", response=response, body={"code": code})
+
+
+def connection_error():
+    return openai.APIConnectionError(request=_REQUEST)
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """A small audio file on disk."""
+    path = tmp_path / "sample.mp3"
+    path.write_bytes(b"fake audio content")
+    return path
+
+
+@pytest.fixture
+def client():
+    """OpenAI client whose transcription call is scripted per test."""
+    client = Mock()
+    with patch("app.services.openai_service.get_openai_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def sleep():
+    """Record retry sleeps instead of waiting them out."""
+    with patch.object(openai_service._create_transcription.retry, "sleep") as sleep:
+        yield sleep
+
+
+class TestRetryPolicy:
+    """Test the tenacity retry policy around Whisper calls."""
+
+    def test_transient_error_then_success(self, audio_file, client, sleep):
+        """Test that a transient failure is retried and the retry's result returned."""
+        client.audio.transcriptions.create.side_effect = [connection_error(), Mock(text="Hello world")]
+
+        assert transcribe_audio(str(audio_file)) == "Hello world"
+        assert client.audio.transcriptions.create.call_count == 2
+        sleep.assert_called_once()
+
+    def test_retry_limit_exhausted(self, audio_file, client, sleep):
+        """Test that persistent transient failures stop after OPENAI_MAX_RETRIES retries."""
+        client.audio.transcriptions.create.side_effect = connection_error()
+
+        with pytest.raises(OpenAIAPIError):
+            transcribe_audio(str(audio_file))
+
+        assert client.audio.transcriptions.create.call_count == settings.OPENAI_MAX_RETRIES + 1
+        assert sleep.call_count == settings.OPENAI_MAX_RETRIES
+
+    def test_no_retry_on_non_transient_error(self, audio_file, client, sleep):
+        """Test that errors retrying can't fix are raised after one attempt."""
+        response = httpx.Response(401, request=_REQUEST)
+        client.audio.transcriptions.create.side_effect = openai.AuthenticationError(
+            "Invalid API key", response=response, body=None
+        )
+
+        with pytest.raises(OpenAIAPIError):
+            transcribe_audio(str(audio_file))
+
+        client.audio.transcriptions.create.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_rate_limit_retried(self, audio_file, client, sleep):
+        """Test that a plain rate limit 429 is retried."""
+        client.audio.transcriptions.create.side_effect = [rate_limit_error(), Mock(text="Hello world")]
+
+        assert transcribe_audio(str(audio_file)) == "Hello world"
+        assert client.audio.transcriptions.create.call_count == 2
+
+    def test_no_retry_when_quota_exhausted(self, audio_file, client, sleep):
+        """Test that an insufficient_quota 429 is raised without retrying."""
+        client.audio.transcriptions.create.side_effect = rate_limit_error(code="insufficient_quota")
+
+        with pytest.raises(OpenAIQuotaError):
+            transcribe_audio(str(audio_file))
+
+        client.audio.transcriptions.create.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_quota_code_read_from_wrapped_body(self):
+        """Test that quota exhaustion is detected when the code is only in body['error']."""
+        response = httpx.Response(429, request=_REQUEST)
+        error = openai.RateLimitError(
+            "Quota exceeded", response=response, body={"error": {"code": "insufficient_quota"}}
+        )
+
+        assert error.code is None
+        assert not openai_service._is_transient_error(error)
+
+
+class TestRetryAfterWait:
+    """Test how long a retry waits after a rate-limited call."""
+
+    @staticmethod
+    def wait_for(error, attempt_number=1):
+        retry_state = Mock(attempt_number=attempt_number)
+        retry_state.outcome.exception.return_value = error
+        with patch("app.services.openai_service.random.uniform", return_value=0.5):
+            return openai_service._retry_wait(retry_state)
+
+    def test_seconds(self):
+        """Test that a Retry-After in seconds is waited out, plus jitter."""
+        assert self.wait_for(rate_limit_error(headers={"retry-after": "7"})) == 7.5
+
+    def test_milliseconds_preferred(self):
+        """Test that retry-after-ms takes precedence over Retry-After."""
+        error = rate_limit_error(headers={"retry-after-ms": "1500", "retry-after": "7"})
+
+        assert self.wait_for(error) == 2.0
+
+    def test_http_date(self):
+        """Test that a Retry-After HTTP date is converted to a delay from now."""
+        error = rate_limit_error(headers={"retry-after": formatdate(time.time() + 10, usegmt=True)})
+
+        assert 8.5 <= self.wait_for(error) <= 10.5
+
+    def test_past_http_date_waits_only_jitter(self):
+        """Test that a date already passed doesn't give a negative wait."""
+        error = rate_limit_error(headers={"retry-after": formatdate(time.time() - 60, usegmt=True)})
+
+        assert self.wait_for(error) == 0.5
+
+    def test_clamped_to_max_delay(self):
+        """Test that a long Retry-After is capped at OPENAI_RETRY_MAX_DELAY."""
+        error = rate_limit_error(headers={"retry-after": "86400"})
+
+        assert self.wait_for(error) == settings.OPENAI_RETRY_MAX_DELAY
+
+    def test_negative_seconds_clamped_to_zero(self):
+        """Test that a negative Retry-After doesn't give a negative wait."""
+        assert self.wait_for(rate_limit_error(headers={"retry-after": "-5"})) == 0.5
+
+    @pytest.mark.parametrize("headers", [None, {"retry-after": ""}])
+    def test_missing_header_falls_back_to_backoff(self, headers):
+        """Test that without Retry-After the exponential backoff is used."""
+        wait = self.wait_for(rate_limit_error(headers=headers))
+
+        assert 0 <= wait <= settings.OPENAI_RETRY_MAX_DELAY
+
+    @pytest.mark.parametrize("value", ["soon", "nan", "inf"])
+    def test_garbage_value_ignored(self, value):
+        """Test that unparseable values fall back to the backoff instead of raising."""
+        error = rate_limit_error(headers={"retry-after": value})
+
+        assert openai_service._retry_after_seconds(error) is None
+        assert 0 <= self.wait_for(error) <= settings.OPENAI_RETRY_MAX_DELAY
+
+    def test_error_without_response(self):
+        """Test that connection errors, which have no response, use the backoff."""
+        assert openai_service._retry_after_seconds(connection_error()) is None
+
+
+@pytest.fixture
+def async_client():
+    """AsyncOpenAI client whose uploads finish in reverse order of their start."""
+    client = MagicMock()
+    client.__aenter__.return_value = client
+    client.in_flight = client.max_in_flight = 0
+
+    async def create(file, **kwargs):
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        name = file.name.rsplit("/", 1)[-1]
+        await asyncio.sleep(0.05 / int(name.split(".")[0]))
+        client.in_flight -= 1
+        return Mock(text=name)
+
+    client.audio.transcriptions.create.side_effect = create
+    with patch("app.services.openai_service.create_async_openai_client", return_value=client):
+        yield client
+
+
+class TestTranscribeAudioBatch:
+    """Test concurrent transcription of several files."""
+
+    @pytest.fixture
+    def audio_files(self, tmp_path):
+        paths = []
+        for i in range(1, 7):
+            path = tmp_path / f"{i}.mp3"
+            path.write_bytes(b"fake audio content")
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, audio_files, async_client):
+        """Test that no more than OPENAI_MAX_CONCURRENCY uploads run at once."""
+        with patch.object(settings, "OPENAI_MAX_CONCURRENCY", 2):
+            await transcribe_audio_batch(audio_files)
+
+        assert async_client.max_in_flight == 2
+        assert async_client.audio.transcriptions.create.call_count == len(audio_files)
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, audio_files, async_client):
+        """Test that results follow the input order, not completion order."""
+        results = await transcribe_audio_batch(audio_files)
+
+        assert results == [f"{i}.mp3" for i in range(1, 7)]
+
+    @pytest.mark.asyncio
+    async def test_failures_returned_in_place(self, audio_files, async_client):
+        """Test that one file failing doesn't fail the others."""
+        audio_files[2] = audio_files[2] + ".missing"
+
+        results = await transcribe_audio_batch(audio_files)
+
+        assert isinstance(results[2], FileNotFoundError)
+        assert results[:2] == ["1.mp3", "2.mp3"]
+        assert results[3:] == ["4.mp3", "5.mp3", "6.mp3"]
+
+    @pytest.mark.asyncio
+    async def test_one_client_shared_and_closed(self, audio_files, async_client):
+        """Test that the batch opens a single client and closes it when done."""
+        with patch("app.services.openai_service.create_async_openai_client",
+                   return_value=async_client) as create_client:
+            await transcribe_audio_batch(audio_files)
+
+        create_client.assert_called_once_with()
+        async_client.__aexit__.assert_awaited_once()
+
+
+class TestTranscribeAudioAsync:
+    """Test the async client lifetime for single transcriptions."""
+
+    @pytest.fixture
+    def audio_file(self, tmp_path):
+        path = tmp_path / "1.mp3"
+        path.write_bytes(b"fake audio content")
+        return str(path)
+
+    @pytest.mark.asyncio
+    async def test_own_client_closed_after_call(self, audio_file, async_client):
+        """Test that a client created for the call is closed afterwards."""
+        assert await transcribe_audio_async(audio_file) == "1.mp3"
+        async_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_caller_client_left_open(self, audio_file, async_client):
+        """Test that a client passed in is reused and not closed."""
+        with patch("app.services.openai_service.create_async_openai_client") as create_client:
+            await transcribe_audio_async(audio_file, client=async_client)
+
+        create_client.assert_not_called()
+        async_client.__aexit__.assert_not_awaited()
@@ -202,6 +202,36 @@ class TestLongestMatchFirst:
         assert "MRI" in result
         assert "CT" in result
 
+    
+    def test_single_pass_reports_original_positions(self):
+        """Test that match positions refer to the input text."""
+        lexicon = {"mri": "magnetic resonance imaging", "ct": "CT"}
+        text = "mri then ct"
+        result, metrics = apply_lexicon_corrections(
+            text, lexicon, enable_fuzzy_matching=False, return_metrics=True
+        )
+        
+        assert result == "magnetic resonance imaging then CT"
+        details = {d['term']: d['positions'] for d in metrics['replacement_details']}
+        assert details == {"mri": [(0, 3)], "ct": [(9, 11)]}
+    
+    def test_shared_lexicon_compiled_once(self):
+        """Test that read-only lexicons from the loaders reuse their compiled pattern."""
+        from types import MappingProxyType
+        from app.services import postprocessing_service
+        
+        lexicon = MappingProxyType({"mri": "MRI"})
+        with patch.object(
+            postprocessing_service,
+            "_compile_lexicon",
+            wraps=postprocessing_service._compile_lexicon
+        ) as compile_lexicon:
+            apply_lexicon_corrections("an mri", lexicon, enable_fuzzy_matching=False)
+            result, _ = apply_lexicon_corrections("an mri", lexicon, enable_fuzzy_matching=False)
+        
+        assert compile_lexicon.call_count == 1
+        assert result == "an MRI"
+
 
 class TestPersianText:
     """Test Persian/Farsi text handling."""
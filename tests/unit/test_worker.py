@@ -0,0 +1,46 @@
+"""
+Unit tests for the transcription RQ worker class.
+
+Tests cover:
+- Jobs run in the worker process (no fork per job)
+- The lexicon invalidation listener runs for the worker's lifetime
+"""
+
+import pytest
+from unittest.mock import patch
+
+from rq import SimpleWorker
+
+pytestmark = pytest.mark.unit
+from app.workers.worker import TranscriptionWorker
+
+
+class TestTranscriptionWorker:
+    """Test TranscriptionWorker."""
+
+    def test_does_not_fork_per_job(self):
+        """Test that jobs run in-process, so local caches survive between jobs."""
+        assert issubclass(TranscriptionWorker, SimpleWorker)
+
+    def test_listener_runs_while_working(self):
+        """Test that the invalidation listener is started and stopped with work()."""
+        worker = TranscriptionWorker.__new__(TranscriptionWorker)
+
+        with patch("app.workers.worker.start_lexicon_invalidation_listener") as start, \
+                patch.object(SimpleWorker, "work", return_value=True) as work:
+            assert worker.work(burst=True) is True
+
+        start.assert_called_once_with()
+        work.assert_called_once_with(burst=True)
+        start.return_value.set.assert_called_once_with()
+
+    def test_listener_stopped_when_work_fails(self):
+        """Test that the listener is stopped even if work() raises."""
+        worker = TranscriptionWorker.__new__(TranscriptionWorker)
+
+        with patch("app.workers.worker.start_lexicon_invalidation_listener") as start, \
+                patch.object(SimpleWorker, "work", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                worker.work()
+
+        start.return_value.set.assert_called_once_with()